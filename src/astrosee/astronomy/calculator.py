@@ -2,6 +2,7 @@
 
 import logging
 import math
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -14,6 +15,12 @@ from astrosee.astronomy.models import AstronomyData, CelestialObject, Location,
 logger = logging.getLogger(__name__)
 
 
+def _pickering_airmass(altitude: float) -> float:
+    """Airmass for an altitude above the horizon (Pickering 2002)."""
+    arg = altitude + 244 / (165 + 47 * altitude**1.1)
+    return max(1.0, 1 / math.sin(math.radians(arg)))
+
+
 class AstronomyCalculator:
     """Calculator for astronomical data using Skyfield."""
 
@@ -71,6 +78,31 @@ class AstronomyCalculator:
             dt = dt.replace(tzinfo=timezone.utc)
         return self.ts.from_datetime(dt)
 
+    def _datetimes_to_skyfield(self, times: Sequence[datetime]) -> Time:
+        """Convert a sequence of datetimes to a single vector Skyfield Time."""
+        return self.ts.from_datetimes([
+            dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+            for dt in times
+        ])
+
+    def _get_altaz_batch(
+        self, body, location: Location, t: Time
+    ) -> tuple[list[float], list[float]]:
+        """Get altitudes and azimuths of a body over a vector Time.
+
+        Args:
+            body: Skyfield body (ephemeris segment or Star)
+            location: Observer location
+            t: Vector Skyfield Time
+
+        Returns:
+            Tuple of (altitudes, azimuths) lists in degrees
+        """
+        earth_observer = self._earth + self._get_observer(location)
+        apparent = earth_observer.at(t).observe(body).apparent()
+        alt, az, _ = apparent.altaz()
+        return alt.degrees.tolist(), az.degrees.tolist()
+
     def get_moon_illumination(self, time: datetime) -> float:
         """Get Moon illumination percentage.
 
@@ -169,12 +201,23 @@ class AstronomyCalculator:
         if altitude <= 0:
             return float("inf")
 
-        # Pickering (2002) formula
-        alt_rad = math.radians(altitude)
-        arg = altitude + 244 / (165 + 47 * altitude**1.1)
-        airmass = 1 / math.sin(math.radians(arg))
+        return _pickering_airmass(altitude)
 
-        return max(1.0, airmass)
+    def get_airmasses(self, altitudes: Sequence[float]) -> list[float]:
+        """Calculate airmass for many altitudes at once.
+
+        Same Pickering (2002) values as get_airmass.
+
+        Args:
+            altitudes: Object altitudes in degrees
+
+        Returns:
+            Airmass per altitude, in input order
+        """
+        inf = float("inf")
+        return [
+            _pickering_airmass(altitude) if altitude > 0 else inf for altitude in altitudes
+        ]
 
     def get_sun_altitude(self, location: Location, time: datetime) -> float:
         """Get Sun altitude.
@@ -218,6 +261,27 @@ class AstronomyCalculator:
 
         return alt.degrees, az.degrees
 
+    def get_moon_positions(
+        self, location: Location, times: Sequence[datetime]
+    ) -> tuple[list[float], list[float]]:
+        """Get Moon altitudes and azimuths at many times.
+
+        Same values as calling get_moon_position per time, computed over a
+        single vector Skyfield Time.
+
+        Args:
+            location: Observer location
+            times: Times of observation
+
+        Returns:
+            Tuple of (altitudes, azimuths) lists in degrees, in input order
+        """
+        if not times:
+            return [], []
+
+        self._load_ephemeris()
+        return self._get_altaz_batch(self._moon, location, self._datetimes_to_skyfield(times))
+
     def get_planet_position(
         self, planet_name: str, location: Location, time: datetime
     ) -> tuple[float, float] | None:
@@ -276,6 +340,53 @@ class AstronomyCalculator:
             sun_altitude=sun_alt,
         )
 
+    def get_astronomy_data_batch(
+        self, location: Location, times: Sequence[datetime]
+    ) -> list[AstronomyData]:
+        """Get astronomy data for many times in one ephemeris pass.
+
+        Same values as calling get_astronomy_data per time, but the Sun and
+        Moon positions are computed over a single vector Skyfield Time.
+
+        Args:
+            location: Observer location
+            times: Times for calculations
+
+        Returns:
+            AstronomyData per time, in input order
+        """
+        if not times:
+            return []
+
+        self._load_ephemeris()
+        t = self._datetimes_to_skyfield(times)
+
+        # Moon illumination from the geocentric Sun-Moon elongation
+        earth_at = self._earth.at(t)
+        _, sun_lon, _ = earth_at.observe(self._sun).apparent().ecliptic_latlon()
+        _, moon_lon, _ = earth_at.observe(self._moon).apparent().ecliptic_latlon()
+        phase_angles = ((moon_lon.degrees - sun_lon.degrees) % 360).tolist()
+
+        moon_alts, moon_azs = self._get_altaz_batch(self._moon, location, t)
+        sun_alts, _ = self._get_altaz_batch(self._sun, location, t)
+
+        results = []
+        for phase_angle, moon_alt, moon_az, sun_alt in zip(
+            phase_angles, moon_alts, moon_azs, sun_alts
+        ):
+            moon_illumination = (1 - math.cos(math.radians(phase_angle))) / 2 * 100
+            results.append(
+                AstronomyData(
+                    moon_illumination=moon_illumination,
+                    moon_altitude=moon_alt,
+                    moon_azimuth=moon_az,
+                    moon_phase=self.get_moon_phase_name(moon_illumination),
+                    sun_altitude=sun_alt,
+                )
+            )
+
+        return results
+
     def get_target_position(
         self,
         obj: CelestialObject,
@@ -317,6 +428,56 @@ class AstronomyCalculator:
             is_visible=is_visible,
         )
 
+    def get_target_positions(
+        self,
+        obj: CelestialObject,
+        location: Location,
+        times: Sequence[datetime],
+    ) -> list[TargetPosition]:
+        """Get position information for a celestial object at many times.
+
+        Same values as calling get_target_position per time, computed over a
+        single vector Skyfield Time.
+
+        Args:
+            obj: Celestial object
+            location: Observer location
+            times: Times for calculations
+
+        Returns:
+            TargetPosition per time, in input order
+        """
+        if not times:
+            return []
+
+        self._load_ephemeris()
+        t = self._datetimes_to_skyfield(times)
+
+        # Same body selection as get_target_position
+        planet = self._planets.get(obj.name.lower())
+        if obj.object_type.value == "moon" or obj.name.lower() == "moon":
+            body = self._moon
+        elif obj.object_type.value == "planet" and planet is not None:
+            body = planet
+        else:
+            from skyfield.api import Star
+
+            body = Star(ra_hours=obj.ra / 15, dec_degrees=obj.dec)
+
+        alts, azs = self._get_altaz_batch(body, location, t)
+        airmasses = self.get_airmasses(alts)
+
+        return [
+            TargetPosition(
+                object=obj,
+                altitude=alt,
+                azimuth=az,
+                airmass=airmass,
+                is_visible=alt > 0,
+            )
+            for alt, az, airmass in zip(alts, azs, airmasses)
+        ]
+
     def is_astronomical_night(self, location: Location, time: datetime) -> bool:
         """Check if it's astronomical night (sun below -18 degrees).
 
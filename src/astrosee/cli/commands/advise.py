@@ -10,7 +10,7 @@ from rich.table import Table
 from astrosee.cli.context import CliContext
 from astrosee.core.exceptions import AstroseeError
 from astrosee.display.formatters import format_score_bar
-from astrosee.services.advisor import AdvisorService
+from astrosee.services.advisor import AdvisorService, SuggestionPriority
 
 
 pass_context = click.make_pass_decorator(CliContext)
@@ -185,9 +185,9 @@ def _render_suggestions(ctx: CliContext, suggestions):
 
     console.print("[bold]📝 Equipment Suggestions:[/]")
     for sug in suggestions:
-        if sug.priority == "high":
+        if sug.priority == SuggestionPriority.HIGH:
             console.print(f"  {sug.icon} [bold]{sug.text}[/]")
-        elif sug.priority == "medium":
+        elif sug.priority == SuggestionPriority.MEDIUM:
             console.print(f"  {sug.icon} {sug.text}")
         else:
             console.print(f"  {sug.icon} [dim]{sug.text}[/]")
@@ -13,6 +13,7 @@ from astrosee.services.forecast import ForecastService
 from astrosee.services.seeing import SeeingService
 from astrosee.storage.cache import CacheManager
 from astrosee.storage.config import ConfigManager
+from astrosee.weather.http import close_shared_client
 from astrosee.weather.noaa_gfs import NoaaGfsClient
 from astrosee.weather.openmeteo import OpenMeteoClient
 
@@ -89,3 +90,5 @@ class CliContext:
             await self._seeing_service.close()
         if self._cache:
             await self._cache.close()
+        # Each command runs its own event loop, so its HTTP client goes too
+        await close_shared_client()
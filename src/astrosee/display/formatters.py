@@ -1,7 +1,18 @@
 """Formatting utilities for display."""
 
+from bisect import bisect_right
 from datetime import datetime
 
+from rich.style import Style
+from rich.text import Text
+
+# Score bands: a score belongs to band bisect_right(_SCORE_THRESHOLDS, score),
+# i.e. each threshold is the inclusive lower bound of the next band.
+_SCORE_THRESHOLDS = (25, 40, 55, 70, 85)
+_SCORE_COLORS = ("bright_red", "red", "orange1", "yellow", "green", "bright_green")
+_SCORE_RATINGS = ("BAD", "POOR", "FAIR", "GOOD", "VERY GOOD", "EXCELLENT")
+_SCORE_STYLES = tuple(Style(color=color) for color in _SCORE_COLORS)
+
 
 def format_score(score: float) -> str:
     """Format score with color markup for Rich.
@@ -16,6 +27,20 @@ def format_score(score: float) -> str:
     return f"[{color}]{score:.0f}[/{color}]"
 
 
+def format_score_text(score: float) -> Text:
+    """Format score as a styled Text for table cells.
+
+    Unlike format_score, the result needs no markup parsing when rendered.
+
+    Args:
+        score: Score value 0-100
+
+    Returns:
+        Styled Rich Text
+    """
+    return Text(f"{score:.0f}", style=get_score_style(score))
+
+
 def get_score_color(score: float) -> str:
     """Get Rich color for score value.
 
@@ -25,18 +50,22 @@ def get_score_color(score: float) -> str:
     Returns:
         Rich color name
     """
-    if score >= 85:
-        return "bright_green"
-    elif score >= 70:
-        return "green"
-    elif score >= 55:
-        return "yellow"
-    elif score >= 40:
-        return "orange1"
-    elif score >= 25:
-        return "red"
-    else:
-        return "bright_red"
+    return _SCORE_COLORS[bisect_right(_SCORE_THRESHOLDS, score)]
+
+
+def get_score_style(score: float) -> Style:
+    """Get a Rich style for score value.
+
+    The style object is shared per score band, so table cells styled with it
+    reuse Rich's parsed style instead of re-parsing color markup.
+
+    Args:
+        score: Score value 0-100
+
+    Returns:
+        Rich style
+    """
+    return _SCORE_STYLES[bisect_right(_SCORE_THRESHOLDS, score)]
 
 
 def format_score_bar(score: float, width: int = 10) -> str:
@@ -49,6 +78,28 @@ def format_score_bar(score: float, width: int = 10) -> str:
     Returns:
         Unicode progress bar string
     """
+    if width == _BAR_WIDTH and 0 <= score <= 100:
+        # The bar only depends on the integer part of the score
+        return _SCORE_BARS[int(score)]
+    return _build_score_bar(score, width)
+
+
+def format_score_bar_text(score: float, width: int = 10) -> Text:
+    """Format score as a styled progress bar Text for table cells.
+
+    Args:
+        score: Score value 0-100
+        width: Bar width in characters
+
+    Returns:
+        Styled Rich Text bar
+    """
+    if width == _BAR_WIDTH and 0 <= score <= 100:
+        return _SCORE_BAR_TEXTS[int(score)]
+    return _build_score_bar_text(score, width)
+
+
+def _build_score_bar(score: float, width: int) -> str:
     filled = int(score / 100 * width)
     empty = width - filled
     color = get_score_color(score)
@@ -57,6 +108,17 @@ def format_score_bar(score: float, width: int = 10) -> str:
     return f"[{color}]{bar}[/{color}]"
 
 
+def _build_score_bar_text(score: float, width: int) -> Text:
+    filled = int(score / 100 * width)
+    return Text("█" * filled + "░" * (width - filled), style=get_score_style(score))
+
+
+# Pre-rendered default-width bars for every integer score
+_BAR_WIDTH = 10
+_SCORE_BARS = tuple(_build_score_bar(i, _BAR_WIDTH) for i in range(101))
+_SCORE_BAR_TEXTS = tuple(_build_score_bar_text(i, _BAR_WIDTH) for i in range(101))
+
+
 def format_rating(score: float) -> str:
     """Get rating text for score.
 
@@ -66,18 +128,7 @@ def format_rating(score: float) -> str:
     Returns:
         Rating string
     """
-    if score >= 85:
-        return "EXCELLENT"
-    elif score >= 70:
-        return "VERY GOOD"
-    elif score >= 55:
-        return "GOOD"
-    elif score >= 40:
-        return "FAIR"
-    elif score >= 25:
-        return "POOR"
-    else:
-        return "BAD"
+    return _SCORE_RATINGS[bisect_right(_SCORE_THRESHOLDS, score)]
 
 
 def format_timestamp(dt: datetime, include_date: bool = True) -> str:
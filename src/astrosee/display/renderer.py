@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -18,20 +18,105 @@ from astrosee.display.formatters import (
     format_rating,
     format_score,
     format_score_bar,
+    format_score_bar_text,
+    format_score_text,
     format_temperature,
     format_time_short,
     format_timestamp,
     format_wind,
     get_score_color,
+    get_score_style,
 )
+from astrosee.scoring.engine import ScoringEngine
 from astrosee.scoring.models import (
     LocationComparison,
     ObservingWindow,
     SeeingForecast,
     SeeingReport,
+    TargetVisibility,
+)
+
+# Display names for score components
+_COMPONENT_NAMES = {
+    "temperature_differential": "Temperature Stability",
+    "wind_stability": "Wind Conditions",
+    "humidity": "Humidity",
+    "cloud_cover": "Cloud Cover",
+    "jet_stream": "Jet Stream",
+}
+_COMPONENT_ROW_LABELS = {key: f"├─ {name}" for key, name in _COMPONENT_NAMES.items()}
+
+# Prebuilt cells reused across table rows. Rating thresholds are whole numbers,
+# so one styled Text per integer score covers every rating/color pair.
+_RATING_TEXTS = tuple(
+    Text(format_rating(bucket), style=get_score_style(bucket)) for bucket in range(101)
+)
+# Day/night markers carry their own centering so the emoji cells are laid out
+# identically wherever they are reused.
+_NIGHT_CELL = Text("🌙", justify="center")
+_DAY_CELL = Text("☀️", justify="center")
+
+
+# Static header line and fixed table layouts, defined once at import
+_REPORT_TITLE = Text("ASTRONOMICAL SEEING FORECAST", style="bold")
+
+_BREAKDOWN_COLUMNS = (
+    ("Component", {"style": "cyan"}),
+    ("Score", {"justify": "right"}),
+    ("Bar", {"width": 12}),
+)
+_WEATHER_COLUMNS = (
+    ("Label", {"style": "dim"}),
+    ("Value", {}),
+)
+_FORECAST_COLUMNS = (
+    ("Time", {"style": "cyan"}),
+    ("Score", {"justify": "right"}),
+    ("Quality", {}),
+    ("Clouds", {"justify": "right"}),
+    ("Wind", {"justify": "right"}),
+    ("Night", {"justify": "center"}),
+)
+_DAILY_COLUMNS = (
+    ("Date", {"style": "cyan"}),
+    ("Score", {"justify": "right"}),
+    ("Summary", {}),
+)
+_COMPARISON_COLUMNS = (
+    ("Location", {"style": "cyan"}),
+    ("Score", {"justify": "right"}),
+    ("Quality", {}),
+    ("Clouds", {"justify": "right"}),
+    ("Wind", {"justify": "right"}),
+)
+_VISIBILITY_COLUMNS = (
+    ("Time", {"style": "cyan"}),
+    ("Alt", {"justify": "right"}),
+    ("Airmass", {"justify": "right"}),
+    ("Score", {"justify": "right"}),
+    ("Night", {"justify": "center"}),
 )
 
 
+# Qualitative labels indexed by how many thresholds a value reaches
+_STABILITY_LABELS = ("unstable", "stable")
+_SHEAR_LABELS = ("low", "moderate", "high")
+_JET_LABELS = ("calm", "moderate", "strong")
+
+
+def _build_table(title: str, columns: tuple, **kwargs) -> Table:
+    """Create a table with one of the fixed column layouts."""
+    table = Table(title=title, **kwargs)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
+
+
+def _rating_text(score: float) -> Text:
+    """Get the prebuilt styled rating cell for a score."""
+    return _RATING_TEXTS[max(0, min(100, int(score)))]
+
+
 class DisplayRenderer:
     """Renders seeing data to the terminal using Rich."""
 
@@ -42,6 +127,7 @@ class DisplayRenderer:
             console: Rich console (creates one if not provided)
         """
         self.console = console or Console()
+        self._engine = ScoringEngine()
 
     def render_current_conditions(self, report: SeeingReport) -> None:
         """Render current seeing conditions.
@@ -50,13 +136,19 @@ class DisplayRenderer:
             report: SeeingReport to display
         """
         # Header
+        location = report.location
+        coords = format_coordinates(location.latitude, location.longitude)
         header = Panel(
-            f"[bold]ASTRONOMICAL SEEING FORECAST[/bold]\n"
-            f"{report.location.name} ({format_coordinates(report.location.latitude, report.location.longitude)})\n"
-            f"{format_timestamp(report.timestamp)}",
+            Text.assemble(
+                _REPORT_TITLE,
+                "\n",
+                Text.from_markup(
+                    f"{location.name} ({coords})\n"
+                    f"{format_timestamp(report.timestamp)}"
+                ),
+            ),
             style="blue",
         )
-        self.console.print(header)
 
         # Overall score
         score = report.score
@@ -68,68 +160,65 @@ class DisplayRenderer:
             title="Overall Score",
             border_style=score_color,
         )
-        self.console.print(score_panel)
 
-        # Component breakdown
-        self._render_component_breakdown(score.component_scores)
-
-        # Weather details
-        self._render_weather_details(report)
-
-        # Moon info
-        self._render_moon_info(report)
+        # Assemble every section first and print once, so Rich measures and
+        # writes the whole report in a single pass.
+        renderables: list[RenderableType] = [
+            header,
+            score_panel,
+            self._build_component_breakdown(score.component_scores),
+            "",
+            self._build_weather_details(report),
+            "",
+            self._build_moon_info(report),
+            "",
+        ]
 
         # Target info if available
         if report.target:
-            self._render_target_info(report)
-
-        # Recommendations
-        self._render_recommendations(report)
-
-    def _render_component_breakdown(self, components: dict[str, float]) -> None:
-        """Render component score breakdown."""
-        table = Table(title="Conditions Breakdown", show_header=False, box=None)
-        table.add_column("Component", style="cyan")
-        table.add_column("Score", justify="right")
-        table.add_column("Bar", width=12)
-
-        component_names = {
-            "temperature_differential": "Temperature Stability",
-            "wind_stability": "Wind Conditions",
-            "humidity": "Humidity",
-            "cloud_cover": "Cloud Cover",
-            "jet_stream": "Jet Stream",
-        }
+            target_panel = self._build_target_info(report)
+            if target_panel is not None:
+                renderables.append(target_panel)
+
+        renderables.append(self._build_recommendations(report))
+
+        self.console.print(Group(*renderables))
+
+    def _build_component_breakdown(self, components: dict[str, float]) -> Table:
+        """Build component score breakdown table."""
+        table = _build_table(
+            "Conditions Breakdown", _BREAKDOWN_COLUMNS, show_header=False, box=None
+        )
 
         for key, value in components.items():
-            name = component_names.get(key, key.replace("_", " ").title())
+            label = _COMPONENT_ROW_LABELS.get(key) or f"├─ {key.replace('_', ' ').title()}"
             table.add_row(
-                f"├─ {name}",
-                format_score(value),
-                format_score_bar(value),
+                label,
+                format_score_text(value),
+                format_score_bar_text(value),
             )
 
-        self.console.print(table)
-        self.console.print()
+        return table
 
-    def _render_weather_details(self, report: SeeingReport) -> None:
-        """Render weather details."""
+    def _build_weather_details(self, report: SeeingReport) -> Table:
+        """Build weather details table."""
         w = report.weather
 
-        table = Table(title="Atmospheric Details", show_header=False, box=None)
-        table.add_column("Label", style="dim")
-        table.add_column("Value")
+        table = _build_table(
+            "Atmospheric Details", _WEATHER_COLUMNS, show_header=False, box=None
+        )
 
+        temp_diff = w.temperature_differential
         table.add_row(
             "├─ Temp differential:",
-            f"{w.temperature_differential:.1f}°C "
-            f"({'stable' if w.temperature_differential > 5 else 'unstable'})",
+            f"{temp_diff:.1f}°C ({_STABILITY_LABELS[temp_diff > 5]})",
         )
 
-        if w.wind_shear is not None:
+        shear = w.wind_shear
+        if shear is not None:
             table.add_row(
                 "├─ Wind shear:",
-                f"{w.wind_shear:.1f} m/s ({'low' if w.wind_shear < 5 else 'moderate' if w.wind_shear < 10 else 'high'})",
+                f"{shear:.1f} m/s ({_SHEAR_LABELS[(shear >= 5) + (shear >= 10)]})",
             )
 
         table.add_row(
@@ -141,18 +230,17 @@ class DisplayRenderer:
         table.add_row("├─ Humidity:", format_percentage(w.humidity))
         table.add_row("├─ Pressure:", f"{w.pressure:.0f} hPa")
 
-        if w.jet_stream_speed is not None:
-            jet_quality = "calm" if w.jet_stream_speed < 30 else "moderate" if w.jet_stream_speed < 50 else "strong"
+        jet = w.jet_stream_speed
+        if jet is not None:
             table.add_row(
                 "└─ Jet stream:",
-                f"{w.jet_stream_speed:.0f} m/s ({jet_quality})",
+                f"{jet:.0f} m/s ({_JET_LABELS[(jet >= 30) + (jet >= 50)]})",
             )
 
-        self.console.print(table)
-        self.console.print()
+        return table
 
-    def _render_moon_info(self, report: SeeingReport) -> None:
-        """Render moon information."""
+    def _build_moon_info(self, report: SeeingReport) -> str:
+        """Build moon information line."""
         astro = report.astronomy
         moon_str = format_moon_phase(astro.moon_illumination, astro.moon_phase)
 
@@ -161,16 +249,15 @@ class DisplayRenderer:
         else:
             moon_str += " (below horizon)"
 
-        self.console.print(f"Moon: {moon_str}")
-        self.console.print()
+        return f"Moon: {moon_str}"
 
-    def _render_target_info(self, report: SeeingReport) -> None:
-        """Render target object information."""
+    def _build_target_info(self, report: SeeingReport) -> Panel | None:
+        """Build target object information panel."""
         target = report.target
         pos = report.target_position
 
         if not target or not pos:
-            return
+            return None
 
         panel_content = []
         panel_content.append(f"[bold]{target.name}[/bold] ({target.designation})")
@@ -190,19 +277,17 @@ class DisplayRenderer:
             title=f"Target: {target.name}",
             border_style="cyan",
         )
-        self.console.print(panel)
+        return panel
 
-    def _render_recommendations(self, report: SeeingReport) -> None:
-        """Render observation recommendations."""
+    def _build_recommendations(self, report: SeeingReport) -> Panel:
+        """Build observation recommendations panel."""
         score = report.score
 
         # Overall recommendation
         rec_text = score.recommendation
 
         # Target type recommendations
-        from astrosee.scoring.engine import ScoringEngine
-        engine = ScoringEngine()
-        targets = engine.get_best_targets(score, report.weather)
+        targets = self._engine.get_best_targets(score, report.weather)
 
         target_lines = []
         for target_type, quality in targets.items():
@@ -214,7 +299,7 @@ class DisplayRenderer:
             title="Recommendation",
             border_style="green" if score.total_score >= 60 else "yellow" if score.total_score >= 40 else "red",
         )
-        self.console.print(panel)
+        return panel
 
     def render_forecast_table(
         self,
@@ -227,23 +312,17 @@ class DisplayRenderer:
             forecasts: List of forecast entries
             title: Table title
         """
-        table = Table(title=title)
-        table.add_column("Time", style="cyan")
-        table.add_column("Score", justify="right")
-        table.add_column("Quality")
-        table.add_column("Clouds", justify="right")
-        table.add_column("Wind", justify="right")
-        table.add_column("Night", justify="center")
+        table = _build_table(title, _FORECAST_COLUMNS)
 
         for f in forecasts:
-            night_str = "🌙" if f.is_night else "☀️"
+            score = f.score.total_score
             table.add_row(
                 format_timestamp(f.timestamp),
-                format_score(f.score.total_score),
-                f"[{get_score_color(f.score.total_score)}]{format_rating(f.score.total_score)}[/{get_score_color(f.score.total_score)}]",
+                format_score_text(score),
+                _rating_text(score),
                 format_percentage(f.weather.cloud_cover),
                 format_wind(f.weather.wind_speed_10m),
-                night_str,
+                _NIGHT_CELL if f.is_night else _DAY_CELL,
             )
 
         self.console.print(table)
@@ -257,27 +336,30 @@ class DisplayRenderer:
         Args:
             daily_data: List of (date, avg_score, summary) tuples
         """
-        table = Table(title="7-Day Forecast")
-        table.add_column("Date", style="cyan")
-        table.add_column("Score", justify="right")
-        table.add_column("Summary")
+        table = _build_table("7-Day Forecast", _DAILY_COLUMNS)
 
+        best = None
+        best_score = float("-inf")
         for date, score, summary in daily_data:
             table.add_row(
                 format_date_short(date),
-                format_score(score),
+                format_score_text(score),
                 summary,
             )
+            if score > best_score:
+                best_score = score
+                best = (date, score)
 
-        self.console.print(table)
+        renderables: list[RenderableType] = [table]
 
-        if daily_data:
-            best = max(daily_data, key=lambda x: x[1])
-            self.console.print(
+        if best is not None:
+            renderables.append(
                 f"\n⭐ Best night: [bold]{format_date_short(best[0])}[/bold] "
                 f"(score: {format_score(best[1])})"
             )
 
+        self.console.print(Group(*renderables))
+
     def render_best_window(self, window: ObservingWindow | None) -> None:
         """Render best observation window.
 
@@ -316,74 +398,70 @@ class DisplayRenderer:
         Args:
             comparison: Location comparison data
         """
-        table = Table(title="Location Comparison")
-        table.add_column("Location", style="cyan")
-        table.add_column("Score", justify="right")
-        table.add_column("Quality")
-        table.add_column("Clouds", justify="right")
-        table.add_column("Wind", justify="right")
+        table = _build_table("Location Comparison", _COMPARISON_COLUMNS)
 
         ranked = comparison.ranked()
         for i, (loc, report) in enumerate(ranked):
             prefix = "🏆 " if i == 0 else "   "
+            score = report.score.total_score
             table.add_row(
                 f"{prefix}{loc.name}",
-                format_score(report.score.total_score),
-                format_rating(report.score.total_score),
+                format_score_text(score),
+                format_rating(score),
                 format_percentage(report.weather.cloud_cover),
                 format_wind(report.weather.wind_speed_10m),
             )
 
-        self.console.print(table)
-
-        best_loc, best_report = comparison.best_location
+        # ranked() is ordered best first, so the winner is its first entry
+        best_loc, best_report = ranked[0]
         self.console.print(
-            f"\n✨ Best location: [bold]{best_loc.name}[/bold] "
-            f"with score {format_score(best_report.score.total_score)}"
+            Group(
+                table,
+                f"\n✨ Best location: [bold]{best_loc.name}[/bold] "
+                f"with score {format_score(best_report.score.total_score)}",
+            )
         )
 
     def render_target_visibility(
         self,
         target_name: str,
-        visibility_data: list[dict],
+        visibility: TargetVisibility,
     ) -> None:
         """Render target visibility over time.
 
         Args:
             target_name: Target object name
-            visibility_data: Visibility data from forecast service
+            visibility: Visibility data from forecast service
         """
-        table = Table(title=f"Target: {target_name}")
-        table.add_column("Time", style="cyan")
-        table.add_column("Alt", justify="right")
-        table.add_column("Airmass", justify="right")
-        table.add_column("Score", justify="right")
-        table.add_column("Night", justify="center")
-
-        for entry in visibility_data:
-            if not entry["is_visible"]:
-                continue
-
-            night_str = "🌙" if entry["is_night"] else "☀️"
+        table = _build_table(f"Target: {target_name}", _VISIBILITY_COLUMNS)
+
+        times = visibility.times
+        altitudes = visibility.altitudes
+        airmasses = visibility.airmasses
+        scores = visibility.scores
+        is_night = visibility.is_night
+
+        for i in visibility.visible_indices():
             table.add_row(
-                format_time_short(entry["time"]),
-                format_altitude(entry["altitude"]),
-                f"{entry['airmass']:.2f}",
-                format_score(entry["score"]),
-                night_str,
+                format_time_short(times[i]),
+                format_altitude(altitudes[i]),
+                f"{airmasses[i]:.2f}",
+                format_score_text(scores[i]),
+                _NIGHT_CELL if is_night[i] else _DAY_CELL,
             )
 
-        self.console.print(table)
+        renderables: list[RenderableType] = [table]
 
         # Find optimal time
-        visible = [e for e in visibility_data if e["is_visible"] and e["is_night"]]
-        if visible:
-            best = min(visible, key=lambda e: e["airmass"])
-            self.console.print(
-                f"\n🎯 Optimal viewing: [bold]{format_time_short(best['time'])}[/bold] "
-                f"(altitude: {best['altitude']:.0f}°, airmass: {best['airmass']:.2f})"
+        best = visibility.best_index()
+        if best is not None:
+            renderables.append(
+                f"\n🎯 Optimal viewing: [bold]{format_time_short(times[best])}[/bold] "
+                f"(altitude: {altitudes[best]:.0f}°, airmass: {airmasses[best]:.2f})"
             )
 
+        self.console.print(Group(*renderables))
+
     def print_success(self, message: str) -> None:
         """Print success message."""
         self.console.print(f"[green]✓[/green] {message}")
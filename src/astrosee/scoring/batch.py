@@ -0,0 +1,93 @@
+"""Batch seeing score calculation for whole forecasts.
+
+The scalar engine scores one hour at a time. These helpers score a full
+forecast column-wise: each component is evaluated over every hour before the
+weighted sum, which is how forecast-wide callers should consume scores.
+"""
+
+from collections.abc import Mapping, Sequence
+
+from astrosee.scoring.components import (
+    calculate_airmass_penalty,
+    calculate_moon_penalty,
+    calculate_precipitation_penalty,
+)
+from astrosee.weather.models import WeatherData
+
+
+def calculate_penalties_batch(
+    weathers: Sequence[WeatherData],
+    moon_illumination: Sequence[float] | None = None,
+    moon_altitude: Sequence[float] | None = None,
+    airmass: Sequence[float | None] | None = None,
+    is_deep_sky: bool = False,
+) -> list[dict[str, float]]:
+    """Calculate the applied penalty multipliers for each forecast hour.
+
+    Args:
+        weathers: Weather data points
+        moon_illumination: Moon illumination per hour (default: 0)
+        moon_altitude: Moon altitude per hour (default: below horizon)
+        airmass: Target airmass per hour (None entries: no target)
+        is_deep_sky: Whether target is a deep-sky object
+
+    Returns:
+        One dict per hour with only the penalties below 1.0, keyed like
+        SeeingScore.penalties
+    """
+    n = len(weathers)
+    illuminations = moon_illumination if moon_illumination is not None else [0.0] * n
+    altitudes = moon_altitude if moon_altitude is not None else [-90.0] * n
+    airmasses = airmass if airmass is not None else [None] * n
+
+    results = []
+    for weather, illum, alt, am in zip(weathers, illuminations, altitudes, airmasses):
+        penalties = {}
+
+        moon_penalty = calculate_moon_penalty(illum, alt, is_deep_sky)
+        if moon_penalty < 1.0:
+            penalties["moon"] = moon_penalty
+
+        if am is not None:
+            airmass_penalty = calculate_airmass_penalty(am)
+            if airmass_penalty < 1.0:
+                penalties["airmass"] = airmass_penalty
+
+        precip_penalty = calculate_precipitation_penalty(weather)
+        if precip_penalty < 1.0:
+            penalties["precipitation"] = precip_penalty
+
+        results.append(penalties)
+
+    return results
+
+
+def combine_scores(
+    components: Mapping[str, Sequence[float]],
+    weights: Mapping[str, float],
+    penalties: Sequence[Mapping[str, float]],
+) -> list[float]:
+    """Combine column-wise component scores and penalties into total scores.
+
+    Args:
+        components: Component name to per-hour scores
+        weights: Component weights (summing to 1.0)
+        penalties: Per-hour penalty multipliers
+
+    Returns:
+        Total score per hour, clamped to 0-100 and rounded to 0.1
+    """
+    totals = [0.0] * len(penalties)
+    for key, column in components.items():
+        weight = weights[key]
+        for i, value in enumerate(column):
+            totals[i] += value * weight
+
+    for i, hour_penalties in enumerate(penalties):
+        final_score = totals[i]
+        for penalty in hour_penalties.values():
+            final_score *= penalty
+        totals[i] = round(max(0, min(100, final_score)), 1)
+
+    return totals
+
@@ -4,9 +4,167 @@ Each function calculates a score from 0-100 for a specific atmospheric factor.
 Higher scores indicate better seeing conditions.
 """
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from functools import lru_cache
+
 from astrosee.core.utils import clamp, linear_interpolate
 from astrosee.weather.models import WeatherData
 
+# Piecewise-linear scoring tables.
+#
+# Each table pairs the ladder boundaries with one (x0, x1, y0, y1) segment per
+# branch; a segment with x0 == x1 is a constant. Segment lookup is a single
+# bisect over the boundaries instead of an if/elif chain, which lets the batch
+# helpers below score whole forecast columns without re-running the ladder.
+#
+# The value-level scorers are memoized: forecast values are reported at a
+# fixed precision, so adjacent hours and repeated renders hit the same inputs.
+_SCORE_CACHE_SIZE = 4096
+_TEMP_DIFF_BOUNDS = (2.0, 5.0, 10.0, 15.0)  # lower bounds (>=)
+_TEMP_DIFF_SEGMENTS = (
+    (0.0, 2.0, 10.0, 40.0),  # Condensation imminent
+    (2.0, 5.0, 40.0, 70.0),
+    (5.0, 10.0, 70.0, 90.0),
+    (10.0, 15.0, 90.0, 100.0),
+    (15.0, 15.0, 100.0, 100.0),
+)
+
+_WIND_SPEED_BOUNDS = (2.0, 5.0, 10.0)  # upper bounds (<=)
+_WIND_SPEED_SEGMENTS = (
+    (2.0, 2.0, 100.0, 100.0),
+    (2.0, 5.0, 80.0, 100.0),
+    (5.0, 10.0, 50.0, 80.0),
+    (10.0, 20.0, 20.0, 50.0),
+)
+
+_HUMIDITY_BOUNDS = (30.0, 50.0, 70.0, 85.0, 95.0)  # upper bounds (<=)
+_HUMIDITY_SEGMENTS = (
+    (30.0, 30.0, 100.0, 100.0),
+    (30.0, 50.0, 85.0, 100.0),
+    (50.0, 70.0, 60.0, 85.0),
+    (70.0, 85.0, 35.0, 60.0),
+    (85.0, 95.0, 15.0, 35.0),
+    (95.0, 100.0, 0.0, 15.0),
+)
+
+_CLOUD_COVER_BOUNDS = (5.0, 20.0, 50.0, 80.0)  # upper bounds (<=)
+_CLOUD_COVER_SEGMENTS = (
+    (5.0, 5.0, 100.0, 100.0),
+    (5.0, 20.0, 85.0, 100.0),
+    (20.0, 50.0, 50.0, 85.0),
+    (50.0, 80.0, 20.0, 50.0),
+    (80.0, 100.0, 0.0, 20.0),
+)
+
+_JET_STREAM_BOUNDS = (15.0, 30.0, 45.0, 60.0)  # upper bounds (<=)
+_JET_STREAM_SEGMENTS = (
+    (15.0, 15.0, 100.0, 100.0),
+    (15.0, 30.0, 85.0, 100.0),
+    (30.0, 45.0, 60.0, 85.0),
+    (45.0, 60.0, 35.0, 60.0),
+    (60.0, 100.0, 10.0, 35.0),
+)
+
+_AIRMASS_BOUNDS = (1.2, 1.5, 2.0, 3.0)  # upper bounds (<=)
+_AIRMASS_SEGMENTS = (
+    (1.2, 1.2, 1.0, 1.0),  # Excellent, no penalty
+    (1.2, 1.5, 0.95, 1.0),
+    (1.5, 2.0, 0.85, 0.95),
+    (2.0, 3.0, 0.65, 0.85),
+    (3.0, 5.0, 0.5, 0.65),
+)
+
+# Multiplier applied whenever precipitation is falling. It caps the final score
+# at 10% of the weighted base score, so callers can treat any hour with
+# precipitation > 0 as unobservable without inspecting the other penalties.
+ACTIVE_PRECIPITATION_PENALTY = 0.1
+
+_PRECIP_PROBABILITY_BOUNDS = (20.0, 50.0, 80.0)  # upper bounds (<=)
+_PRECIP_PROBABILITY_SEGMENTS = (
+    (20.0, 20.0, 1.0, 1.0),
+    (20.0, 50.0, 0.9, 0.6),
+    (50.0, 80.0, 0.6, 0.3),
+    (80.0, 80.0, 0.3, 0.3),
+)
+
+
+def _segment_value(
+    value: float,
+    segments: tuple[tuple[float, float, float, float], ...],
+    index: int,
+) -> float:
+    """Evaluate one segment of a piecewise-linear scoring table.
+
+    Equivalent to linear_interpolate(value, x0, x1, y0, y1), inlined because
+    this runs for every component of every scored hour.
+    """
+    x0, x1, y0, y1 = segments[index]
+    if x1 == x0:
+        return y0
+    return y0 + (value - x0) / (x1 - x0) * (y1 - y0)
+
+
+@lru_cache(maxsize=_SCORE_CACHE_SIZE)
+def _temperature_differential_value(diff: float) -> float:
+    return _segment_value(
+        diff, _TEMP_DIFF_SEGMENTS, bisect_right(_TEMP_DIFF_BOUNDS, diff)
+    )
+
+
+@lru_cache(maxsize=_SCORE_CACHE_SIZE)
+def _wind_stability_value(
+    wind_speed: float, gusts: float, shear: float | None
+) -> float:
+    wind_score = _segment_value(
+        wind_speed, _WIND_SPEED_SEGMENTS, bisect_left(_WIND_SPEED_BOUNDS, wind_speed)
+    )
+    wind_score = max(10, wind_score)
+
+    # Penalty for high gust ratio (turbulence indicator)
+    gust_ratio = gusts / max(wind_speed, 0.1)
+    if gust_ratio > 2:
+        wind_score -= (gust_ratio - 2) / 2 * 30  # 0-30 over ratio 2-4
+
+    # Wind shear penalty if available
+    if shear is not None and shear > 5:
+        wind_score -= (shear - 5) / 10 * 20  # 0-20 over 5-15 m/s
+
+    return clamp(wind_score, 0, 100)
+
+
+@lru_cache(maxsize=_SCORE_CACHE_SIZE)
+def _humidity_value(humidity: float) -> float:
+    return _segment_value(
+        humidity, _HUMIDITY_SEGMENTS, bisect_left(_HUMIDITY_BOUNDS, humidity)
+    )
+
+
+@lru_cache(maxsize=_SCORE_CACHE_SIZE)
+def _cloud_cover_value(
+    total_cloud: float, low_cloud: float | None, high_cloud: float | None
+) -> float:
+    base_score = _segment_value(
+        total_cloud, _CLOUD_COVER_SEGMENTS, bisect_left(_CLOUD_COVER_BOUNDS, total_cloud)
+    )
+
+    if low_cloud is not None and high_cloud is not None:
+        if high_cloud > low_cloud * 2:
+            base_score = min(100, base_score + min(10, (high_cloud - low_cloud) * 0.2))
+        elif low_cloud > high_cloud * 2:
+            base_score = max(0, base_score - min(15, (low_cloud - high_cloud) * 0.3))
+
+    return clamp(base_score, 0, 100)
+
+
+@lru_cache(maxsize=_SCORE_CACHE_SIZE)
+def _jet_stream_value(jet_speed: float | None) -> float:
+    if jet_speed is None:
+        return 75.0
+    return _segment_value(
+        jet_speed, _JET_STREAM_SEGMENTS, bisect_left(_JET_STREAM_BOUNDS, jet_speed)
+    )
+
 
 def calculate_temperature_differential_score(weather: WeatherData) -> float:
     """Calculate score based on temperature-dewpoint differential.
@@ -21,19 +179,7 @@ def calculate_temperature_differential_score(weather: WeatherData) -> float:
     Returns:
         Score 0-100
     """
-    diff = weather.temperature_differential
-
-    if diff >= 15:
-        return 100.0
-    elif diff >= 10:
-        return linear_interpolate(diff, 10, 15, 90, 100)
-    elif diff >= 5:
-        return linear_interpolate(diff, 5, 10, 70, 90)
-    elif diff >= 2:
-        return linear_interpolate(diff, 2, 5, 40, 70)
-    else:
-        # Condensation imminent
-        return linear_interpolate(diff, 0, 2, 10, 40)
+    return _temperature_differential_value(weather.temperature_differential)
 
 
 def calculate_wind_stability_score(weather: WeatherData) -> float:
@@ -48,41 +194,9 @@ def calculate_wind_stability_score(weather: WeatherData) -> float:
     Returns:
         Score 0-100
     """
-    wind_speed = weather.wind_speed_10m  # m/s
-    gusts = weather.wind_gusts  # m/s
-
-    # Calculate gust ratio (indicator of turbulence)
-    gust_ratio = gusts / max(wind_speed, 0.1)
-
-    # Base score from wind speed
-    # 0-2 m/s: excellent
-    # 2-5 m/s: good
-    # 5-10 m/s: fair
-    # >10 m/s: poor
-    if wind_speed <= 2:
-        wind_score = 100.0
-    elif wind_speed <= 5:
-        wind_score = linear_interpolate(wind_speed, 2, 5, 80, 100)
-    elif wind_speed <= 10:
-        wind_score = linear_interpolate(wind_speed, 5, 10, 50, 80)
-    else:
-        wind_score = linear_interpolate(wind_speed, 10, 20, 20, 50)
-        wind_score = max(10, wind_score)
-
-    # Penalty for high gust ratio (turbulence indicator)
-    # Gust ratio > 2 indicates gusty conditions
-    if gust_ratio > 2:
-        penalty = linear_interpolate(gust_ratio, 2, 4, 0, 30)
-        wind_score -= penalty
-
-    # Wind shear penalty if available
-    if weather.wind_shear is not None:
-        shear = weather.wind_shear  # m/s
-        if shear > 5:
-            shear_penalty = linear_interpolate(shear, 5, 15, 0, 20)
-            wind_score -= shear_penalty
-
-    return clamp(wind_score, 0, 100)
+    return _wind_stability_value(
+        weather.wind_speed_10m, weather.wind_gusts, weather.wind_shear
+    )
 
 
 def calculate_humidity_score(weather: WeatherData) -> float:
@@ -98,20 +212,7 @@ def calculate_humidity_score(weather: WeatherData) -> float:
     Returns:
         Score 0-100
     """
-    humidity = weather.humidity
-
-    if humidity <= 30:
-        return 100.0
-    elif humidity <= 50:
-        return linear_interpolate(humidity, 30, 50, 85, 100)
-    elif humidity <= 70:
-        return linear_interpolate(humidity, 50, 70, 60, 85)
-    elif humidity <= 85:
-        return linear_interpolate(humidity, 70, 85, 35, 60)
-    elif humidity <= 95:
-        return linear_interpolate(humidity, 85, 95, 15, 35)
-    else:
-        return linear_interpolate(humidity, 95, 100, 0, 15)
+    return _humidity_value(weather.humidity)
 
 
 def calculate_cloud_cover_score(weather: WeatherData) -> float:
@@ -126,39 +227,11 @@ def calculate_cloud_cover_score(weather: WeatherData) -> float:
     Returns:
         Score 0-100
     """
-    total_cloud = weather.cloud_cover
-
-    # Basic score from total cloud cover
-    if total_cloud <= 5:
-        base_score = 100.0
-    elif total_cloud <= 20:
-        base_score = linear_interpolate(total_cloud, 5, 20, 85, 100)
-    elif total_cloud <= 50:
-        base_score = linear_interpolate(total_cloud, 20, 50, 50, 85)
-    elif total_cloud <= 80:
-        base_score = linear_interpolate(total_cloud, 50, 80, 20, 50)
-    else:
-        base_score = linear_interpolate(total_cloud, 80, 100, 0, 20)
-
-    # Adjust for cloud layer types if available
-    if (
-        weather.cloud_cover_low is not None
-        and weather.cloud_cover_high is not None
-    ):
-        # Low clouds are worse than high clouds
-        low_cloud = weather.cloud_cover_low
-        high_cloud = weather.cloud_cover_high
-
-        # If mostly high clouds (cirrus), improve score slightly
-        if high_cloud > low_cloud * 2:
-            bonus = min(10, (high_cloud - low_cloud) * 0.2)
-            base_score = min(100, base_score + bonus)
-        # If mostly low clouds, penalize
-        elif low_cloud > high_cloud * 2:
-            penalty = min(15, (low_cloud - high_cloud) * 0.3)
-            base_score = max(0, base_score - penalty)
-
-    return clamp(base_score, 0, 100)
+    # Low clouds are worse than high clouds: mostly high (cirrus) cover earns a
+    # small bonus, mostly low cover is penalized.
+    return _cloud_cover_value(
+        weather.cloud_cover, weather.cloud_cover_low, weather.cloud_cover_high
+    )
 
 
 def calculate_jet_stream_score(weather: WeatherData) -> float:
@@ -174,22 +247,8 @@ def calculate_jet_stream_score(weather: WeatherData) -> float:
     Returns:
         Score 0-100
     """
-    if weather.jet_stream_speed is None:
-        # No data available, assume neutral
-        return 75.0
-
-    jet_speed = weather.jet_stream_speed  # m/s
-
-    if jet_speed <= 15:
-        return 100.0
-    elif jet_speed <= 30:
-        return linear_interpolate(jet_speed, 15, 30, 85, 100)
-    elif jet_speed <= 45:
-        return linear_interpolate(jet_speed, 30, 45, 60, 85)
-    elif jet_speed <= 60:
-        return linear_interpolate(jet_speed, 45, 60, 35, 60)
-    else:
-        return linear_interpolate(jet_speed, 60, 100, 10, 35)
+    # No data available -> neutral 75
+    return _jet_stream_value(weather.jet_stream_speed)
 
 
 def calculate_pressure_stability_score(weather: WeatherData) -> float:
@@ -271,16 +330,9 @@ def calculate_airmass_penalty(airmass: float) -> float:
     Returns:
         Penalty multiplier (0.5-1.0, where 1.0 = no penalty)
     """
-    if airmass <= 1.2:
-        return 1.0  # Excellent, no penalty
-    elif airmass <= 1.5:
-        return linear_interpolate(airmass, 1.2, 1.5, 0.95, 1.0)
-    elif airmass <= 2.0:
-        return linear_interpolate(airmass, 1.5, 2.0, 0.85, 0.95)
-    elif airmass <= 3.0:
-        return linear_interpolate(airmass, 2.0, 3.0, 0.65, 0.85)
-    else:
-        return linear_interpolate(airmass, 3.0, 5.0, 0.5, 0.65)
+    return _segment_value(
+        airmass, _AIRMASS_SEGMENTS, bisect_left(_AIRMASS_BOUNDS, airmass)
+    )
 
 
 def calculate_precipitation_penalty(weather: WeatherData) -> float:
@@ -296,14 +348,45 @@ def calculate_precipitation_penalty(weather: WeatherData) -> float:
     """
     if weather.precipitation > 0:
         # Active precipitation = no observation possible
-        return 0.1
+        return ACTIVE_PRECIPITATION_PENALTY
 
     prob = weather.precipitation_probability or 0
-    if prob > 80:
-        return 0.3
-    elif prob > 50:
-        return linear_interpolate(prob, 50, 80, 0.6, 0.3)
-    elif prob > 20:
-        return linear_interpolate(prob, 20, 50, 0.9, 0.6)
-    else:
-        return 1.0
+    return _segment_value(
+        prob,
+        _PRECIP_PROBABILITY_SEGMENTS,
+        bisect_left(_PRECIP_PROBABILITY_BOUNDS, prob),
+    )
+
+
+def calculate_component_scores_batch(
+    weathers: Sequence[WeatherData],
+) -> dict[str, list[float]]:
+    """Calculate all weighted component scores for a series of weather points.
+
+    Scores are returned column-wise (one list per component, in input order)
+    so callers scoring a whole forecast can aggregate each component as a
+    vector instead of calling every scalar function once per hour.
+
+    Args:
+        weathers: Weather data points, typically an hourly forecast
+
+    Returns:
+        Dict mapping component name to a list of scores 0-100
+    """
+    return {
+        "temperature_differential": [
+            _temperature_differential_value(w.temperature - w.dew_point)
+            for w in weathers
+        ],
+        "wind_stability": [
+            _wind_stability_value(w.wind_speed_10m, w.wind_gusts, w.wind_shear)
+            for w in weathers
+        ],
+        "humidity": [_humidity_value(w.humidity) for w in weathers],
+        "cloud_cover": [
+            _cloud_cover_value(w.cloud_cover, w.cloud_cover_low, w.cloud_cover_high)
+            for w in weathers
+        ],
+        "jet_stream": [_jet_stream_value(w.jet_stream_speed) for w in weathers],
+    }
+
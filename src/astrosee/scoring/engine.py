@@ -1,10 +1,17 @@
 """Seeing score calculation engine."""
 
-from datetime import datetime, timezone
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
 
+from astrosee.scoring.batch import (
+    calculate_penalties_batch,
+    combine_scores,
+)
 from astrosee.scoring.components import (
     calculate_airmass_penalty,
     calculate_cloud_cover_score,
+    calculate_component_scores_batch,
     calculate_humidity_score,
     calculate_jet_stream_score,
     calculate_moon_penalty,
@@ -15,18 +22,81 @@ from astrosee.scoring.components import (
 from astrosee.scoring.models import SeeingScore
 from astrosee.weather.models import WeatherData
 
+# Overall recommendation bands: each threshold is the inclusive lower bound
+# of the next message
+_OVERALL_THRESHOLDS = (40, 55, 70, 85)
+_OVERALL_MESSAGES = (
+    "Poor conditions. Consider rescheduling if possible.",
+    "Fair conditions. Best for planetary observation and the Moon.",
+    "Good conditions. Suitable for most visual observation.",
+    "Very good conditions. Excellent for planetary and deep-sky observation.",
+    "Outstanding conditions for all types of observation and imaging.",
+)
+
+# Target-type rating bands: each threshold is the inclusive lower bound of
+# the next label. Planets between 40 and 60 rate "Good" only with clear skies.
+_PLANET_THRESHOLDS = (30, 40, 60, 80)
+_PLANET_LABELS = ("Poor", "Fair", "Fair", "Good", "Excellent")
+_PLANET_CLEAR_LABELS = ("Poor", "Fair", "Good", "Good", "Excellent")
+_PLANET_CLEAR_CLOUD_MAX = 30
+
+_MOON_THRESHOLDS = (30, 50)
+_MOON_LABELS = ("Fair", "Good", "Excellent")
+
+_DEEP_SKY_THRESHOLDS = (35, 50, 70)
+_DEEP_SKY_LABELS = ("Poor", "Fair", "Good", "Excellent")
+
+# Imaging is rated by score, then capped by wind: "Excellent" needs wind
+# below 3 m/s and "Good" below 5 m/s
+_IMAGING_THRESHOLDS = (50, 65, 80)
+_IMAGING_WIND_BANDS = (3, 5)
+_IMAGING_WIND_CAPS = (3, 2, 1)
+_IMAGING_LABELS = ("Not recommended", "Fair", "Good", "Excellent")
+
+
+def _rate_targets(
+    total: float, cloud_cover: float, wind_speed: float, moon_penalty: float
+) -> tuple[str, str, str, str]:
+    """Rate planets, moon, deep-sky and imaging for one set of conditions."""
+    planet_labels = (
+        _PLANET_CLEAR_LABELS if cloud_cover < _PLANET_CLEAR_CLOUD_MAX else _PLANET_LABELS
+    )
+    imaging_level = min(
+        bisect_right(_IMAGING_THRESHOLDS, total),
+        _IMAGING_WIND_CAPS[bisect_right(_IMAGING_WIND_BANDS, wind_speed)],
+    )
+    return (
+        planet_labels[bisect_right(_PLANET_THRESHOLDS, total)],
+        _MOON_LABELS[bisect_right(_MOON_THRESHOLDS, total)],
+        _DEEP_SKY_LABELS[bisect_right(_DEEP_SKY_THRESHOLDS, total * moon_penalty)],
+        _IMAGING_LABELS[imaging_level],
+    )
+
 
 class ScoringEngine:
     """Engine for calculating seeing scores from weather data."""
 
-    # Default component weights (must sum to 1.0)
-    DEFAULT_WEIGHTS = {
+    # Default component weights (must sum to 1.0); read-only and shared by
+    # every engine that uses them
+    DEFAULT_WEIGHTS = MappingProxyType({
         "temperature_differential": 0.25,
         "wind_stability": 0.30,
         "humidity": 0.15,
         "cloud_cover": 0.20,
         "jet_stream": 0.10,
-    }
+    })
+
+    # Component order used for scores and weights
+    COMPONENT_KEYS = (
+        "temperature_differential",
+        "wind_stability",
+        "humidity",
+        "cloud_cover",
+        "jet_stream",
+    )
+
+    # DEFAULT_WEIGHTS in COMPONENT_KEYS order
+    _DEFAULT_WEIGHT_VEC = tuple(map(DEFAULT_WEIGHTS.__getitem__, COMPONENT_KEYS))
 
     def __init__(self, weights: dict[str, float] | None = None):
         """Initialize the scoring engine.
@@ -34,14 +104,24 @@ class ScoringEngine:
         Args:
             weights: Custom component weights (default: DEFAULT_WEIGHTS)
         """
-        self.weights = weights or self.DEFAULT_WEIGHTS.copy()
+        if not weights:
+            # Defaults are known to sum to 1.0, so skip validation
+            self.weights: Mapping[str, float] = self.DEFAULT_WEIGHTS
+            self._weight_vec = self._DEFAULT_WEIGHT_VEC
+            return
+
+        # Copy so normalization never mutates the caller's dict
+        self.weights = weights = dict(weights)
 
         # Validate weights sum to 1.0
-        total = sum(self.weights.values())
+        total = sum(weights.values())
         if abs(total - 1.0) > 0.01:
             # Normalize weights
-            for key in self.weights:
-                self.weights[key] /= total
+            for key in weights:
+                weights[key] /= total
+
+        # Weights in component order, for the unrolled sum in calculate_score
+        self._weight_vec = tuple(self.weights[key] for key in self.COMPONENT_KEYS)
 
     def calculate_score(
         self,
@@ -64,57 +144,100 @@ class ScoringEngine:
             SeeingScore with total score and breakdown
         """
         # Calculate component scores
-        components = {
-            "temperature_differential": calculate_temperature_differential_score(weather),
-            "wind_stability": calculate_wind_stability_score(weather),
-            "humidity": calculate_humidity_score(weather),
-            "cloud_cover": calculate_cloud_cover_score(weather),
-            "jet_stream": calculate_jet_stream_score(weather),
-        }
+        td = calculate_temperature_differential_score(weather)
+        wind = calculate_wind_stability_score(weather)
+        hum = calculate_humidity_score(weather)
+        cloud = calculate_cloud_cover_score(weather)
+        jet = calculate_jet_stream_score(weather)
 
         # Calculate weighted average
-        base_score = sum(
-            components[key] * self.weights[key]
-            for key in components
-        )
+        w = self._weight_vec
+        base_score = td * w[0] + wind * w[1] + hum * w[2] + cloud * w[3] + jet * w[4]
 
-        # Calculate penalties
+        # Calculate penalties, applying each one as it is found
         penalties = {}
+        final_score = base_score
 
-        # Moon penalty (for deep-sky objects)
-        moon_penalty = calculate_moon_penalty(
-            moon_illumination, moon_altitude, is_deep_sky
-        )
-        if moon_penalty < 1.0:
-            penalties["moon"] = moon_penalty
+        # Moon penalty (for deep-sky objects; always 1.0 otherwise)
+        if is_deep_sky:
+            moon_penalty = calculate_moon_penalty(
+                moon_illumination, moon_altitude, is_deep_sky
+            )
+            if moon_penalty < 1.0:
+                penalties["moon"] = moon_penalty
+                final_score *= moon_penalty
 
         # Airmass penalty (for specific targets)
-        airmass_penalty = 1.0
         if airmass is not None:
             airmass_penalty = calculate_airmass_penalty(airmass)
             if airmass_penalty < 1.0:
                 penalties["airmass"] = airmass_penalty
+                final_score *= airmass_penalty
 
         # Precipitation penalty
         precip_penalty = calculate_precipitation_penalty(weather)
         if precip_penalty < 1.0:
             penalties["precipitation"] = precip_penalty
-
-        # Apply penalties
-        final_score = base_score
-        for penalty in penalties.values():
-            final_score *= penalty
+            final_score *= precip_penalty
 
         # Ensure score is in valid range
         final_score = max(0, min(100, final_score))
 
-        return SeeingScore(
+        # Inputs are already clamped and typed here, so skip pydantic validation
+        return SeeingScore.model_construct(
             total_score=round(final_score, 1),
-            component_scores=components,
+            component_scores={
+                "temperature_differential": td,
+                "wind_stability": wind,
+                "humidity": hum,
+                "cloud_cover": cloud,
+                "jet_stream": jet,
+            },
             penalties=penalties,
             timestamp=weather.timestamp,
         )
 
+    def calculate_scores(
+        self,
+        weathers: Sequence[WeatherData],
+        moon_illumination: Sequence[float] | None = None,
+        moon_altitude: Sequence[float] | None = None,
+        airmass: Sequence[float | None] | None = None,
+        is_deep_sky: bool = False,
+    ) -> list[SeeingScore]:
+        """Calculate seeing scores for a whole forecast in one pass.
+
+        Equivalent to calling calculate_score for each hour, but components
+        and penalties are evaluated column-wise across the forecast.
+
+        Args:
+            weathers: Weather data points
+            moon_illumination: Moon illumination per hour (0-100)
+            moon_altitude: Moon altitude per hour in degrees
+            airmass: Target airmass per hour (None if no specific target)
+            is_deep_sky: Whether target is a deep-sky object
+
+        Returns:
+            SeeingScore per hour, in input order
+        """
+        components = calculate_component_scores_batch(weathers)
+        penalties = calculate_penalties_batch(
+            weathers, moon_illumination, moon_altitude, airmass, is_deep_sky
+        )
+        totals = combine_scores(components, self.weights, penalties)
+
+        keys = list(components)
+        columns = [components[key] for key in keys]
+        return [
+            SeeingScore.model_construct(
+                total_score=totals[i],
+                component_scores={key: column[i] for key, column in zip(keys, columns)},
+                penalties=penalties[i],
+                timestamp=weather.timestamp,
+            )
+            for i, weather in enumerate(weathers)
+        ]
+
     def calculate_score_simple(self, weather: WeatherData) -> float:
         """Calculate a simple seeing score without astronomical factors.
 
@@ -143,39 +266,19 @@ class ScoringEngine:
         Returns:
             List of recommendation strings
         """
-        recommendations = []
-
         # Overall recommendation
-        if score.total_score >= 85:
-            recommendations.append(
-                "Outstanding conditions for all types of observation and imaging."
-            )
-        elif score.total_score >= 70:
-            recommendations.append(
-                "Very good conditions. Excellent for planetary and deep-sky observation."
-            )
-        elif score.total_score >= 55:
-            recommendations.append(
-                "Good conditions. Suitable for most visual observation."
-            )
-        elif score.total_score >= 40:
-            recommendations.append(
-                "Fair conditions. Best for planetary observation and the Moon."
-            )
-        else:
-            recommendations.append(
-                "Poor conditions. Consider rescheduling if possible."
-            )
+        recommendations = [
+            _OVERALL_MESSAGES[bisect_right(_OVERALL_THRESHOLDS, score.total_score)]
+        ]
 
         # Specific recommendations based on components
         components = score.component_scores
 
-        if components.get("cloud_cover", 100) < 50:
-            if weather.cloud_cover > 50:
-                recommendations.append(
-                    f"Cloud cover at {weather.cloud_cover:.0f}% may obstruct targets. "
-                    "Monitor for clearing."
-                )
+        if components.get("cloud_cover", 100) < 50 and weather.cloud_cover > 50:
+            recommendations.append(
+                f"Cloud cover at {weather.cloud_cover:.0f}% may obstruct targets. "
+                "Monitor for clearing."
+            )
 
         if components.get("wind_stability", 100) < 60:
             recommendations.append(
@@ -183,11 +286,8 @@ class ScoringEngine:
                 "Shield your setup if possible."
             )
 
-        if components.get("humidity", 100) < 60:
-            if weather.temperature_differential < 3:
-                recommendations.append(
-                    "High humidity risk. Watch for dew formation on optics."
-                )
+        if components.get("humidity", 100) < 60 and weather.temperature_differential < 3:
+            recommendations.append("High humidity risk. Watch for dew formation on optics.")
 
         if components.get("temperature_differential", 100) < 50:
             recommendations.append(
@@ -195,13 +295,11 @@ class ScoringEngine:
             )
 
         # Moon recommendations
-        if "moon" in score.penalties:
-            penalty = score.penalties["moon"]
-            if penalty < 0.7:
-                recommendations.append(
-                    "Bright Moon affecting deep-sky observation. "
-                    "Consider planetary targets or wait for moonset."
-                )
+        if score.penalties.get("moon", 1.0) < 0.7:
+            recommendations.append(
+                "Bright Moon affecting deep-sky observation. "
+                "Consider planetary targets or wait for moonset."
+            )
 
         return recommendations
 
@@ -219,40 +317,15 @@ class ScoringEngine:
         Returns:
             Dict mapping target type to recommendation
         """
-        total = score.total_score
-        targets = {}
-
-        # Planets
-        if total >= 60 or (total >= 40 and weather.cloud_cover < 30):
-            targets["planets"] = "Excellent" if total >= 80 else "Good"
-        elif total >= 30:
-            targets["planets"] = "Fair"
-        else:
-            targets["planets"] = "Poor"
-
-        # Moon
-        targets["moon"] = "Excellent" if total >= 50 else "Good" if total >= 30 else "Fair"
-
-        # Deep sky
-        moon_penalty = score.penalties.get("moon", 1.0)
-        effective_deep_sky = total * moon_penalty
-        if effective_deep_sky >= 70:
-            targets["deep_sky"] = "Excellent"
-        elif effective_deep_sky >= 50:
-            targets["deep_sky"] = "Good"
-        elif effective_deep_sky >= 35:
-            targets["deep_sky"] = "Fair"
-        else:
-            targets["deep_sky"] = "Poor"
-
-        # Imaging
-        if total >= 80 and weather.wind_speed_10m < 3:
-            targets["imaging"] = "Excellent"
-        elif total >= 65 and weather.wind_speed_10m < 5:
-            targets["imaging"] = "Good"
-        elif total >= 50:
-            targets["imaging"] = "Fair"
-        else:
-            targets["imaging"] = "Not recommended"
-
-        return targets
+        planets, moon, deep_sky, imaging = _rate_targets(
+            score.total_score,
+            weather.cloud_cover,
+            weather.wind_speed_10m,
+            score.penalties.get("moon", 1.0),
+        )
+        return {
+            "planets": planets,
+            "moon": moon,
+            "deep_sky": deep_sky,
+            "imaging": imaging,
+        }
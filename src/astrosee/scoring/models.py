@@ -1,5 +1,6 @@
 """Scoring data models."""
 
+from bisect import bisect_right
 from datetime import datetime, timedelta
 
 from pydantic import BaseModel, Field
@@ -7,6 +8,19 @@ from pydantic import BaseModel, Field
 from astrosee.astronomy.models import AstronomyData, CelestialObject, Location, TargetPosition
 from astrosee.weather.models import WeatherData
 
+# Rating bands: each threshold is the inclusive lower bound of the next band
+_RATING_THRESHOLDS = (25, 40, 55, 70, 85)
+_RATING_LABELS = ("Bad", "Poor", "Fair", "Good", "Very Good", "Excellent")
+_RATING_COLORS = ("bright_red", "red", "orange1", "yellow", "green", "bright_green")
+_RECOMMENDATIONS = (
+    "Not recommended for serious observation tonight.",
+    "Poor conditions. Only bright objects recommended.",
+    "Fair conditions. Best for planets and the Moon.",
+    "Good conditions. Suitable for planetary and bright deep-sky objects.",
+    "Very good conditions. Excellent for most observations.",
+    "Outstanding conditions! Perfect for imaging and visual observation.",
+)
+
 
 class SeeingScore(BaseModel):
     """Calculated seeing score with component breakdown."""
@@ -28,50 +42,17 @@ class SeeingScore(BaseModel):
     @property
     def rating(self) -> str:
         """Get a human-readable rating."""
-        if self.total_score >= 85:
-            return "Excellent"
-        elif self.total_score >= 70:
-            return "Very Good"
-        elif self.total_score >= 55:
-            return "Good"
-        elif self.total_score >= 40:
-            return "Fair"
-        elif self.total_score >= 25:
-            return "Poor"
-        else:
-            return "Bad"
+        return _RATING_LABELS[bisect_right(_RATING_THRESHOLDS, self.total_score)]
 
     @property
     def rating_color(self) -> str:
         """Get a color for the rating (for Rich display)."""
-        if self.total_score >= 85:
-            return "bright_green"
-        elif self.total_score >= 70:
-            return "green"
-        elif self.total_score >= 55:
-            return "yellow"
-        elif self.total_score >= 40:
-            return "orange1"
-        elif self.total_score >= 25:
-            return "red"
-        else:
-            return "bright_red"
+        return _RATING_COLORS[bisect_right(_RATING_THRESHOLDS, self.total_score)]
 
     @property
     def recommendation(self) -> str:
         """Get observation recommendation."""
-        if self.total_score >= 85:
-            return "Outstanding conditions! Perfect for imaging and visual observation."
-        elif self.total_score >= 70:
-            return "Very good conditions. Excellent for most observations."
-        elif self.total_score >= 55:
-            return "Good conditions. Suitable for planetary and bright deep-sky objects."
-        elif self.total_score >= 40:
-            return "Fair conditions. Best for planets and the Moon."
-        elif self.total_score >= 25:
-            return "Poor conditions. Only bright objects recommended."
-        else:
-            return "Not recommended for serious observation tonight."
+        return _RECOMMENDATIONS[bisect_right(_RATING_THRESHOLDS, self.total_score)]
 
 
 class SeeingReport(BaseModel):
@@ -137,7 +118,8 @@ class ObservingWindow(BaseModel):
 
     def __str__(self) -> str:
         return (
-            f"{self.start.strftime('%H:%M')} - {self.end.strftime('%H:%M')} "
+            f"{self.start.hour:02d}:{self.start.minute:02d} - "
+            f"{self.end.hour:02d}:{self.end.minute:02d} "
             f"(avg: {self.average_score:.0f}, peak: {self.peak_score:.0f})"
         )
 
@@ -149,16 +131,52 @@ class LocationComparison(BaseModel):
     locations: list[Location]
     reports: list[SeeingReport]
 
+    def _total_scores(self) -> list[float]:
+        """Get each report's total score, in report order."""
+        return [report.score.total_score for report in self.reports]
+
     @property
     def best_location(self) -> tuple[Location, SeeingReport]:
         """Get the location with the best score."""
-        best_idx = max(
-            range(len(self.reports)),
-            key=lambda i: self.reports[i].score.total_score,
-        )
+        scores = self._total_scores()
+        best_idx = max(range(len(scores)), key=scores.__getitem__)
         return self.locations[best_idx], self.reports[best_idx]
 
     def ranked(self) -> list[tuple[Location, SeeingReport]]:
         """Get locations ranked by score (best first)."""
-        pairs = list(zip(self.locations, self.reports))
-        return sorted(pairs, key=lambda p: p[1].score.total_score, reverse=True)
+        scores = self._total_scores()
+        order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        return [(self.locations[i], self.reports[i]) for i in order]
+
+
+class TargetVisibility(BaseModel):
+    """Target visibility over a forecast period.
+
+    Stored column-wise (one list per field, aligned by index) so renderers can
+    scan a single field without touching a per-hour record.
+    """
+
+    times: list[datetime] = Field(default_factory=list)
+    altitudes: list[float] = Field(default_factory=list)
+    azimuths: list[float] = Field(default_factory=list)
+    airmasses: list[float] = Field(default_factory=list)
+    is_visible: list[bool] = Field(default_factory=list)
+    scores: list[float] = Field(default_factory=list)
+    is_night: list[bool] = Field(default_factory=list)
+    cloud_cover: list[float] = Field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def visible_indices(self) -> list[int]:
+        """Get indices of entries where the target is above the horizon."""
+        return [i for i, visible in enumerate(self.is_visible) if visible]
+
+    def best_index(self) -> int | None:
+        """Get the index of the lowest-airmass visible night entry."""
+        airmasses = self.airmasses
+        night = self.is_night
+        candidates = [i for i in self.visible_indices() if night[i]]
+        if not candidates:
+            return None
+        return min(candidates, key=airmasses.__getitem__)
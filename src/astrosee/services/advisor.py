@@ -1,11 +1,14 @@
 """Equipment and activity advisor service."""
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
+from operator import attrgetter
 
 from astrosee.astronomy.calculator import AstronomyCalculator
 from astrosee.astronomy.catalog import CelestialCatalog
-from astrosee.astronomy.models import Location
+from astrosee.astronomy.models import Location, ObjectType
 from astrosee.scoring.models import SeeingReport
 
 
@@ -42,6 +45,88 @@ ACTIVITY_PROFILES = {
 }
 
 
+# Rating bands for activity scores (threshold = inclusive lower bound)
+_ACTIVITY_RATING_THRESHOLDS = (40, 55, 70, 85)
+_ACTIVITY_RATINGS = ("Poor", "Fair", "Good", "Very Good", "Excellent")
+
+# Activities whose score is reduced by moonlight
+_MOON_SENSITIVE_ACTIVITIES = frozenset({"deep_sky_imaging", "widefield"})
+
+# ACTIVITY_PROFILES flattened once into the positional arguments of
+# _score_activity, so scoring does no per-activity dict lookups
+_ACTIVITY_TABLE = tuple(
+    (
+        activity,
+        profile["wind_tolerance"],
+        profile["moon_tolerance"],
+        profile["cloud_max"],
+        profile["ideal_score"],
+        activity in _MOON_SENSITIVE_ACTIVITIES,
+    )
+    for activity, profile in ACTIVITY_PROFILES.items()
+)
+
+
+def _score_activity(
+    base_score: float,
+    wind: float,
+    moon_illum: float,
+    moon_alt: float,
+    clouds: float,
+    wind_tolerance: float,
+    moon_tolerance: float,
+    cloud_max: float,
+    ideal_score: float,
+    moon_sensitive: bool,
+) -> tuple[float, list[str]]:
+    """Calculate suitability score for an activity.
+
+    Args:
+        base_score: Overall seeing score
+        wind: Surface wind speed in m/s
+        moon_illum: Moon illumination fraction (0-1)
+        moon_alt: Moon altitude in degrees
+        clouds: Cloud cover percentage
+        wind_tolerance: Activity wind tolerance in m/s
+        moon_tolerance: Activity moon illumination tolerance (0-1)
+        cloud_max: Activity maximum cloud cover percentage
+        ideal_score: Score at which conditions count as ideal
+        moon_sensitive: Whether moonlight affects the activity
+
+    Returns:
+        Tuple of (score, list of issues)
+    """
+    issues = []
+    multiplier = 1.0
+
+    # Wind penalty
+    if wind > wind_tolerance:
+        over = (wind - wind_tolerance) / wind_tolerance
+        multiplier *= max(0.3, 1 - over * 0.5)
+        issues.append(f"Wind {wind:.1f} m/s exceeds ideal")
+
+    # Moon penalty for deep-sky activities
+    if moon_sensitive and moon_alt > 0 and moon_illum > moon_tolerance:
+        penalty = (moon_illum - moon_tolerance) * 0.5
+        multiplier *= max(0.5, 1 - penalty)
+        issues.append(f"Moon {int(moon_illum * 100)}% may interfere")
+
+    # Cloud penalty
+    if clouds > cloud_max:
+        over = (clouds - cloud_max) / 100
+        multiplier *= max(0.2, 1 - over)
+        issues.append(f"Cloud cover {clouds:.0f}% limits visibility")
+
+    # Calculate final score
+    final = base_score * multiplier
+
+    # Boost if conditions are ideal
+    if base_score >= ideal_score and not issues:
+        final = min(100, final * 1.1)
+
+    return final, issues
+
+
 @dataclass
 class ActivityRecommendation:
     """Recommendation for an activity type."""
@@ -52,13 +137,24 @@ class ActivityRecommendation:
     issues: list[str] = field(default_factory=list)
 
 
+class SuggestionPriority(IntEnum):
+    """Priority of an equipment suggestion (lower sorts first)."""
+
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+
+
 @dataclass
 class EquipmentSuggestion:
     """Equipment or technique suggestion."""
 
     icon: str
     text: str
-    priority: str  # high, medium, low
+    priority: SuggestionPriority
+
+
+_BY_PRIORITY = attrgetter("priority")
 
 
 @dataclass
@@ -101,10 +197,19 @@ class AdvisorService:
         Returns:
             List of activity recommendations sorted by score
         """
+        # Read the conditions once; every activity is scored against them
+        base_score = report.score.total_score
+        wind = report.weather.wind_speed_10m
+        moon_illum = report.astronomy.moon_illumination / 100
+        moon_alt = report.astronomy.moon_altitude
+        clouds = report.weather.cloud_cover
+
         recommendations = []
 
-        for activity, profile in ACTIVITY_PROFILES.items():
-            score, issues = self._calculate_activity_score(report, activity, profile)
+        for activity, *profile in _ACTIVITY_TABLE:
+            score, issues = _score_activity(
+                base_score, wind, moon_illum, moon_alt, clouds, *profile
+            )
             rating = self._score_to_rating(score)
             recommendations.append(
                 ActivityRecommendation(
@@ -119,58 +224,6 @@ class AdvisorService:
         recommendations.sort(key=lambda r: r.score, reverse=True)
         return recommendations
 
-    def _calculate_activity_score(
-        self,
-        report: SeeingReport,
-        activity: str,
-        profile: dict,
-    ) -> tuple[float, list[str]]:
-        """Calculate suitability score for an activity.
-
-        Args:
-            report: Seeing report
-            activity: Activity type
-            profile: Activity profile with requirements
-
-        Returns:
-            Tuple of (score, list of issues)
-        """
-        base_score = report.score.total_score
-        issues = []
-        multiplier = 1.0
-
-        # Wind penalty
-        wind = report.weather.wind_speed_10m or 0
-        if wind > profile["wind_tolerance"]:
-            over = (wind - profile["wind_tolerance"]) / profile["wind_tolerance"]
-            multiplier *= max(0.3, 1 - over * 0.5)
-            issues.append(f"Wind {wind:.1f} m/s exceeds ideal")
-
-        # Moon penalty for deep-sky activities
-        if activity in ("deep_sky_imaging", "widefield"):
-            moon_illum = report.astronomy.moon_illumination / 100
-            moon_alt = report.astronomy.moon_altitude
-            if moon_alt > 0 and moon_illum > profile["moon_tolerance"]:
-                penalty = (moon_illum - profile["moon_tolerance"]) * 0.5
-                multiplier *= max(0.5, 1 - penalty)
-                issues.append(f"Moon {int(moon_illum * 100)}% may interfere")
-
-        # Cloud penalty
-        clouds = report.weather.cloud_cover or 0
-        if clouds > profile["cloud_max"]:
-            over = (clouds - profile["cloud_max"]) / 100
-            multiplier *= max(0.2, 1 - over)
-            issues.append(f"Cloud cover {clouds:.0f}% limits visibility")
-
-        # Calculate final score
-        final = base_score * multiplier
-
-        # Boost if conditions are ideal
-        if base_score >= profile["ideal_score"] and not issues:
-            final = min(100, final * 1.1)
-
-        return final, issues
-
     def _score_to_rating(self, score: float) -> str:
         """Convert score to rating text.
 
@@ -180,16 +233,7 @@ class AdvisorService:
         Returns:
             Rating text
         """
-        if score >= 85:
-            return "Excellent"
-        elif score >= 70:
-            return "Very Good"
-        elif score >= 55:
-            return "Good"
-        elif score >= 40:
-            return "Fair"
-        else:
-            return "Poor"
+        return _ACTIVITY_RATINGS[bisect_right(_ACTIVITY_RATING_THRESHOLDS, score)]
 
     def get_equipment_suggestions(
         self,
@@ -213,7 +257,7 @@ class AdvisorService:
                 EquipmentSuggestion(
                     icon="🌡️",
                     text="High dew risk - use dew heaters on optics",
-                    priority="high",
+                    priority=SuggestionPriority.HIGH,
                 )
             )
         elif temp_diff < 5:
@@ -221,18 +265,18 @@ class AdvisorService:
                 EquipmentSuggestion(
                     icon="💧",
                     text="Moderate dew risk - have dew shields ready",
-                    priority="medium",
+                    priority=SuggestionPriority.MEDIUM,
                 )
             )
 
         # Wind conditions
-        wind = weather.wind_speed_10m or 0
+        wind = weather.wind_speed_10m
         if wind > 8:
             suggestions.append(
                 EquipmentSuggestion(
                     icon="💨",
                     text=f"Strong wind ({wind:.0f} m/s) - use wind shields",
-                    priority="high",
+                    priority=SuggestionPriority.HIGH,
                 )
             )
         elif wind > 5:
@@ -240,7 +284,7 @@ class AdvisorService:
                 EquipmentSuggestion(
                     icon="🌬️",
                     text="Moderate wind - vibration damping recommended",
-                    priority="medium",
+                    priority=SuggestionPriority.MEDIUM,
                 )
             )
         elif wind < 2:
@@ -248,7 +292,7 @@ class AdvisorService:
                 EquipmentSuggestion(
                     icon="✨",
                     text="Calm conditions - ideal for high magnification",
-                    priority="low",
+                    priority=SuggestionPriority.LOW,
                 )
             )
 
@@ -259,7 +303,7 @@ class AdvisorService:
                 EquipmentSuggestion(
                     icon="💦",
                     text="Very high humidity - protect mirrors and lenses",
-                    priority="high",
+                    priority=SuggestionPriority.HIGH,
                 )
             )
         elif humidity < 40:
@@ -267,7 +311,7 @@ class AdvisorService:
                 EquipmentSuggestion(
                     icon="🌙",
                     text="Low humidity - excellent optical conditions",
-                    priority="low",
+                    priority=SuggestionPriority.LOW,
                 )
             )
 
@@ -279,7 +323,7 @@ class AdvisorService:
                 EquipmentSuggestion(
                     icon="🌑",
                     text="Moon below horizon - perfect for deep-sky",
-                    priority="low",
+                    priority=SuggestionPriority.LOW,
                 )
             )
         elif moon_illum > 70:
@@ -287,24 +331,23 @@ class AdvisorService:
                 EquipmentSuggestion(
                     icon="🌕",
                     text=f"Bright moon ({moon_illum:.0f}%) - use narrowband filters",
-                    priority="medium",
+                    priority=SuggestionPriority.MEDIUM,
                 )
             )
 
         # Cloud cover
-        clouds = weather.cloud_cover or 0
+        clouds = weather.cloud_cover
         if clouds > 60:
             suggestions.append(
                 EquipmentSuggestion(
                     icon="☁️",
                     text="High cloud cover - monitor for clearing",
-                    priority="medium",
+                    priority=SuggestionPriority.MEDIUM,
                 )
             )
 
         # Sort by priority
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        suggestions.sort(key=lambda s: priority_order[s.priority])
+        suggestions.sort(key=_BY_PRIORITY)
 
         return suggestions
 
@@ -339,28 +382,35 @@ class AdvisorService:
         moon_illum = report.astronomy.moon_illumination
         base_score = report.score.total_score
 
-        for obj, altitude, _ in visible[:20]:  # Check top 20 by altitude
+        # The moon penalty only depends on the report, not the target
+        deep_sky_moon_factor = 1.0
+        if moon_illum > 50 and report.astronomy.moon_altitude > 0:
+            deep_sky_moon_factor = max(0.5, 1 - moon_illum / 200)
+
+        candidates = visible[:20]  # Check top 20 by altitude
+        airmasses = self.calculator.get_airmasses([alt for _, alt, _ in candidates])
+
+        for (obj, altitude, _), airmass in zip(candidates, airmasses):
             # Calculate target-specific score
             score = base_score
 
             # Airmass penalty
-            airmass = self.calculator.get_airmass(altitude)
             if airmass > 2.0:
                 score *= 0.8
             elif airmass > 1.5:
                 score *= 0.9
 
             # Deep-sky moon penalty
-            if obj.is_deep_sky and moon_illum > 50:
-                if report.astronomy.moon_altitude > 0:
-                    score *= max(0.5, 1 - moon_illum / 200)
+            is_deep_sky = obj.is_deep_sky
+            if is_deep_sky and deep_sky_moon_factor < 1.0:
+                score *= deep_sky_moon_factor
 
-            # Determine best activity type
-            obj_type = obj.object_type.value if hasattr(obj.object_type, "value") else str(obj.object_type)
-            if obj_type == "planet":
+            # Determine best activity type (object_type is always an ObjectType)
+            obj_type = obj.object_type
+            if obj_type is ObjectType.PLANET:
                 activity = "planetary"
-            elif obj.is_deep_sky:
-                if obj_type in ("galaxy", "nebula"):
+            elif is_deep_sky:
+                if obj_type is ObjectType.GALAXY or obj_type is ObjectType.NEBULA:
                     activity = "deep_sky"
                 else:
                     activity = "visual"
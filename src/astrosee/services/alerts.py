@@ -1,14 +1,114 @@
 """Alert service for notifications."""
 
+import ast
 import logging
 import re
 import subprocess
+from collections.abc import Callable
 from datetime import datetime
 
 from astrosee.scoring.models import SeeingReport
 
 logger = logging.getLogger(__name__)
 
+# Variables available to alert conditions
+_CONDITION_VARIABLES = (
+    "score",
+    "cloud_cover",
+    "wind_speed",
+    "humidity",
+    "temperature",
+    "moon_illumination",
+    "moon_altitude",
+)
+
+# Conditions may only contain these variables, comparison/boolean operators,
+# numbers and parentheses
+_CONDITION_ALLOWED = "|".join((*_CONDITION_VARIABLES, r"[<>=!]+|and|or|not", r"\d+\.?\d*"))
+_CONDITION_PATTERN = re.compile(
+    rf"^[\s()*]*({_CONDITION_ALLOWED}|[\s()])+[\s)]*$",
+    re.IGNORECASE,
+)
+
+# AST nodes a condition may contain once parsed
+_CONDITION_NODES = (
+    ast.Expression,
+    ast.BoolOp,
+    ast.And,
+    ast.Or,
+    ast.UnaryOp,
+    ast.Not,
+    ast.Compare,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+    ast.Name,
+    ast.Load,
+    ast.Constant,
+)
+
+ConditionPredicate = Callable[..., bool]
+
+
+def _compile_condition(condition: str) -> ConditionPredicate:
+    """Compile a condition into a predicate over the condition variables.
+
+    The condition is parsed once and checked against an allow-list of AST
+    nodes and variable names, then compiled into a function taking the
+    variables positionally in _CONDITION_VARIABLES order.
+
+    Args:
+        condition: Condition string
+
+    Returns:
+        Predicate function
+
+    Raises:
+        ValueError: If the condition uses anything outside the allowed syntax
+    """
+    try:
+        tree = ast.parse(condition.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid condition syntax: {condition}") from e
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _CONDITION_NODES):
+            raise ValueError(f"Invalid condition syntax: {condition}")
+        if isinstance(node, ast.Name) and node.id not in _CONDITION_VARIABLES:
+            raise ValueError(f"Unknown variable '{node.id}' in condition: {condition}")
+
+    predicate = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=name) for name in _CONDITION_VARIABLES],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=tree.body,
+        )
+    )
+    ast.fix_missing_locations(predicate)
+    return eval(compile(predicate, "<alert>", "eval"), {"__builtins__": {}})
+
+
+def _applescript_string(text: str) -> str:
+    """Quote text as an AppleScript string literal.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Double-quoted literal with backslashes, quotes and newlines escaped
+    """
+    escaped = text.replace("\\", "\\\\").replace('"', '\\"')
+    single_line = " ".join(escaped.splitlines())
+    return f'"{single_line}"'
+
 
 class AlertService:
     """Service for managing and triggering alerts."""
@@ -16,6 +116,10 @@ class AlertService:
     def __init__(self):
         """Initialize alert service."""
         self._alerts: list[dict] = []
+        # Compiled condition per alert (None if the condition is invalid)
+        self._predicates: list[ConditionPredicate | None] = []
+        # Enabled alerts with a valid condition, the only ones evaluate checks
+        self._active: list[tuple[dict, ConditionPredicate]] = []
 
     def add_alert(
         self,
@@ -40,6 +144,31 @@ class AlertService:
             "enabled": enabled,
             "notify": notify,
         })
+        self._predicates.append(self._compile(condition))
+        self._rebuild_active()
+
+    def _rebuild_active(self) -> None:
+        """Rebuild the list of alerts that evaluate needs to check."""
+        self._active = [
+            (alert, predicate)
+            for alert, predicate in zip(self._alerts, self._predicates)
+            if predicate is not None and alert.get("enabled", True)
+        ]
+
+    def _compile(self, condition: str) -> ConditionPredicate | None:
+        """Compile a condition, logging and returning None if it is invalid.
+
+        Args:
+            condition: Condition string
+
+        Returns:
+            Predicate function, or None if the condition cannot be compiled
+        """
+        try:
+            return _compile_condition(self._sanitize_condition(condition))
+        except ValueError as e:
+            logger.warning(f"Failed to compile condition '{condition}': {e}")
+            return None
 
     def remove_alert(self, index: int) -> bool:
         """Remove an alert by index.
@@ -52,6 +181,8 @@ class AlertService:
         """
         if 0 <= index < len(self._alerts):
             self._alerts.pop(index)
+            self._predicates.pop(index)
+            self._rebuild_active()
             return True
         return False
 
@@ -64,109 +195,121 @@ class AlertService:
         Returns:
             List of triggered alerts
         """
+        if not self._active:
+            return []
+
         triggered = []
+        notify_conditions = []
 
-        for alert in self._alerts:
-            if not alert.get("enabled", True):
-                continue
+        # Every alert sees the same values, so read them from the report once
+        values = self._condition_values(report)
 
+        for alert, predicate in self._active:
             condition = alert.get("condition", "")
-            if self._evaluate_condition(condition, report):
+            if self._evaluate_condition(predicate, condition, values):
                 triggered.append(alert)
 
                 if alert.get("notify", True):
-                    self._send_notification(report, condition)
+                    notify_conditions.append(condition)
+
+        if notify_conditions:
+            self._send_notifications(report, notify_conditions)
 
         return triggered
 
+    def _condition_values(self, report: SeeingReport) -> tuple[float, ...]:
+        """Get the condition variable values from a report.
+
+        Args:
+            report: Report to read
+
+        Returns:
+            Values in _CONDITION_VARIABLES order
+        """
+        return (
+            report.score.total_score,
+            report.weather.cloud_cover,
+            report.weather.wind_speed_10m,
+            report.weather.humidity,
+            report.weather.temperature,
+            report.astronomy.moon_illumination,
+            report.astronomy.moon_altitude,
+        )
+
     def _evaluate_condition(
         self,
+        predicate: ConditionPredicate | None,
         condition: str,
-        report: SeeingReport,
+        values: tuple[float, ...],
     ) -> bool:
-        """Evaluate a condition expression.
+        """Evaluate a compiled condition.
 
         Args:
-            condition: Condition string
-            report: Report to evaluate against
+            predicate: Compiled condition (None if it failed to compile)
+            condition: Condition string, for logging
+            values: Condition variable values from _condition_values
 
         Returns:
             True if condition is met
         """
-        # Build evaluation context
-        context = {
-            "score": report.score.total_score,
-            "cloud_cover": report.weather.cloud_cover,
-            "wind_speed": report.weather.wind_speed_10m,
-            "humidity": report.weather.humidity,
-            "temperature": report.weather.temperature,
-            "moon_illumination": report.astronomy.moon_illumination,
-            "moon_altitude": report.astronomy.moon_altitude,
-        }
+        if predicate is None:
+            return False
 
         try:
-            # Simple and safe evaluation
-            # Only allow specific operators and variable names
-            safe_condition = self._sanitize_condition(condition, context)
-            return eval(safe_condition, {"__builtins__": {}}, context)
+            return predicate(*values)
         except Exception as e:
             logger.warning(f"Failed to evaluate condition '{condition}': {e}")
             return False
 
-    def _sanitize_condition(
-        self,
-        condition: str,
-        context: dict,
-    ) -> str:
+    def _sanitize_condition(self, condition: str) -> str:
         """Sanitize condition for safe evaluation.
 
         Args:
             condition: Raw condition string
-            context: Available variables
 
         Returns:
             Sanitized condition string
         """
-        # Only allow these patterns
-        allowed_vars = "|".join(context.keys())
-        allowed_ops = r"[<>=!]+|and|or|not"
-        allowed_nums = r"\d+\.?\d*"
-
-        # Check that condition only contains allowed elements
-        pattern = rf"^[\s()*]*({allowed_vars}|{allowed_ops}|{allowed_nums}|[\s()])+[\s)]*$"
-        if not re.match(pattern, condition, re.IGNORECASE):
+        if not _CONDITION_PATTERN.match(condition):
             raise ValueError(f"Invalid condition syntax: {condition}")
 
         return condition
 
-    def _send_notification(
+    def _send_notifications(
         self,
         report: SeeingReport,
-        condition: str,
+        conditions: list[str],
     ) -> None:
-        """Send macOS notification.
+        """Send macOS notifications, one per met condition.
+
+        All notifications go out through a single osascript call.
 
         Args:
-            report: Report that triggered alert
-            condition: Condition that was met
+            report: Report that triggered the alerts
+            conditions: Conditions that were met
         """
-        title = "Astrosee Alert"
+        title = _applescript_string("Astrosee Alert")
         message = (
             f"Seeing score: {report.score.total_score:.0f} "
             f"({report.score.rating}) at {report.location.name}"
         )
-        subtitle = f"Condition met: {condition}"
+        quoted_message = _applescript_string(message)
 
         try:
-            script = f'''
-            display notification "{message}" with title "{title}" subtitle "{subtitle}"
-            '''
+            lines = []
+            for condition in conditions:
+                subtitle = _applescript_string(f"Condition met: {condition}")
+                lines.append(
+                    f"display notification {quoted_message} "
+                    f"with title {title} subtitle {subtitle}"
+                )
+            script = "\n".join(lines)
             subprocess.run(
                 ["osascript", "-e", script],
                 capture_output=True,
                 timeout=5,
             )
-            logger.info(f"Sent notification: {message}")
+            logger.info(f"Sent {len(conditions)} notification(s): {message}")
         except Exception as e:
             logger.warning(f"Failed to send notification: {e}")
 
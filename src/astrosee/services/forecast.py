@@ -1,12 +1,23 @@
 """Forecast analysis service."""
 
-import statistics
-from datetime import datetime, timedelta, timezone
+import asyncio
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from operator import attrgetter
 
 from astrosee.astronomy.models import Location
-from astrosee.scoring.models import LocationComparison, ObservingWindow, SeeingForecast, SeeingReport
+from astrosee.scoring.models import (
+    LocationComparison,
+    ObservingWindow,
+    SeeingForecast,
+    SeeingReport,
+    TargetVisibility,
+)
 from astrosee.services.seeing import SeeingService
 
+# Maximum locations fetched at once, to stay within weather API rate limits
+MAX_CONCURRENT_LOCATIONS = 8
+
 
 class ForecastService:
     """Service for forecast analysis and optimization."""
@@ -58,7 +69,7 @@ class ForecastService:
             return None
 
         # Find best window by average score
-        best_window = max(windows, key=lambda w: w.average_score)
+        best_window = max(windows, key=attrgetter("average_score"))
 
         return best_window
 
@@ -79,29 +90,21 @@ class ForecastService:
         if not forecasts:
             return []
 
-        windows = []
-        current_window: list[SeeingForecast] = []
-
-        for i, f in enumerate(forecasts):
-            if not current_window:
-                current_window.append(f)
-                continue
-
-            # Check if contiguous (within 2 hours)
-            time_diff = f.timestamp - current_window[-1].timestamp
-            if time_diff <= timedelta(hours=2):
-                current_window.append(f)
-            else:
-                # Save current window if long enough
-                if len(current_window) >= min_hours:
-                    windows.append(self._create_window(current_window))
-                current_window = [f]
-
-        # Don't forget the last window
-        if len(current_window) >= min_hours:
-            windows.append(self._create_window(current_window))
+        # Split wherever consecutive entries are more than 2 hours apart
+        max_gap = timedelta(hours=2)
+        timestamps = [f.timestamp for f in forecasts]
+        starts = [0]
+        starts.extend(
+            i for i in range(1, len(timestamps))
+            if timestamps[i] - timestamps[i - 1] > max_gap
+        )
+        ends = starts[1:] + [len(forecasts)]
 
-        return windows
+        return [
+            self._create_window(forecasts[start:end])
+            for start, end in zip(starts, ends)
+            if end - start >= min_hours
+        ]
 
     def _create_window(
         self,
@@ -116,9 +119,9 @@ class ForecastService:
             ObservingWindow
         """
         scores = [f.score.total_score for f in forecasts]
-        avg_score = statistics.mean(scores)
-        peak_score = max(scores)
-        peak_idx = scores.index(peak_score)
+        avg_score = sum(scores) / len(scores)
+        peak_idx = max(range(len(scores)), key=scores.__getitem__)
+        peak_score = scores[peak_idx]
 
         return ObservingWindow(
             start=forecasts[0].timestamp,
@@ -146,10 +149,15 @@ class ForecastService:
         if time is None:
             time = datetime.now(timezone.utc)
 
-        reports = []
-        for loc in locations:
-            report = await self.seeing.get_current_conditions(loc)
-            reports.append(report)
+        # Locations are independent, so fetch and score them concurrently,
+        # a bounded number at a time
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_LOCATIONS)
+
+        async def fetch(loc: Location) -> SeeingReport:
+            async with semaphore:
+                return await self.seeing.get_current_conditions(loc, time=time)
+
+        reports = list(await asyncio.gather(*(fetch(loc) for loc in locations)))
 
         return LocationComparison(
             timestamp=time,
@@ -177,28 +185,29 @@ class ForecastService:
         forecasts = await self.seeing.get_forecast(location, hours)
 
         # Group by night
-        nights: dict[str, list[SeeingForecast]] = {}
+        nights: defaultdict[date, list[SeeingForecast]] = defaultdict(list)
         for f in forecasts:
-            if not f.is_night:
-                continue
-            night_key = f.timestamp.strftime("%Y-%m-%d")
-            if night_key not in nights:
-                nights[night_key] = []
-            nights[night_key].append(f)
+            if f.is_night:
+                nights[f.timestamp.date()].append(f)
 
         # Calculate average score per night
         results = []
-        for night_key, night_forecasts in nights.items():
-            if not night_forecasts:
-                continue
-
-            avg_score = statistics.mean(f.score.total_score for f in night_forecasts)
+        for night, night_forecasts in nights.items():
+            # Accumulate score, cloud and wind in a single pass
+            score_sum = cloud_sum = wind_sum = 0.0
+            for f in night_forecasts:
+                score_sum += f.score.total_score
+                cloud_sum += f.weather.cloud_cover
+                wind_sum += f.weather.wind_speed_10m
+
+            count = len(night_forecasts)
+            avg_score = score_sum / count
             if avg_score < min_score:
                 continue
 
             # Generate summary
-            cloud_avg = statistics.mean(f.weather.cloud_cover for f in night_forecasts)
-            wind_avg = statistics.mean(f.weather.wind_speed_10m for f in night_forecasts)
+            cloud_avg = cloud_sum / count
+            wind_avg = wind_sum / count
 
             summary_parts = []
             if avg_score >= 80:
@@ -220,7 +229,7 @@ class ForecastService:
             elif wind_avg < 7:
                 summary_parts.append("light wind")
 
-            night_date = datetime.strptime(night_key, "%Y-%m-%d")
+            night_date = datetime.combine(night, datetime.min.time())
             results.append((night_date, avg_score, ". ".join(summary_parts)))
 
         # Sort by score
@@ -233,7 +242,7 @@ class ForecastService:
         location: Location,
         target_name: str,
         hours: int = 24,
-    ) -> list[dict]:
+    ) -> TargetVisibility:
         """Get target visibility over time.
 
         Args:
@@ -242,29 +251,28 @@ class ForecastService:
             hours: Hours to analyze
 
         Returns:
-            List of dicts with time, altitude, airmass, score
+            TargetVisibility with time, altitude, airmass and score columns
+            (empty if the target is not found)
         """
+        visibility = TargetVisibility()
+
         target = self.seeing.catalog.search(target_name)
         if not target:
-            return []
+            return visibility
 
-        forecasts = await self.seeing.get_forecast(location, hours, target=target)
-
-        results = []
-        for f in forecasts:
-            pos = self.seeing.astronomy.get_target_position(
-                target, location, f.timestamp
-            )
-
-            results.append({
-                "time": f.timestamp,
-                "altitude": pos.altitude,
-                "azimuth": pos.azimuth,
-                "airmass": pos.airmass,
-                "is_visible": pos.is_visible,
-                "score": f.score.total_score,
-                "is_night": f.is_night,
-                "cloud_cover": f.weather.cloud_cover,
-            })
+        # Reuse the positions computed to score the forecast
+        forecasts, positions = await self.seeing.get_forecast_with_positions(
+            location, hours, target=target
+        )
 
-        return results
+        for f, pos in zip(forecasts, positions):
+            visibility.times.append(f.timestamp)
+            visibility.altitudes.append(pos.altitude)
+            visibility.azimuths.append(pos.azimuth)
+            visibility.airmasses.append(pos.airmass)
+            visibility.is_visible.append(pos.is_visible)
+            visibility.scores.append(f.score.total_score)
+            visibility.is_night.append(f.is_night)
+            visibility.cloud_cover.append(f.weather.cloud_cover)
+
+        return visibility
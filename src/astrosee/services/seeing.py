@@ -1,11 +1,12 @@
 """Main seeing service - orchestrates weather, astronomy, and scoring."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 
 from astrosee.astronomy.calculator import AstronomyCalculator
 from astrosee.astronomy.catalog import CelestialCatalog
-from astrosee.astronomy.models import CelestialObject, Location
+from astrosee.astronomy.models import CelestialObject, Location, TargetPosition
 from astrosee.core.exceptions import WeatherAPIError
 from astrosee.scoring.engine import ScoringEngine
 from astrosee.scoring.models import SeeingForecast, SeeingReport
@@ -16,6 +17,9 @@ from astrosee.weather.openmeteo import OpenMeteoClient
 
 logger = logging.getLogger(__name__)
 
+# How long a fetched forecast is reused for repeated requests
+FORECAST_CACHE_TTL_MINUTES = 15
+
 
 class SeeingService:
     """Main service for seeing predictions.
@@ -54,7 +58,11 @@ class SeeingService:
         self.cache_ttl = cache_ttl_hours
 
     async def close(self) -> None:
-        """Close all clients."""
+        """Close all clients.
+
+        The loop's shared HTTP client is left open for other users of the
+        loop; its owner closes it with close_shared_client().
+        """
         await self.weather_client.close()
         await self.gfs_client.close()
         if self.cache:
@@ -64,17 +72,20 @@ class SeeingService:
         self,
         location: Location,
         target: CelestialObject | str | None = None,
+        time: datetime | None = None,
     ) -> SeeingReport:
         """Get current seeing conditions.
 
         Args:
             location: Observer location
             target: Optional target object (name string or CelestialObject)
+            time: Time of the report (default: now); pass one shared time
+                to make reports for several locations directly comparable
 
         Returns:
             SeeingReport with current conditions
         """
-        now = datetime.now(timezone.utc)
+        now = time if time is not None else datetime.now(timezone.utc)
 
         # Resolve target if string
         target_obj = None
@@ -83,18 +94,13 @@ class SeeingService:
         elif isinstance(target, CelestialObject):
             target_obj = target
 
-        # Get weather data (with caching)
-        weather = await self._get_weather(location, now)
-
-        # Get jet stream data (best effort)
-        try:
-            jet_speed = await self.gfs_client.get_jet_stream_speed(
-                location.latitude, location.longitude, now
-            )
-            if jet_speed is not None:
-                weather = weather.model_copy(update={"jet_stream_speed": jet_speed})
-        except Exception as e:
-            logger.debug(f"Failed to get jet stream data: {e}")
+        # Get weather data (with caching) and jet stream data concurrently
+        weather, jet_speed = await asyncio.gather(
+            self._get_weather(location, now),
+            self._get_jet_stream_speed(location, now),
+        )
+        if jet_speed is not None:
+            weather = weather.model_copy(update={"jet_stream_speed": jet_speed})
 
         # Get astronomy data
         astronomy_data = self.astronomy.get_astronomy_data(location, now)
@@ -146,6 +152,26 @@ class SeeingService:
         Returns:
             List of hourly forecasts
         """
+        forecasts, _ = await self.get_forecast_with_positions(location, hours, target)
+        return forecasts
+
+    async def get_forecast_with_positions(
+        self,
+        location: Location,
+        hours: int = 48,
+        target: CelestialObject | str | None = None,
+    ) -> tuple[list[SeeingForecast], list[TargetPosition]]:
+        """Get seeing forecast along with the target positions used to score it.
+
+        Args:
+            location: Observer location
+            hours: Number of hours to forecast
+            target: Optional target object
+
+        Returns:
+            Tuple of (hourly forecasts, target position per hour); positions
+            are empty if no target was resolved
+        """
         # Resolve target
         target_obj = None
         if isinstance(target, str):
@@ -158,31 +184,29 @@ class SeeingService:
         # Get weather forecast
         weather_list = await self._get_weather_forecast(location, hours)
 
-        forecasts = []
-        for weather in weather_list:
-            # Calculate astronomy data for each hour
-            astronomy_data = self.astronomy.get_astronomy_data(
-                location, weather.timestamp
-            )
-
-            # Get airmass if target specified
-            airmass = None
-            if target_obj:
-                pos = self.astronomy.get_target_position(
-                    target_obj, location, weather.timestamp
-                )
-                airmass = pos.airmass
+        # Astronomy data for every hour in one ephemeris pass
+        times = [weather.timestamp for weather in weather_list]
+        astronomy_hours = self.astronomy.get_astronomy_data_batch(location, times)
 
-            # Calculate score
-            score = self.scoring.calculate_score(
-                weather,
-                moon_illumination=astronomy_data.moon_illumination,
-                moon_altitude=astronomy_data.moon_altitude,
-                airmass=airmass,
-                is_deep_sky=is_deep_sky,
-            )
+        # Get target positions (and airmass) if target specified
+        positions: list[TargetPosition] = []
+        airmasses = None
+        if target_obj:
+            positions = self.astronomy.get_target_positions(target_obj, location, times)
+            airmasses = [position.airmass for position in positions]
+
+        # Score the whole forecast in one batch
+        scores = self.scoring.calculate_scores(
+            weather_list,
+            moon_illumination=[a.moon_illumination for a in astronomy_hours],
+            moon_altitude=[a.moon_altitude for a in astronomy_hours],
+            airmass=airmasses,
+            is_deep_sky=is_deep_sky,
+        )
 
-            forecast = SeeingForecast(
+        # Every field comes from already-validated models, so skip revalidation
+        forecasts = [
+            SeeingForecast.model_construct(
                 timestamp=weather.timestamp,
                 score=score,
                 weather=weather,
@@ -190,9 +214,10 @@ class SeeingService:
                 moon_altitude=astronomy_data.moon_altitude,
                 is_night=astronomy_data.is_astronomical_night,
             )
-            forecasts.append(forecast)
+            for weather, astronomy_data, score in zip(weather_list, astronomy_hours, scores)
+        ]
 
-        return forecasts
+        return forecasts, positions
 
     async def _get_weather(
         self,
@@ -243,6 +268,59 @@ class SeeingService:
 
             raise
 
+    async def _get_jet_stream_speed(
+        self,
+        location: Location,
+        time: datetime,
+    ) -> float | None:
+        """Get jet stream wind speed (best effort).
+
+        Args:
+            location: Location
+            time: Time for the data
+
+        Returns:
+            Wind speed in m/s at 250hPa, or None if unavailable
+        """
+        try:
+            data = await self._get_upper_atmosphere(location, hours=24)
+        except Exception as e:
+            logger.debug(f"Failed to get jet stream data: {e}")
+            return None
+
+        if not data:
+            return None
+        return NoaaGfsClient.closest_entry(data, time).get("wind_speed_250hpa")
+
+    async def _get_upper_atmosphere(
+        self,
+        location: Location,
+        hours: int,
+    ) -> list[dict]:
+        """Get GFS upper atmosphere data with caching.
+
+        Args:
+            location: Location
+            hours: Hours to forecast
+
+        Returns:
+            List of dicts with upper atmosphere data
+        """
+        lat, lon = location.latitude, location.longitude
+
+        if self.cache:
+            cached = await self.cache.get_upper_atmosphere(
+                lat, lon, hours, ttl_minutes=self.cache_ttl * 60
+            )
+            if cached:
+                logger.debug("Using cached upper atmosphere data")
+                return cached
+
+        data = await self.gfs_client.get_upper_atmosphere(lat, lon, hours)
+        if self.cache and data:
+            await self.cache.set_upper_atmosphere(lat, lon, hours, data)
+        return data
+
     async def _get_weather_forecast(
         self,
         location: Location,
@@ -259,13 +337,24 @@ class SeeingService:
         """
         lat, lon = location.latitude, location.longitude
 
-        # Fetch from API (caching forecast is more complex)
+        # Reuse a recent forecast for the same location and length
+        if self.cache:
+            cached = await self.cache.get_weather_forecast(
+                lat, lon, hours, ttl_minutes=FORECAST_CACHE_TTL_MINUTES
+            )
+            if cached:
+                logger.debug("Using cached forecast")
+                return cached
+
+        # Fetch from API
         try:
             forecast = await self.weather_client.get_forecast(lat, lon, hours)
 
-            # Cache all data points
+            # Cache the whole forecast and all data points in one commit
             if self.cache and forecast:
-                await self.cache.set_weather_batch(lat, lon, forecast)
+                async with self.cache.transaction():
+                    await self.cache.set_weather_forecast(lat, lon, hours, forecast)
+                    await self.cache.set_weather_batch(lat, lon, forecast)
 
             return forecast
 
@@ -1,13 +1,53 @@
 """Export observation sessions to various formats."""
 
 import csv
-import json
+from collections.abc import Iterator
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
+from typing import TextIO
+
+from pydantic_core import to_json, to_jsonable_python
 
 from astrosee.services.sessions.models import ObservationSession
 
+# CSV header rows
+_SESSION_HEADER = (
+    "session_id",
+    "start_time",
+    "end_time",
+    "duration_hours",
+    "location",
+    "latitude",
+    "longitude",
+    "initial_score",
+    "rating",
+    "targets_count",
+    "targets",
+    "equipment",
+    "notes",
+)
+_OBSERVATION_HEADER = (
+    "session_id",
+    "session_date",
+    "location",
+    "target_name",
+    "observed_at",
+    "quality_rating",
+    "altitude",
+    "azimuth",
+    "notes",
+)
+_WEATHER_HEADER = (
+    "session_id",
+    "timestamp",
+    "seeing_score",
+    "temperature",
+    "humidity",
+    "cloud_cover",
+    "wind_speed",
+)
+
 
 class SessionExporter:
     """Export observation sessions to JSON and CSV formats."""
@@ -20,21 +60,60 @@ class SessionExporter:
         """
         self.sessions = sessions
 
-    def to_json(self, indent: int = 2) -> str:
-        """Export sessions to JSON string.
+    @property
+    def sessions(self) -> list[ObservationSession]:
+        """Sessions to export."""
+        return self._sessions
+
+    @sessions.setter
+    def sessions(self, sessions: list[ObservationSession]) -> None:
+        self._sessions = sessions
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop cached export data after the sessions were modified in place."""
+        self._jsonable_sessions: list | None = None
+        self._session_rows: list[tuple] | None = None
+
+    def _get_jsonable_sessions(self) -> list:
+        """Get the sessions as JSON-compatible data, converting them once.
+
+        Returns:
+            Sessions as plain dicts/lists, reused by later JSON exports
+        """
+        if self._jsonable_sessions is None:
+            self._jsonable_sessions = to_jsonable_python(self._sessions)
+        return self._jsonable_sessions
+
+    def _to_json_bytes(self, indent: int) -> bytes:
+        """Serialize sessions to UTF-8 JSON bytes.
+
+        Sessions are converted by pydantic-core once per exporter and encoded
+        directly rather than re-encoded with the stdlib json module.
 
         Args:
             indent: JSON indentation level
 
         Returns:
-            JSON string of all sessions
+            JSON document as bytes
         """
         data = {
             "exported_at": datetime.now().isoformat(),
             "session_count": len(self.sessions),
-            "sessions": [s.model_dump(mode="json") for s in self.sessions],
+            "sessions": self._get_jsonable_sessions(),
         }
-        return json.dumps(data, indent=indent, default=str)
+        return to_json(data, indent=indent)
+
+    def to_json(self, indent: int = 2) -> str:
+        """Export sessions to JSON string.
+
+        Args:
+            indent: JSON indentation level
+
+        Returns:
+            JSON string of all sessions
+        """
+        return self._to_json_bytes(indent).decode("utf-8")
 
     def to_json_file(self, path: Path, indent: int = 2) -> None:
         """Export sessions to a JSON file.
@@ -43,8 +122,7 @@ class SessionExporter:
             path: Output file path
             indent: JSON indentation level
         """
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.to_json(indent))
+        path.write_bytes(self._to_json_bytes(indent))
 
     def to_csv(self) -> str:
         """Export sessions summary to CSV string.
@@ -53,31 +131,27 @@ class SessionExporter:
             CSV string with session summary
         """
         output = StringIO()
+        self._write_csv(output)
+        return output.getvalue()
+
+    def _write_csv(self, output: TextIO) -> None:
+        """Write session summary rows as CSV.
+
+        Args:
+            output: Text stream to write to
+        """
+        # Summary rows (with their target/equipment joins) are built once
+        if self._session_rows is None:
+            self._session_rows = list(self._iter_session_rows())
+
         writer = csv.writer(output)
+        writer.writerow(_SESSION_HEADER)
+        writer.writerows(self._session_rows)
 
-        # Header
-        writer.writerow([
-            "session_id",
-            "start_time",
-            "end_time",
-            "duration_hours",
-            "location",
-            "latitude",
-            "longitude",
-            "initial_score",
-            "rating",
-            "targets_count",
-            "targets",
-            "equipment",
-            "notes",
-        ])
-
-        # Data rows
+    def _iter_session_rows(self) -> Iterator[tuple]:
+        """Yield one summary row per session."""
         for session in self.sessions:
-            targets = ", ".join(t.target_name for t in session.targets_observed)
-            equipment = ", ".join(session.equipment_used)
-
-            writer.writerow([
+            yield (
                 session.id,
                 session.start_time.isoformat(),
                 session.end_time.isoformat() if session.end_time else "",
@@ -88,12 +162,10 @@ class SessionExporter:
                 session.initial_conditions.total_score,
                 session.initial_conditions.rating,
                 session.target_count,
-                targets,
-                equipment,
+                ", ".join(t.target_name for t in session.targets_observed),
+                ", ".join(session.equipment_used),
                 session.notes.replace("\n", " | "),
-            ])
-
-        return output.getvalue()
+            )
 
     def to_csv_file(self, path: Path) -> None:
         """Export sessions summary to a CSV file.
@@ -102,7 +174,7 @@ class SessionExporter:
             path: Output file path
         """
         with open(path, "w", encoding="utf-8", newline="") as f:
-            f.write(self.to_csv())
+            self._write_csv(f)
 
     def to_observations_csv(self) -> str:
         """Export individual observations to CSV string.
@@ -111,37 +183,36 @@ class SessionExporter:
             CSV string with all observations
         """
         output = StringIO()
+        self._write_observations_csv(output)
+        return output.getvalue()
+
+    def _write_observations_csv(self, output: TextIO) -> None:
+        """Write observation rows as CSV.
+
+        Args:
+            output: Text stream to write to
+        """
         writer = csv.writer(output)
+        writer.writerow(_OBSERVATION_HEADER)
+        writer.writerows(self._iter_observation_rows())
 
-        # Header
-        writer.writerow([
-            "session_id",
-            "session_date",
-            "location",
-            "target_name",
-            "observed_at",
-            "quality_rating",
-            "altitude",
-            "azimuth",
-            "notes",
-        ])
-
-        # Data rows
+    def _iter_observation_rows(self) -> Iterator[tuple]:
+        """Yield one row per observed target across all sessions."""
         for session in self.sessions:
+            session_date = session.start_time.date().isoformat()
+            location_name = session.location.name
             for obs in session.targets_observed:
-                writer.writerow([
+                yield (
                     session.id,
-                    session.start_time.date().isoformat(),
-                    session.location.name,
+                    session_date,
+                    location_name,
                     obs.target_name,
                     obs.observed_at.isoformat(),
                     obs.quality_rating,
                     f"{obs.altitude:.1f}" if obs.altitude else "",
                     f"{obs.azimuth:.1f}" if obs.azimuth else "",
                     obs.notes,
-                ])
-
-        return output.getvalue()
+                )
 
     def to_observations_csv_file(self, path: Path) -> None:
         """Export individual observations to a CSV file.
@@ -150,7 +221,7 @@ class SessionExporter:
             path: Output file path
         """
         with open(path, "w", encoding="utf-8", newline="") as f:
-            f.write(self.to_observations_csv())
+            self._write_observations_csv(f)
 
     def to_weather_csv(self) -> str:
         """Export weather snapshots to CSV string.
@@ -159,23 +230,24 @@ class SessionExporter:
             CSV string with weather data
         """
         output = StringIO()
+        self._write_weather_csv(output)
+        return output.getvalue()
+
+    def _write_weather_csv(self, output: TextIO) -> None:
+        """Write weather snapshot rows as CSV.
+
+        Args:
+            output: Text stream to write to
+        """
         writer = csv.writer(output)
+        writer.writerow(_WEATHER_HEADER)
+        writer.writerows(self._iter_weather_rows())
 
-        # Header
-        writer.writerow([
-            "session_id",
-            "timestamp",
-            "seeing_score",
-            "temperature",
-            "humidity",
-            "cloud_cover",
-            "wind_speed",
-        ])
-
-        # Data rows
+    def _iter_weather_rows(self) -> Iterator[tuple]:
+        """Yield one row per weather snapshot across all sessions."""
         for session in self.sessions:
             for snapshot in session.weather_log:
-                writer.writerow([
+                yield (
                     session.id,
                     snapshot.timestamp.isoformat(),
                     snapshot.seeing_score,
@@ -183,9 +255,7 @@ class SessionExporter:
                     snapshot.humidity,
                     snapshot.cloud_cover,
                     snapshot.wind_speed,
-                ])
-
-        return output.getvalue()
+                )
 
     def to_weather_csv_file(self, path: Path) -> None:
         """Export weather snapshots to a CSV file.
@@ -194,4 +264,4 @@ class SessionExporter:
             path: Output file path
         """
         with open(path, "w", encoding="utf-8", newline="") as f:
-            f.write(self.to_weather_csv())
+            self._write_weather_csv(f)
@@ -1,17 +1,13 @@
 """Session and equipment management."""
 
-import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
-
-import tomli_w
+from pydantic import BaseModel, TypeAdapter
 
 from astrosee.astronomy.models import Location
 from astrosee.core.exceptions import AstroseeError
@@ -26,6 +22,13 @@ from astrosee.services.sessions.models import (
     WeatherSnapshot,
 )
 
+# Session cache version: the (mtime_ns, size) of the session file and of its
+# observation and weather logs (None if a log does not exist)
+_SessionVersion = tuple[tuple[int, int], tuple[int, int] | None, tuple[int, int] | None]
+
+# Validates a batch of session files in a single call
+_SESSIONS_ADAPTER = TypeAdapter(list[ObservationSession])
+
 
 class SessionError(AstroseeError):
     """Session-related errors."""
@@ -39,6 +42,13 @@ class SessionManager:
     DEFAULT_DIR = Path.home() / ".astrosee"
     SESSIONS_DIRNAME = "sessions"
     EQUIPMENT_FILENAME = "equipment.toml"
+    ACTIVE_SESSION_FILENAME = ".active_session"
+    OBSERVATIONS_LOG_SUFFIX = ".observations.jsonl"
+    WEATHER_LOG_SUFFIX = ".weather.jsonl"
+
+    # list_sessions reads more session files than this with a thread pool
+    PARALLEL_LOAD_THRESHOLD = 2
+    MAX_LOAD_WORKERS = 32
 
     def __init__(self, config_dir: Path | None = None):
         """Initialize session manager.
@@ -49,6 +59,11 @@ class SessionManager:
         self.config_dir = config_dir or self.DEFAULT_DIR
         self.sessions_dir = self.config_dir / self.SESSIONS_DIRNAME
         self.equipment_file = self.config_dir / self.EQUIPMENT_FILENAME
+        self._active_file = self.config_dir / self.ACTIVE_SESSION_FILENAME
+        # Loaded sessions keyed by ID, with the file versions they came from
+        self._cache: dict[str, tuple[_SessionVersion, ObservationSession]] = {}
+        # Loaded equipment with the file version it came from
+        self._equipment_cache: tuple[tuple[int, int], EquipmentCollection] | None = None
         self._ensure_dirs_exist()
 
     def _ensure_dirs_exist(self) -> None:
@@ -57,32 +72,117 @@ class SessionManager:
         self.sessions_dir.mkdir(exist_ok=True)
 
     @staticmethod
-    def _generate_session_id() -> str:
-        """Generate a session ID from current timestamp."""
-        return datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+    def _generate_session_id(now: datetime) -> str:
+        """Generate a session ID from the session start time."""
+        return now.isoformat(timespec="seconds").replace(":", "-")
 
     def _session_path(self, session_id: str) -> Path:
         """Get the file path for a session."""
         return self.sessions_dir / f"{session_id}.json"
 
+    def _obs_path(self, session_id: str) -> Path:
+        """Get the observation log path for a session."""
+        return self.sessions_dir / f"{session_id}{self.OBSERVATIONS_LOG_SUFFIX}"
+
+    def _weather_path(self, session_id: str) -> Path:
+        """Get the weather log path for a session."""
+        return self.sessions_dir / f"{session_id}{self.WEATHER_LOG_SUFFIX}"
+
+    @staticmethod
+    def _file_version(stat: os.stat_result) -> tuple[int, int]:
+        """Get the cache version of a session file from its stat result."""
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _optional_file_version(self, path: Path) -> tuple[int, int] | None:
+        """Get the cache version of a file, or None if it does not exist."""
+        try:
+            return self._file_version(path.stat())
+        except FileNotFoundError:
+            return None
+
+    def _session_version(self, session_id: str) -> _SessionVersion | None:
+        """Get the cache version of a session, or None if it does not exist."""
+        version = self._optional_file_version(self._session_path(session_id))
+        if version is None:
+            return None
+        return (
+            version,
+            self._optional_file_version(self._obs_path(session_id)),
+            self._optional_file_version(self._weather_path(session_id)),
+        )
+
+    @staticmethod
+    def _read_log(path: Path) -> list[bytes]:
+        """Read the JSON lines of a session log (empty if it does not exist)."""
+        try:
+            return [line for line in path.read_bytes().splitlines() if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _merge_logs(self, session: ObservationSession) -> None:
+        """Add the entries appended to a session's logs since its last save."""
+        for line in self._read_log(self._obs_path(session.id)):
+            session.add_target(TargetObservation.model_validate_json(line))
+        for line in self._read_log(self._weather_path(session.id)):
+            session.add_weather_snapshot(WeatherSnapshot.model_validate_json(line))
+
+    def _append_log(self, session: ObservationSession, path: Path, entry: BaseModel) -> None:
+        """Append an entry to a session log without rewriting the session file.
+
+        The caller adds the entry to the session once it has been written.
+        """
+        self._cache.pop(session.id, None)
+        with open(path, "ab") as f:
+            f.write(entry.model_dump_json(warnings=False).encode("utf-8") + b"\n")
+
     def _save_session(self, session: ObservationSession) -> None:
-        """Save a session to disk."""
+        """Save a session to disk.
+
+        Sessions only hold validated models, so serialization warnings are
+        not checked.
+
+        The session file holds every entry, so the appended logs are
+        compacted into it and removed.
+        """
         path = self._session_path(session.id)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(session.model_dump(mode="json"), f, indent=2, default=str)
+        # Drop the cached copy first so a failed write never leaves it stale
+        self._cache.pop(session.id, None)
+        # Write to a temporary file and swap it in, so a crash mid-write never
+        # leaves a truncated session file
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(session.model_dump_json(indent=2, warnings=False).encode("utf-8"))
+        os.replace(tmp_path, path)
+        self._obs_path(session.id).unlink(missing_ok=True)
+        self._weather_path(session.id).unlink(missing_ok=True)
+        self._cache[session.id] = ((self._file_version(path.stat()), None, None), session)
 
     def _load_session(self, session_id: str) -> ObservationSession | None:
-        """Load a session from disk."""
-        path = self._session_path(session_id)
-        if not path.exists():
+        """Load a session from disk, including entries in its logs.
+
+        Sessions are cached in memory and only re-read when their files
+        change. The returned session is shared with the cache, so changes
+        must be persisted through _save_session or _append_log.
+        """
+        version = self._session_version(session_id)
+        if version is None:
+            self._cache.pop(session_id, None)
             return None
+
+        cached = self._cache.get(session_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return ObservationSession.model_validate(data)
+            session = ObservationSession.model_validate_json(
+                self._session_path(session_id).read_bytes()
+            )
+            self._merge_logs(session)
         except Exception as e:
             raise SessionError(f"Failed to load session {session_id}: {e}") from e
 
+        self._cache[session_id] = (version, session)
+        return session
+
     # Session operations
 
     def start_session(
@@ -106,8 +206,8 @@ class SessionManager:
                 f"Session {active.id} is already active. End it first with 'session end'."
             )
 
-        session_id = self._generate_session_id()
         now = datetime.now()
+        session_id = self._generate_session_id(now)
 
         # Convert location
         session_location = SessionLocation(
@@ -135,39 +235,92 @@ class SessionManager:
         )
 
         self._save_session(session)
+        self._set_active_id(session.id)
         return session
 
-    def get_active_session(self) -> ObservationSession | None:
-        """Get the currently active session (if any)."""
+    def _set_active_id(self, session_id: str | None) -> None:
+        """Record the active session ID (empty file: no active session)."""
+        self._active_file.write_text(session_id or "", encoding="utf-8")
+
+    def _find_active_session(self) -> ObservationSession | None:
+        """Find the active session by scanning every session file."""
         for session_id in self.list_session_ids():
             session = self._load_session(session_id)
             if session and session.is_active:
                 return session
         return None
 
-    def end_session(self, session_id: str | None = None) -> ObservationSession:
-        """End a session.
+    def get_active_session(self) -> ObservationSession | None:
+        """Get the currently active session (if any)."""
+        try:
+            active_id = self._active_file.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            active_id = None
+
+        if active_id == "":
+            return None
+
+        if active_id is not None:
+            session = self._load_session(active_id)
+            if session and session.is_active:
+                return session
+
+        # Pointer missing (sessions from before it existed) or stale: scan
+        # once and rewrite it
+        session = self._find_active_session()
+        self._set_active_id(session.id if session else None)
+        return session
+
+    def _resolve_session(
+        self,
+        session_id: str | None,
+        require_active: bool = False,
+        no_active_message: str = "No active session.",
+    ) -> ObservationSession:
+        """Resolve the session a mutation applies to.
 
         Args:
-            session_id: Session to end (defaults to active session)
+            session_id: Session ID (defaults to the active session, found
+                through the active session pointer)
+            require_active: Raise if the session has already ended
+            no_active_message: Error message when there is no active session
 
         Returns:
-            The ended session
+            The session
+
+        Raises:
+            SessionError: If the session cannot be found or has ended
         """
         if session_id is None:
             session = self.get_active_session()
             if not session:
-                raise SessionError("No active session to end")
-        else:
-            session = self._load_session(session_id)
-            if not session:
-                raise SessionError(f"Session {session_id} not found")
+                raise SessionError(no_active_message)
+            return session
 
-        if not session.is_active:
+        session = self._load_session(session_id)
+        if not session:
+            raise SessionError(f"Session {session_id} not found")
+        if require_active and not session.is_active:
             raise SessionError(f"Session {session.id} is already ended")
+        return session
+
+    def end_session(self, session_id: str | None = None) -> ObservationSession:
+        """End a session.
+
+        Args:
+            session_id: Session to end (defaults to active session)
+
+        Returns:
+            The ended session
+        """
+        session = self._resolve_session(
+            session_id, require_active=True, no_active_message="No active session to end"
+        )
 
         session.end_time = datetime.now()
+        # Saving compacts the observation and weather logs into the session file
         self._save_session(session)
+        self._set_active_id(None)
         return session
 
     def log_observation(
@@ -192,14 +345,9 @@ class SessionManager:
         Returns:
             The created observation
         """
-        if session_id is None:
-            session = self.get_active_session()
-            if not session:
-                raise SessionError("No active session. Start one with 'session start'.")
-        else:
-            session = self._load_session(session_id)
-            if not session:
-                raise SessionError(f"Session {session_id} not found")
+        session = self._resolve_session(
+            session_id, no_active_message="No active session. Start one with 'session start'."
+        )
 
         observation = TargetObservation(
             target_name=target_name,
@@ -210,8 +358,9 @@ class SessionManager:
             azimuth=azimuth,
         )
 
+        self._append_log(session, self._obs_path(session.id), observation)
         session.add_target(observation)
-        self._save_session(session)
+        self._cache[session.id] = (self._session_version(session.id), session)
         return observation
 
     def add_note(self, note: str, session_id: str | None = None) -> ObservationSession:
@@ -224,14 +373,9 @@ class SessionManager:
         Returns:
             The updated session
         """
-        if session_id is None:
-            session = self.get_active_session()
-            if not session:
-                raise SessionError("No active session. Start one with 'session start'.")
-        else:
-            session = self._load_session(session_id)
-            if not session:
-                raise SessionError(f"Session {session_id} not found")
+        session = self._resolve_session(
+            session_id, no_active_message="No active session. Start one with 'session start'."
+        )
 
         session.add_note(note)
         self._save_session(session)
@@ -259,14 +403,7 @@ class SessionManager:
         Returns:
             The updated session
         """
-        if session_id is None:
-            session = self.get_active_session()
-            if not session:
-                raise SessionError("No active session.")
-        else:
-            session = self._load_session(session_id)
-            if not session:
-                raise SessionError(f"Session {session_id} not found")
+        session = self._resolve_session(session_id)
 
         snapshot = WeatherSnapshot(
             timestamp=datetime.now(),
@@ -277,8 +414,9 @@ class SessionManager:
             wind_speed=wind_speed,
         )
 
+        self._append_log(session, self._weather_path(session.id), snapshot)
         session.add_weather_snapshot(snapshot)
-        self._save_session(session)
+        self._cache[session.id] = (self._session_version(session.id), session)
         return session
 
     def set_equipment(
@@ -293,14 +431,7 @@ class SessionManager:
         Returns:
             The updated session
         """
-        if session_id is None:
-            session = self.get_active_session()
-            if not session:
-                raise SessionError("No active session.")
-        else:
-            session = self._load_session(session_id)
-            if not session:
-                raise SessionError(f"Session {session_id} not found")
+        session = self._resolve_session(session_id)
 
         session.equipment_used = equipment_ids
         self._save_session(session)
@@ -308,10 +439,15 @@ class SessionManager:
 
     def list_session_ids(self) -> list[str]:
         """List all session IDs, sorted by date (newest first)."""
-        sessions = []
-        for path in self.sessions_dir.glob("*.json"):
-            sessions.append(path.stem)
-        return sorted(sessions, reverse=True)
+        # IDs are timestamps, so their lexicographic order is chronological
+        with os.scandir(self.sessions_dir) as entries:
+            session_ids = [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
+        session_ids.sort(reverse=True)
+        return session_ids
 
     def get_session(self, session_id: str) -> ObservationSession | None:
         """Get a session by ID."""
@@ -330,11 +466,62 @@ class SessionManager:
         if limit:
             session_ids = session_ids[:limit]
 
-        sessions = []
+        sessions: dict[str, ObservationSession] = {}
+        stale: list[tuple[str, _SessionVersion]] = []
         for session_id in session_ids:
-            session = self._load_session(session_id)
-            if session:
-                sessions.append(session)
+            version = self._session_version(session_id)
+            if version is None:
+                self._cache.pop(session_id, None)
+                continue
+            cached = self._cache.get(session_id)
+            if cached is not None and cached[0] == version:
+                sessions[session_id] = cached[1]
+            else:
+                stale.append((session_id, version))
+
+        if stale:
+            sessions.update(self._load_sessions_batch(stale))
+
+        return [sessions[session_id] for session_id in session_ids if session_id in sessions]
+
+    def _load_sessions_batch(
+        self, stale: list[tuple[str, _SessionVersion]]
+    ) -> dict[str, ObservationSession]:
+        """Load uncached sessions, validating all of their files in one call.
+
+        Args:
+            stale: Session IDs with their current cache versions
+
+        Returns:
+            Loaded sessions keyed by ID
+        """
+        paths = [self._session_path(session_id) for session_id, _ in stale]
+
+        # File reads release the GIL, so read larger sets in parallel
+        if len(paths) > self.PARALLEL_LOAD_THRESHOLD:
+            workers = min(self.MAX_LOAD_WORKERS, len(paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                contents = list(executor.map(Path.read_bytes, paths))
+        else:
+            contents = [path.read_bytes() for path in paths]
+
+        try:
+            loaded = _SESSIONS_ADAPTER.validate_json(b"[" + b",".join(contents) + b"]")
+            for session in loaded:
+                self._merge_logs(session)
+        except ValueError:
+            # Load one at a time so the error names the broken session
+            sessions = {}
+            for session_id, _ in stale:
+                session = self._load_session(session_id)
+                if session:
+                    sessions[session_id] = session
+            return sessions
+
+        sessions = {}
+        for (session_id, version), session in zip(stale, loaded):
+            self._cache[session_id] = (version, session)
+            sessions[session_id] = session
         return sessions
 
     def delete_session(self, session_id: str) -> bool:
@@ -347,6 +534,9 @@ class SessionManager:
             True if deleted, False if not found
         """
         path = self._session_path(session_id)
+        self._cache.pop(session_id, None)
+        self._obs_path(session_id).unlink(missing_ok=True)
+        self._weather_path(session_id).unlink(missing_ok=True)
         if path.exists():
             path.unlink()
             return True
@@ -355,27 +545,64 @@ class SessionManager:
     # Equipment operations
 
     def _load_equipment(self) -> EquipmentCollection:
-        """Load equipment from TOML file."""
-        if not self.equipment_file.exists():
+        """Load equipment from TOML file.
+
+        The collection is cached in memory and only re-read when the file
+        changes. Changes must be persisted through _save_equipment.
+        """
+        try:
+            version = self._file_version(self.equipment_file.stat())
+        except FileNotFoundError:
+            self._equipment_cache = None
             return EquipmentCollection()
 
+        cached = self._equipment_cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        # TOML modules are imported on first use: session-only commands never need them
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            import tomli as tomllib
+
         try:
             with open(self.equipment_file, "rb") as f:
                 data = tomllib.load(f)
             equipment_list = []
             for eq_data in data.get("equipment", []):
                 equipment_list.append(Equipment.model_validate(eq_data))
-            return EquipmentCollection(equipment=equipment_list)
+            collection = EquipmentCollection(equipment=equipment_list)
         except Exception as e:
             raise SessionError(f"Failed to load equipment: {e}") from e
 
+        self._equipment_cache = (version, collection)
+        return collection
+
     def _save_equipment(self, collection: EquipmentCollection) -> None:
         """Save equipment to TOML file."""
+        import tomli_w
+
+        # Equipment is flat, so build the TOML tables directly
         data: dict[str, Any] = {
-            "equipment": [eq.model_dump() for eq in collection.equipment]
+            "equipment": [
+                {
+                    "id": eq.id,
+                    "name": eq.name,
+                    "equipment_type": eq.equipment_type,
+                    "specs": eq.specs,
+                    "notes": eq.notes,
+                }
+                for eq in collection.equipment
+            ]
         }
+        # Drop the cached copy first so a failed write never leaves it stale
+        self._equipment_cache = None
         with open(self.equipment_file, "wb") as f:
             tomli_w.dump(data, f)
+            f.flush()
+            version = self._file_version(os.fstat(f.fileno()))
+        self._equipment_cache = (version, collection)
 
     def add_equipment(
         self,
@@ -426,7 +653,7 @@ class SessionManager:
         collection = self._load_equipment()
         if equipment_type:
             return collection.list_by_type(equipment_type)
-        return collection.equipment
+        return list(collection.equipment)
 
     def remove_equipment(self, equipment_id: str) -> bool:
         """Remove equipment by ID.
@@ -1,13 +1,20 @@
 """Data models for observation sessions."""
 
+import re
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+# Equipment ID slug patterns
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[\s_]+")
 
 
 class TargetObservation(BaseModel):
     """A single target observation during a session."""
 
+    model_config = ConfigDict(frozen=True)
+
     target_name: str = Field(description="Name of the observed target")
     observed_at: datetime = Field(description="Time of observation")
     quality_rating: int = Field(ge=1, le=5, description="User quality rating 1-5")
@@ -19,6 +26,8 @@ class TargetObservation(BaseModel):
 class WeatherSnapshot(BaseModel):
     """Weather conditions at a point during the session."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime = Field(description="Time of snapshot")
     seeing_score: float = Field(ge=0, le=100, description="Seeing score at this time")
     temperature: float = Field(description="Temperature in Celsius")
@@ -30,6 +39,8 @@ class WeatherSnapshot(BaseModel):
 class SessionLocation(BaseModel):
     """Location information for a session."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Location name")
     latitude: float = Field(ge=-90, le=90, description="Latitude")
     longitude: float = Field(ge=-180, le=180, description="Longitude")
@@ -39,6 +50,8 @@ class SessionLocation(BaseModel):
 class SessionConditions(BaseModel):
     """Initial seeing conditions when session started."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_score: float = Field(ge=0, le=100, description="Overall seeing score")
     rating: str = Field(description="Score rating (Excellent, Good, etc.)")
     temperature_score: float | None = Field(default=None, description="Temperature component")
@@ -114,10 +127,8 @@ class Equipment(BaseModel):
     @classmethod
     def generate_id(cls, name: str) -> str:
         """Generate a slug ID from the equipment name."""
-        import re
-        slug = name.lower()
-        slug = re.sub(r"[^\w\s-]", "", slug)
-        slug = re.sub(r"[\s_]+", "-", slug)
+        slug = _SLUG_STRIP.sub("", name.lower())
+        slug = _SLUG_DASH.sub("-", slug)
         return slug.strip("-")
 
 
@@ -128,24 +139,55 @@ class EquipmentCollection(BaseModel):
         default_factory=list, description="List of equipment"
     )
 
+    # Equipment ID -> position of its first entry in the list
+    _index: dict[str, int] | None = PrivateAttr(default=None)
+
+    def _build_index(self) -> dict[str, int]:
+        """Index every ID by its first position, like a scan of the list would."""
+        index: dict[str, int] = {}
+        for i, eq in enumerate(self.equipment):
+            index.setdefault(eq.id, i)
+        self._index = index
+        return index
+
+    def _position(self, equipment_id: str) -> int | None:
+        """Get the position of the first equipment with an ID.
+
+        A hit is checked against the list and a miss rebuilds the index, so
+        changes made to ``equipment`` directly are still found.
+        """
+        equipment = self.equipment
+        index = self._index if self._index is not None else self._build_index()
+        position = index.get(equipment_id)
+        if (
+            position is not None
+            and position < len(equipment)
+            and equipment[position].id == equipment_id
+        ):
+            return position
+        return self._build_index().get(equipment_id)
+
     def get(self, equipment_id: str) -> Equipment | None:
         """Get equipment by ID."""
-        for eq in self.equipment:
-            if eq.id == equipment_id:
-                return eq
-        return None
+        position = self._position(equipment_id)
+        return self.equipment[position] if position is not None else None
 
     def add(self, equipment: Equipment) -> None:
         """Add equipment to the collection."""
         # Remove existing with same ID
-        self.equipment = [eq for eq in self.equipment if eq.id != equipment.id]
+        self.remove(equipment.id)
+        index = self._index if self._index is not None else self._build_index()
+        index[equipment.id] = len(self.equipment)
         self.equipment.append(equipment)
 
     def remove(self, equipment_id: str) -> bool:
         """Remove equipment by ID. Returns True if found and removed."""
-        original_len = len(self.equipment)
+        if self._position(equipment_id) is None:
+            return False
+        # Drops every entry with the ID, including duplicates
         self.equipment = [eq for eq in self.equipment if eq.id != equipment_id]
-        return len(self.equipment) < original_len
+        self._index = None
+        return True
 
     def list_by_type(self, equipment_type: str) -> list[Equipment]:
         """List equipment by type."""
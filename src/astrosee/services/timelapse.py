@@ -1,17 +1,24 @@
 """Timelapse imaging session planner."""
 
 import math
-import statistics
+from bisect import bisect_right
 from datetime import datetime, timedelta, timezone
 
 from pydantic import BaseModel, Field
 
 from astrosee.astronomy.calculator import AstronomyCalculator
 from astrosee.astronomy.catalog import CelestialCatalog
-from astrosee.astronomy.models import CelestialObject, Location
+from astrosee.astronomy.models import CelestialObject, Location, TargetPosition
 from astrosee.scoring.models import SeeingForecast
 from astrosee.services.seeing import SeeingService
 
+# Cartesian unit vector of an alt/az direction
+Vector3 = tuple[float, float, float]
+
+# Moon interference severity bands: score below each threshold gets the label
+_SEVERITY_THRESHOLDS = (0.2, 0.4, 0.7)
+_SEVERITY_LABELS = ("none", "minor", "moderate", "severe")
+
 
 class MoonInterference(BaseModel):
     """Moon interference details during an imaging window."""
@@ -83,6 +90,16 @@ class TimelapseService:
         self.calculator = calculator or seeing_service.astronomy
         self.catalog = catalog or seeing_service.catalog
 
+        # Positions are deterministic for a location and time, so they are
+        # kept across searches for the same location. Moon samples do not
+        # depend on the target and are shared across targets.
+        self._cache_location: Location | None = None
+        # (target name, time) -> position
+        self._target_positions: dict[tuple[str, datetime], TargetPosition] = {}
+        # Time -> (altitude, azimuth, unit vector)
+        self._moon_positions: dict[datetime, tuple[float, float, Vector3]] = {}
+        self._moon_illuminations: dict[datetime, float] = {}
+
     async def find_imaging_windows(
         self,
         target_name: str,
@@ -119,23 +136,54 @@ class TimelapseService:
         if not forecasts:
             return []
 
-        # Build visibility data with altitude
+        return self._find_target_windows(
+            target, location, forecasts, duration_hours, min_altitude, target_date, min_score
+        )
+
+    def _find_target_windows(
+        self,
+        target: CelestialObject,
+        location: Location,
+        forecasts: list[SeeingForecast],
+        duration_hours: float,
+        min_altitude: float,
+        target_date: datetime | None,
+        min_score: float,
+    ) -> list[TimelapseWindow]:
+        """Find imaging windows for a resolved target within a forecast.
+
+        Args:
+            target: Target object
+            location: Observer location
+            forecasts: Seeing forecast to search
+            duration_hours: Minimum window duration in hours
+            min_altitude: Minimum target altitude in degrees
+            target_date: Specific date to search (None = search all days)
+            min_score: Minimum acceptable seeing score
+
+        Returns:
+            List of TimelapseWindow sorted by average score (best first)
+        """
+        # Build visibility data with altitude (one batched position calculation)
+        self._reset_position_cache(location)
+        positions = self._get_target_positions(target, location, [f.timestamp for f in forecasts])
         visibility_data = []
-        for f in forecasts:
-            pos = self.calculator.get_target_position(target, location, f.timestamp)
+        for f, pos in zip(forecasts, positions):
             visibility_data.append({
                 "forecast": f,
                 "altitude": pos.altitude,
                 "azimuth": pos.azimuth,
                 "is_visible": pos.altitude >= min_altitude,
+                "is_night": f.is_night,
+                "score": f.score.total_score,
             })
 
         # Filter by date if specified
         if target_date:
-            target_date_str = target_date.strftime("%Y-%m-%d")
+            day = target_date.date()
             visibility_data = [
                 v for v in visibility_data
-                if v["forecast"].timestamp.strftime("%Y-%m-%d") == target_date_str
+                if v["forecast"].timestamp.date() == day
             ]
 
         # Find contiguous windows where target is above min_altitude and it's night
@@ -180,41 +228,38 @@ class TimelapseService:
         Returns:
             List of window data lists
         """
-        windows = []
-        current_window: list[dict] = []
-
-        for v in visibility_data:
-            f = v["forecast"]
-
-            # Check if suitable: night, above altitude, decent score
+        max_gap = timedelta(hours=2)
+        timestamps = [v["forecast"].timestamp for v in visibility_data]
+
+        # Runs of consecutive suitable entries (night, above altitude, decent
+        # score) as (start, end) index pairs, split at gaps over 2 hours
+        runs: list[tuple[int, int]] = []
+        run_start: int | None = None
+        for i, v in enumerate(visibility_data):
             is_suitable = (
-                f.is_night
+                v["is_night"]
                 and v["altitude"] >= min_altitude
-                and f.score.total_score >= min_score
+                and v["score"] >= min_score
             )
 
-            if is_suitable:
-                if not current_window:
-                    current_window.append(v)
-                else:
-                    # Check continuity (within 2 hours)
-                    time_diff = f.timestamp - current_window[-1]["forecast"].timestamp
-                    if time_diff <= timedelta(hours=2):
-                        current_window.append(v)
-                    else:
-                        # Save and start new window
-                        if self._window_duration_hours(current_window) >= min_duration_hours:
-                            windows.append(current_window)
-                        current_window = [v]
-            else:
-                # End current window
-                if current_window and self._window_duration_hours(current_window) >= min_duration_hours:
-                    windows.append(current_window)
-                current_window = []
+            if not is_suitable:
+                if run_start is not None:
+                    runs.append((run_start, i))
+                    run_start = None
+            elif run_start is None:
+                run_start = i
+            elif timestamps[i] - timestamps[i - 1] > max_gap:
+                runs.append((run_start, i))
+                run_start = i
 
-        # Don't forget last window
-        if current_window and self._window_duration_hours(current_window) >= min_duration_hours:
-            windows.append(current_window)
+        if run_start is not None:
+            runs.append((run_start, len(visibility_data)))
+
+        windows = []
+        for start, end in runs:
+            window = visibility_data[start:end]
+            if self._window_duration_hours(window) >= min_duration_hours:
+                windows.append(window)
 
         return windows
 
@@ -251,20 +296,19 @@ class TimelapseService:
 
         # Calculate scores
         scores = [f.score.total_score for f in forecasts]
-        avg_score = statistics.mean(scores)
+        avg_score = sum(scores) / len(scores)
         min_score = min(scores)
         max_score = max(scores)
 
         # Find peak altitude
-        peak_idx = altitudes.index(max(altitudes))
+        peak_idx = max(range(len(altitudes)), key=altitudes.__getitem__)
         peak_altitude = altitudes[peak_idx]
         peak_time = forecasts[peak_idx].timestamp
 
         # Build altitude profile (15-minute intervals for smooth chart)
         altitude_profile = self._calculate_altitude_profile(
-            target, location,
-            forecasts[0].timestamp,
-            forecasts[-1].timestamp,
+            [f.timestamp for f in forecasts],
+            altitudes,
             interval_minutes=15,
         )
 
@@ -295,33 +339,47 @@ class TimelapseService:
             forecasts=forecasts,
         )
 
+    @staticmethod
+    def _sample_times(start: datetime, end: datetime, step: timedelta) -> list[datetime]:
+        """Get sample times from start to end (inclusive) at a fixed step."""
+        times = []
+        current = start
+        while current <= end:
+            times.append(current)
+            current += step
+        return times
+
     def _calculate_altitude_profile(
         self,
-        target: CelestialObject,
-        location: Location,
-        start: datetime,
-        end: datetime,
+        times: list[datetime],
+        altitudes: list[float],
         interval_minutes: int = 15,
     ) -> list[tuple[datetime, float]]:
-        """Calculate target altitude over time.
+        """Calculate target altitude over time from the window's samples.
+
+        Altitude changes almost linearly between hourly samples, so samples
+        coarser than the interval are linearly interpolated instead of
+        computing new positions for the chart.
 
         Args:
-            target: Target object
-            location: Observer location
-            start: Start time
-            end: End time
+            times: Sample times (forecast timestamps)
+            altitudes: Target altitude at each sample time
             interval_minutes: Time interval in minutes
 
         Returns:
             List of (time, altitude) tuples
         """
-        profile = []
-        current = start
+        interval = timedelta(minutes=interval_minutes)
+        if len(times) < 2 or times[1] - times[0] <= interval:
+            return list(zip(times, altitudes))
 
-        while current <= end:
-            pos = self.calculator.get_target_position(target, location, current)
-            profile.append((current, pos.altitude))
-            current += timedelta(minutes=interval_minutes)
+        profile = []
+        i = 0
+        for current in self._sample_times(times[0], times[-1], interval):
+            while times[i + 1] < current:
+                i += 1
+            fraction = (current - times[i]) / (times[i + 1] - times[i])
+            profile.append((current, altitudes[i] + (altitudes[i + 1] - altitudes[i]) * fraction))
 
         return profile
 
@@ -343,48 +401,40 @@ class TimelapseService:
         Returns:
             MoonInterference with details
         """
-        # Sample moon position hourly
-        moon_data = []
-        current = start
+        self._reset_position_cache(location)
 
-        while current <= end:
-            moon_alt, moon_az = self.calculator.get_moon_position(location, current)
-            target_pos = self.calculator.get_target_position(target, location, current)
-
-            # Calculate angular distance
-            angular_dist = self._angular_distance(
-                target_pos.altitude, target_pos.azimuth,
-                moon_alt, moon_az,
-            )
+        # Sample moon and target positions hourly
+        times = self._sample_times(start, end, timedelta(hours=1))
+        moon_alts, _, moon_vectors = self._get_moon_positions(location, times)
+        target_positions = self._get_target_positions(target, location, times)
 
-            moon_data.append({
-                "time": current,
-                "altitude": moon_alt,
-                "azimuth": moon_az,
-                "angular_distance": angular_dist,
-            })
-            current += timedelta(hours=1)
+        # Calculate angular distances for all samples at once
+        angular_dists = self._angular_distances(
+            [self._unit_vector(pos.altitude, pos.azimuth) for pos in target_positions],
+            moon_vectors,
+        )
 
         # Get moon illumination (use middle of window)
         mid_time = start + (end - start) / 2
-        illumination = self.calculator.get_moon_illumination(mid_time)
+        illumination = self._moon_illuminations.get(mid_time)
+        if illumination is None:
+            illumination = self.calculator.get_moon_illumination(mid_time)
+            self._moon_illuminations[mid_time] = illumination
 
-        # Find rise/set times
+        # Find rise/set times (the last horizon crossing of each kind)
         rises_at = None
         sets_at = None
-        prev_alt = moon_data[0]["altitude"] if moon_data else 0
-
-        for m in moon_data[1:]:
-            if prev_alt <= 0 and m["altitude"] > 0:
-                rises_at = m["time"]
-            elif prev_alt > 0 and m["altitude"] <= 0:
-                sets_at = m["time"]
-            prev_alt = m["altitude"]
+        above = [alt > 0 for alt in moon_alts]
+        crossings = [i for i in range(1, len(above)) if above[i] != above[i - 1]]
+        for i in crossings:
+            if above[i]:
+                rises_at = times[i]
+            else:
+                sets_at = times[i]
 
         # Calculate statistics
-        altitudes = [m["altitude"] for m in moon_data]
-        avg_altitude = statistics.mean(altitudes) if altitudes else 0
-        min_angular_dist = min(m["angular_distance"] for m in moon_data) if moon_data else 180
+        avg_altitude = sum(moon_alts) / len(moon_alts) if moon_alts else 0
+        min_angular_dist = min(angular_dists) if angular_dists else 180
 
         # Determine severity
         severity = self._calculate_interference_severity(
@@ -400,37 +450,92 @@ class TimelapseService:
             severity=severity,
         )
 
-    def _angular_distance(
-        self,
-        alt1: float, az1: float,
-        alt2: float, az2: float,
-    ) -> float:
-        """Calculate angular distance between two objects.
+    def _reset_position_cache(self, location: Location) -> None:
+        """Drop cached positions if they were computed for another location."""
+        if location != self._cache_location:
+            self._cache_location = location
+            self._target_positions.clear()
+            self._moon_positions.clear()
+            self._moon_illuminations.clear()
+
+    def _get_target_positions(
+        self, target: CelestialObject, location: Location, times: list[datetime]
+    ) -> list[TargetPosition]:
+        """Get target positions, computing only uncached times.
+
+        Args:
+            target: Target object
+            location: Observer location (the cached location)
+            times: Sample times
+
+        Returns:
+            Target position per time
+        """
+        missing = [t for t in times if (target.name, t) not in self._target_positions]
+        if missing:
+            positions = self.calculator.get_target_positions(target, location, missing)
+            for t, position in zip(missing, positions):
+                self._target_positions[target.name, t] = position
+
+        return [self._target_positions[target.name, t] for t in times]
 
-        Uses the spherical law of cosines.
+    def _get_moon_positions(
+        self, location: Location, times: list[datetime]
+    ) -> tuple[list[float], list[float], list[Vector3]]:
+        """Get moon altitudes, azimuths and unit vectors, computing only uncached times.
 
         Args:
-            alt1, az1: First object altitude and azimuth in degrees
-            alt2, az2: Second object altitude and azimuth in degrees
+            location: Observer location (the cached location)
+            times: Sample times
 
         Returns:
-            Angular distance in degrees
+            Tuple of (altitudes, azimuths, unit vectors), angles in degrees
         """
-        # Convert to radians
-        alt1_rad = math.radians(alt1)
-        alt2_rad = math.radians(alt2)
-        az_diff_rad = math.radians(abs(az1 - az2))
-
-        # Spherical law of cosines
-        cos_dist = (
-            math.sin(alt1_rad) * math.sin(alt2_rad) +
-            math.cos(alt1_rad) * math.cos(alt2_rad) * math.cos(az_diff_rad)
+        missing = [t for t in times if t not in self._moon_positions]
+        if missing:
+            alts, azs = self.calculator.get_moon_positions(location, missing)
+            for t, alt, az in zip(missing, alts, azs):
+                self._moon_positions[t] = (alt, az, self._unit_vector(alt, az))
+
+        positions = [self._moon_positions[t] for t in times]
+        return (
+            [alt for alt, _, _ in positions],
+            [az for _, az, _ in positions],
+            [vector for _, _, vector in positions],
         )
 
-        # Clamp to [-1, 1] to avoid math domain errors
-        cos_dist = max(-1, min(1, cos_dist))
+    @staticmethod
+    def _unit_vector(altitude: float, azimuth: float) -> Vector3:
+        """Convert an altitude/azimuth in degrees to a Cartesian unit vector."""
+        alt_rad = math.radians(altitude)
+        az_rad = math.radians(azimuth)
+        cos_alt = math.cos(alt_rad)
+        return (cos_alt * math.cos(az_rad), cos_alt * math.sin(az_rad), math.sin(alt_rad))
 
-        return math.degrees(math.acos(cos_dist))
+    @staticmethod
+    def _angular_distances(vectors1: list[Vector3], vectors2: list[Vector3]) -> list[float]:
+        """Calculate angular distances between pairs of directions.
+
+        The dot product of two unit vectors is the cosine of the angle between
+        them (the spherical law of cosines), so no trig is needed per pair
+        beyond the final acos. Moon vectors are cached across targets.
+
+        Args:
+            vectors1: First object unit vectors
+            vectors2: Second object unit vectors
+
+        Returns:
+            Angular distance per pair in degrees
+        """
+        degrees, acos = math.degrees, math.acos
+
+        distances = []
+        for (x1, y1, z1), (x2, y2, z2) in zip(vectors1, vectors2):
+            cos_dist = x1 * x2 + y1 * y2 + z1 * z2
+            # Clamp to [-1, 1] to avoid math domain errors
+            distances.append(degrees(acos(max(-1, min(1, cos_dist)))))
+
+        return distances
 
     def _calculate_interference_severity(
         self,
@@ -463,11 +568,4 @@ class TimelapseService:
 
         severity_score = illum_factor * alt_factor * (1 + dist_factor)
 
-        if severity_score < 0.2:
-            return "none"
-        elif severity_score < 0.4:
-            return "minor"
-        elif severity_score < 0.7:
-            return "moderate"
-        else:
-            return "severe"
+        return _SEVERITY_LABELS[bisect_right(_SEVERITY_THRESHOLDS, severity_score)]
@@ -1,17 +1,70 @@
 """SQLite cache for API responses."""
 
-import json
+import asyncio
 import logging
+import sqlite3
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import aiosqlite
+from pydantic import TypeAdapter
+from pydantic_core import from_json, to_json
 
 from astrosee.core.exceptions import CacheError
 from astrosee.weather.models import WeatherData
 
 logger = logging.getLogger(__name__)
 
+# Cached forecasts are stored as one JSON array
+_WEATHER_LIST_ADAPTER = TypeAdapter(list[WeatherData])
+
+
+# Per-hour write time (Unix seconds) stored next to the weather columns, so
+# hours merged into a day row keep their own age
+_CACHED_AT_COLUMN = "cached_at"
+
+
+def _pack_columns(hours: list[tuple[int, WeatherData]]) -> str:
+    """Encode (cached_at, weather) hours as JSON columns (name -> value per hour).
+
+    Values keep full precision so cached hours score exactly like the
+    forecast_cache copy of the same data.
+    """
+    rows = [weather.model_dump(mode="json") for _, weather in hours]
+    columns = {key: [row[key] for row in rows] for key in rows[0]}
+    columns[_CACHED_AT_COLUMN] = [cached_at for cached_at, _ in hours]
+    return to_json(columns).decode("utf-8")
+
+
+def _unpack_columns(data_json: str) -> list[tuple[int, WeatherData]]:
+    """Decode the (cached_at, weather) hours encoded by _pack_columns."""
+    columns = from_json(data_json)
+    cached_ats = columns.pop(_CACHED_AT_COLUMN)
+    keys = list(columns)
+    return [
+        (cached_at, WeatherData.model_validate(dict(zip(keys, values))))
+        for cached_at, values in zip(cached_ats, zip(*columns.values()))
+    ]
+
+
+def _unpack_hour(data_json: str, hour: datetime) -> tuple[int, WeatherData] | None:
+    """Decode only the hour starting at ``hour`` from a _pack_columns row."""
+    columns = from_json(data_json)
+    cached_ats = columns.pop(_CACHED_AT_COLUMN)
+    for index, timestamp in enumerate(columns["timestamp"]):
+        parsed = datetime.fromisoformat(timestamp)
+        if parsed.replace(minute=0, second=0, microsecond=0) == hour:
+            weather = WeatherData.model_validate(
+                {key: values[index] for key, values in columns.items()}
+            )
+            return cached_ats[index], weather
+    return None
+
 
 class CacheManager:
     """SQLite-based cache for weather and other API data."""
@@ -21,15 +74,47 @@ class CacheManager:
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         latitude REAL NOT NULL,
         longitude REAL NOT NULL,
-        timestamp TEXT NOT NULL,
+        timestamp INTEGER NOT NULL,
         data TEXT NOT NULL,
-        cached_at TEXT NOT NULL,
+        cached_at INTEGER NOT NULL,
         source TEXT DEFAULT 'openmeteo',
         UNIQUE(latitude, longitude, timestamp, source)
     );
 
-    CREATE INDEX IF NOT EXISTS idx_weather_coords_time
-    ON weather_cache(latitude, longitude, timestamp);
+    -- Covers lookups by coordinates and time, newest entry first
+    CREATE INDEX IF NOT EXISTS idx_weather_full
+    ON weather_cache(latitude, longitude, timestamp, cached_at DESC);
+
+    -- Forecast hours grouped per day, stored column-wise; cached_at is the
+    -- newest of the per-hour write times kept in the data
+    CREATE TABLE IF NOT EXISTS weather_day_cache (
+        latitude REAL NOT NULL,
+        longitude REAL NOT NULL,
+        date TEXT NOT NULL,
+        data TEXT NOT NULL,
+        cached_at INTEGER NOT NULL,
+        source TEXT DEFAULT 'openmeteo',
+        PRIMARY KEY(latitude, longitude, date, source)
+    );
+
+    CREATE TABLE IF NOT EXISTS forecast_cache (
+        latitude REAL NOT NULL,
+        longitude REAL NOT NULL,
+        hours INTEGER NOT NULL,
+        data TEXT NOT NULL,
+        cached_at INTEGER NOT NULL,
+        PRIMARY KEY(latitude, longitude, hours)
+    );
+
+    -- GFS upper atmosphere data, one JSON array per request
+    CREATE TABLE IF NOT EXISTS upper_atmosphere_cache (
+        latitude REAL NOT NULL,
+        longitude REAL NOT NULL,
+        hours INTEGER NOT NULL,
+        data TEXT NOT NULL,
+        cached_at INTEGER NOT NULL,
+        PRIMARY KEY(latitude, longitude, hours)
+    );
 
     CREATE TABLE IF NOT EXISTS cache_metadata (
         key TEXT PRIMARY KEY,
@@ -37,6 +122,25 @@ class CacheManager:
     );
     """
 
+    # Bumped when the cache tables change incompatibly; older tables are
+    # dropped (version 2: INTEGER Unix cached_at, version 3: INTEGER Unix
+    # weather timestamps, version 4: per-hour cached_at in day rows)
+    SCHEMA_VERSION = "4"
+    CACHE_TABLES = (
+        "weather_cache",
+        "weather_day_cache",
+        "forecast_cache",
+        "upper_atmosphere_cache",
+    )
+
+    # The cache can always be refetched, so trade durability for speed
+    PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-16384;
+    """
+
     def __init__(self, db_path: Path):
         """Initialize cache manager.
 
@@ -45,21 +149,97 @@ class CacheManager:
         """
         self.db_path = db_path
         self._connection: aiosqlite.Connection | None = None
+        # Keeps concurrent first calls from opening two connections
+        self._connect_lock = asyncio.Lock()
+        # Held by a write or transaction() block until it commits, so
+        # concurrent tasks never share the connection's open transaction
+        self._write_lock = asyncio.Lock()
+        # Set in the task running a transaction() block (and tasks it spawns),
+        # whose writes join that block instead of taking the lock
+        self._in_transaction: ContextVar[bool] = ContextVar(
+            "cache_in_transaction", default=False
+        )
 
     async def _get_connection(self) -> aiosqlite.Connection:
         """Get or create database connection."""
         if self._connection is None:
-            self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._connection = await aiosqlite.connect(self.db_path)
-            await self._init_schema()
+            async with self._connect_lock:
+                if self._connection is None:
+                    self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._connection = await aiosqlite.connect(self.db_path)
+                    await self._init_schema()
         return self._connection
 
     async def _init_schema(self) -> None:
         """Initialize database schema."""
         conn = self._connection
         if conn:
+            try:
+                cursor = await conn.execute(
+                    "SELECT value FROM cache_metadata WHERE key = 'schema_version'"
+                )
+                row = await cursor.fetchone()
+            except sqlite3.OperationalError:
+                # New database
+                row = None
+
+            outdated = not row or row[0] != self.SCHEMA_VERSION
+            if outdated:
+                for table in self.CACHE_TABLES:
+                    await conn.execute(f"DROP TABLE IF EXISTS {table}")
+
             await conn.executescript(self.SCHEMA)
+            if outdated:
+                await conn.execute(
+                    """
+                    INSERT OR REPLACE INTO cache_metadata (key, value)
+                    VALUES ('schema_version', ?)
+                    """,
+                    (self.SCHEMA_VERSION,),
+                )
             await conn.commit()
+            await conn.executescript(self.PRAGMAS)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group cache writes into a single commit.
+
+        Writes inside the block are committed together when it exits, or
+        rolled back if it raises. Nested blocks join the outermost one.
+        """
+        if self._in_transaction.get():
+            yield
+            return
+
+        conn = await self._get_connection()
+        async with self._write_lock:
+            token = self._in_transaction.set(True)
+            try:
+                yield
+            except BaseException:
+                await conn.rollback()
+                raise
+            else:
+                await conn.commit()
+            finally:
+                self._in_transaction.reset(token)
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Run a write and commit it, unless it is part of a transaction() block."""
+        conn = await self._get_connection()
+        if self._in_transaction.get():
+            yield conn
+            return
+
+        async with self._write_lock:
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+            else:
+                await conn.commit()
 
     async def close(self) -> None:
         """Close the database connection."""
@@ -100,31 +280,49 @@ class CacheManager:
             rounded_lat, rounded_lon = self._round_coords(lat, lon)
             rounded_time = self._round_timestamp(timestamp)
 
+            # Single entries and forecast days can both hold the hour: use the newest
+            found: list[tuple[int, WeatherData]] = []
+
             cursor = await conn.execute(
                 """
                 SELECT data, cached_at FROM weather_cache
                 WHERE latitude = ? AND longitude = ? AND timestamp = ?
                 ORDER BY cached_at DESC LIMIT 1
                 """,
-                (rounded_lat, rounded_lon, rounded_time.isoformat()),
+                (rounded_lat, rounded_lon, int(rounded_time.timestamp())),
             )
             row = await cursor.fetchone()
+            if row:
+                data_json, cached_at = row
+                found.append((cached_at, WeatherData.model_validate_json(data_json)))
 
-            if not row:
+            cursor = await conn.execute(
+                """
+                SELECT data, cached_at FROM weather_day_cache
+                WHERE latitude = ? AND longitude = ? AND date = ?
+                ORDER BY cached_at DESC LIMIT 1
+                """,
+                (rounded_lat, rounded_lon, rounded_time.date().isoformat()),
+            )
+            row = await cursor.fetchone()
+            if row:
+                hour = _unpack_hour(row[0], rounded_time)
+                if hour is not None:
+                    found.append(hour)
+
+            if not found:
                 return None
 
-            data_json, cached_at_str = row
-            cached_at = datetime.fromisoformat(cached_at_str)
+            cached_at, weather = max(found, key=lambda item: item[0])
 
             # Check TTL
             if not ignore_ttl:
-                age = datetime.now(timezone.utc) - cached_at
-                if age > timedelta(hours=ttl_hours):
-                    logger.debug(f"Cache expired (age: {age})")
+                age = int(time.time()) - cached_at
+                if age > ttl_hours * 3600:
+                    logger.debug(f"Cache expired (age: {timedelta(seconds=age)})")
                     return None
 
-            data = json.loads(data_json)
-            return WeatherData.from_json_safe(data)
+            return weather
 
         except Exception as e:
             logger.warning(f"Cache read error: {e}")
@@ -146,29 +344,28 @@ class CacheManager:
             source: Data source identifier
         """
         try:
-            conn = await self._get_connection()
-            rounded_lat, rounded_lon = self._round_coords(lat, lon)
-            rounded_time = self._round_timestamp(weather.timestamp)
-
-            data_json = json.dumps(weather.model_dump_json_safe())
-            cached_at = datetime.now(timezone.utc).isoformat()
+            async with self._write() as conn:
+                rounded_lat, rounded_lon = self._round_coords(lat, lon)
+                rounded_time = self._round_timestamp(weather.timestamp)
 
-            await conn.execute(
-                """
-                INSERT OR REPLACE INTO weather_cache
-                (latitude, longitude, timestamp, data, cached_at, source)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    rounded_lat,
-                    rounded_lon,
-                    rounded_time.isoformat(),
-                    data_json,
-                    cached_at,
-                    source,
-                ),
-            )
-            await conn.commit()
+                data_json = weather.model_dump_json()
+                cached_at = int(time.time())
+
+                await conn.execute(
+                    """
+                    INSERT OR REPLACE INTO weather_cache
+                    (latitude, longitude, timestamp, data, cached_at, source)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        rounded_lat,
+                        rounded_lon,
+                        int(rounded_time.timestamp()),
+                        data_json,
+                        cached_at,
+                        source,
+                    ),
+                )
 
         except Exception as e:
             logger.warning(f"Cache write error: {e}")
@@ -183,39 +380,70 @@ class CacheManager:
     ) -> None:
         """Cache multiple weather data points.
 
+        Points are stored one row per day, column-wise. They are merged
+        into hours already cached for those days, replacing the same hours.
+
         Args:
             lat: Latitude
             lon: Longitude
             weather_list: List of weather data to cache
             source: Data source identifier
         """
-        try:
-            conn = await self._get_connection()
-            rounded_lat, rounded_lon = self._round_coords(lat, lon)
-            cached_at = datetime.now(timezone.utc).isoformat()
-
-            rows = []
-            for weather in weather_list:
-                rounded_time = self._round_timestamp(weather.timestamp)
-                data_json = json.dumps(weather.model_dump_json_safe())
-                rows.append((
-                    rounded_lat,
-                    rounded_lon,
-                    rounded_time.isoformat(),
-                    data_json,
-                    cached_at,
-                    source,
-                ))
+        if not weather_list:
+            return
 
-            await conn.executemany(
-                """
-                INSERT OR REPLACE INTO weather_cache
-                (latitude, longitude, timestamp, data, cached_at, source)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                rows,
-            )
-            await conn.commit()
+        try:
+            async with self._write() as conn:
+                rounded_lat, rounded_lon = self._round_coords(lat, lon)
+                cached_at = int(time.time())
+
+                # Day -> rounded Unix time -> (cached_at, weather)
+                days: defaultdict[str, dict[int, tuple[int, WeatherData]]] = defaultdict(dict)
+                new_days = {
+                    self._round_timestamp(weather.timestamp).date().isoformat()
+                    for weather in weather_list
+                }
+
+                # Start from the hours already cached for those days
+                cursor = await conn.execute(
+                    """
+                    SELECT date, data FROM weather_day_cache
+                    WHERE latitude = ? AND longitude = ? AND source = ?
+                    AND date >= ? AND date <= ?
+                    """,
+                    (rounded_lat, rounded_lon, source, min(new_days), max(new_days)),
+                )
+                for day, data_json in await cursor.fetchall():
+                    if day in new_days:
+                        for hour_cached_at, weather in _unpack_columns(data_json):
+                            rounded_time = self._round_timestamp(weather.timestamp)
+                            days[day][int(rounded_time.timestamp())] = (hour_cached_at, weather)
+
+                for weather in weather_list:
+                    rounded_time = self._round_timestamp(weather.timestamp)
+                    day = rounded_time.date().isoformat()
+                    days[day][int(rounded_time.timestamp())] = (cached_at, weather)
+
+                rows = [
+                    (
+                        rounded_lat,
+                        rounded_lon,
+                        day,
+                        _pack_columns([hours[rounded_ts] for rounded_ts in sorted(hours)]),
+                        cached_at,
+                        source,
+                    )
+                    for day, hours in days.items()
+                ]
+
+                await conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO weather_day_cache
+                    (latitude, longitude, date, data, cached_at, source)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
 
         except Exception as e:
             logger.warning(f"Cache batch write error: {e}")
@@ -243,56 +471,256 @@ class CacheManager:
         try:
             conn = await self._get_connection()
             rounded_lat, rounded_lon = self._round_coords(lat, lon)
-            cutoff = datetime.now(timezone.utc) - timedelta(hours=ttl_hours)
+            cutoff = int(time.time()) - ttl_hours * 3600
+            start_ts, end_ts = int(start.timestamp()), int(end.timestamp())
+
+            # Entries keyed by rounded Unix time; forecast days override single entries
+            by_time: dict[int, WeatherData] = {}
 
             cursor = await conn.execute(
                 """
-                SELECT data FROM weather_cache
+                SELECT timestamp, data FROM weather_cache
                 WHERE latitude = ? AND longitude = ?
                 AND timestamp >= ? AND timestamp <= ?
                 AND cached_at >= ?
-                ORDER BY timestamp
+                """,
+                (rounded_lat, rounded_lon, start_ts, end_ts, cutoff),
+            )
+            for rounded_ts, data_json in await cursor.fetchall():
+                by_time[rounded_ts] = WeatherData.model_validate_json(data_json)
+
+            # One row per covered day
+            cursor = await conn.execute(
+                """
+                SELECT data FROM weather_day_cache
+                WHERE latitude = ? AND longitude = ?
+                AND date >= ? AND date <= ?
+                AND cached_at >= ?
+                ORDER BY cached_at
                 """,
                 (
                     rounded_lat,
                     rounded_lon,
-                    start.isoformat(),
-                    end.isoformat(),
-                    cutoff.isoformat(),
+                    start.date().isoformat(),
+                    end.date().isoformat(),
+                    cutoff,
                 ),
             )
-            rows = await cursor.fetchall()
+            for (data_json,) in await cursor.fetchall():
+                for hour_cached_at, weather in _unpack_columns(data_json):
+                    rounded_ts = int(self._round_timestamp(weather.timestamp).timestamp())
+                    if start_ts <= rounded_ts <= end_ts and hour_cached_at >= cutoff:
+                        by_time[rounded_ts] = weather
 
-            result = []
-            for (data_json,) in rows:
-                data = json.loads(data_json)
-                result.append(WeatherData.from_json_safe(data))
-
-            return result
+            return [by_time[rounded_ts] for rounded_ts in sorted(by_time)]
 
         except Exception as e:
             logger.warning(f"Cache range read error: {e}")
             return []
 
-    async def cleanup(self, max_age_days: int = 7) -> int:
-        """Remove old cache entries.
+    async def get_weather_forecast(
+        self,
+        lat: float,
+        lon: float,
+        hours: int,
+        ttl_minutes: int = 15,
+    ) -> list[WeatherData] | None:
+        """Get a cached hourly forecast.
 
         Args:
-            max_age_days: Maximum age of entries to keep
+            lat: Latitude
+            lon: Longitude
+            hours: Number of forecast hours requested
+            ttl_minutes: Cache TTL in minutes
 
         Returns:
-            Number of entries removed
+            Cached forecast or None if not found/expired
+        """
+        try:
+            conn = await self._get_connection()
+            rounded_lat, rounded_lon = self._round_coords(lat, lon)
+
+            cursor = await conn.execute(
+                """
+                SELECT data, cached_at FROM forecast_cache
+                WHERE latitude = ? AND longitude = ? AND hours = ?
+                """,
+                (rounded_lat, rounded_lon, hours),
+            )
+            row = await cursor.fetchone()
+
+            if not row:
+                return None
+
+            data_json, cached_at = row
+            age = int(time.time()) - cached_at
+            if age > ttl_minutes * 60:
+                logger.debug(f"Forecast cache expired (age: {timedelta(seconds=age)})")
+                return None
+
+            return _WEATHER_LIST_ADAPTER.validate_json(data_json)
+
+        except Exception as e:
+            logger.warning(f"Forecast cache read error: {e}")
+            return None
+
+    async def set_weather_forecast(
+        self,
+        lat: float,
+        lon: float,
+        hours: int,
+        forecast: list[WeatherData],
+    ) -> None:
+        """Cache an hourly forecast as a single entry.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            hours: Number of forecast hours requested
+            forecast: Forecast to cache
+        """
+        try:
+            async with self._write() as conn:
+                rounded_lat, rounded_lon = self._round_coords(lat, lon)
+
+                data_json = _WEATHER_LIST_ADAPTER.dump_json(forecast).decode("utf-8")
+                cached_at = int(time.time())
+
+                await conn.execute(
+                    """
+                    INSERT OR REPLACE INTO forecast_cache
+                    (latitude, longitude, hours, data, cached_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (rounded_lat, rounded_lon, hours, data_json, cached_at),
+                )
+
+        except Exception as e:
+            logger.warning(f"Forecast cache write error: {e}")
+
+    async def get_upper_atmosphere(
+        self,
+        lat: float,
+        lon: float,
+        hours: int,
+        ttl_minutes: int = 60,
+    ) -> list[dict] | None:
+        """Get cached GFS upper atmosphere data.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            hours: Number of forecast hours requested
+            ttl_minutes: Cache TTL in minutes
+
+        Returns:
+            Cached entries (as returned by NoaaGfsClient) or None if
+            not found/expired
         """
         try:
             conn = await self._get_connection()
-            cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+            rounded_lat, rounded_lon = self._round_coords(lat, lon)
 
             cursor = await conn.execute(
-                "DELETE FROM weather_cache WHERE cached_at < ?",
-                (cutoff.isoformat(),),
+                """
+                SELECT data, cached_at FROM upper_atmosphere_cache
+                WHERE latitude = ? AND longitude = ? AND hours = ?
+                """,
+                (rounded_lat, rounded_lon, hours),
             )
-            await conn.commit()
-            return cursor.rowcount
+            row = await cursor.fetchone()
+
+            if not row:
+                return None
+
+            data_json, cached_at = row
+            if int(time.time()) - cached_at > ttl_minutes * 60:
+                return None
+
+            entries = from_json(data_json)
+            for entry in entries:
+                entry["timestamp"] = datetime.fromisoformat(entry["timestamp"])
+            return entries
+
+        except Exception as e:
+            logger.warning(f"Upper atmosphere cache read error: {e}")
+            return None
+
+    async def set_upper_atmosphere(
+        self,
+        lat: float,
+        lon: float,
+        hours: int,
+        entries: list[dict],
+    ) -> None:
+        """Cache GFS upper atmosphere data as a single entry.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            hours: Number of forecast hours requested
+            entries: Entries as returned by NoaaGfsClient
+        """
+        try:
+            async with self._write() as conn:
+                rounded_lat, rounded_lon = self._round_coords(lat, lon)
+
+                await conn.execute(
+                    """
+                    INSERT OR REPLACE INTO upper_atmosphere_cache
+                    (latitude, longitude, hours, data, cached_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        rounded_lat,
+                        rounded_lon,
+                        hours,
+                        to_json(entries).decode("utf-8"),
+                        int(time.time()),
+                    ),
+                )
+
+        except Exception as e:
+            logger.warning(f"Upper atmosphere cache write error: {e}")
+
+    async def cleanup(self, max_age_days: int = 7) -> int:
+        """Remove old cache entries.
+
+        Args:
+            max_age_days: Maximum age of entries to keep
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            async with self._write() as conn:
+                cutoff = int(time.time()) - max_age_days * 86400
+
+                cursor = await conn.execute(
+                    "DELETE FROM weather_cache WHERE cached_at < ?",
+                    (cutoff,),
+                )
+                removed = cursor.rowcount
+
+                cursor = await conn.execute(
+                    "DELETE FROM weather_day_cache WHERE cached_at < ?",
+                    (cutoff,),
+                )
+                removed += cursor.rowcount
+
+                cursor = await conn.execute(
+                    "DELETE FROM forecast_cache WHERE cached_at < ?",
+                    (cutoff,),
+                )
+                removed += cursor.rowcount
+
+                cursor = await conn.execute(
+                    "DELETE FROM upper_atmosphere_cache WHERE cached_at < ?",
+                    (cutoff,),
+                )
+                removed += cursor.rowcount
+
+                return removed
 
         except Exception as e:
             logger.warning(f"Cache cleanup error: {e}")
@@ -307,18 +735,28 @@ class CacheManager:
         try:
             conn = await self._get_connection()
 
-            cursor = await conn.execute("SELECT COUNT(*) FROM weather_cache")
-            (total_entries,) = await cursor.fetchone()
-
-            cursor = await conn.execute(
-                "SELECT MIN(cached_at), MAX(cached_at) FROM weather_cache"
-            )
-            oldest, newest = await cursor.fetchone()
+            total_entries = 0
+            oldest: int | None = None
+            newest: int | None = None
+            for table in self.CACHE_TABLES:
+                cursor = await conn.execute(
+                    f"SELECT COUNT(*), MIN(cached_at), MAX(cached_at) FROM {table}"
+                )
+                count, table_oldest, table_newest = await cursor.fetchone()
+                total_entries += count
+                if table_oldest is not None:
+                    oldest = table_oldest if oldest is None else min(oldest, table_oldest)
+                    newest = table_newest if newest is None else max(newest, table_newest)
+
+            def to_iso(cached_at: int | None) -> str | None:
+                if cached_at is None:
+                    return None
+                return datetime.fromtimestamp(cached_at, timezone.utc).isoformat()
 
             return {
                 "total_entries": total_entries,
-                "oldest_entry": oldest,
-                "newest_entry": newest,
+                "oldest_entry": to_iso(oldest),
+                "newest_entry": to_iso(newest),
                 "db_path": str(self.db_path),
             }
 
@@ -1,6 +1,13 @@
 """Configuration management using TOML."""
 
+import copy
+import logging
+import os
 import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -11,9 +18,25 @@ else:
 
 import tomli_w
 
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock
+    fcntl = None
+
 from astrosee.astronomy.models import Location
 from astrosee.core.exceptions import ConfigError
 
+logger = logging.getLogger(__name__)
+
+# Parsed config files shared by all instances: path -> ((mtime_ns, size), config)
+_PARSED_CONFIGS: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+# Serializes config writes (and deferred flushes) between threads
+_WRITE_LOCK = threading.RLock()
+
+# Lock files flocked by this process: path -> nesting depth (guarded by _WRITE_LOCK)
+_HELD_FILE_LOCKS: dict[Path, int] = {}
+
 
 class ConfigManager:
     """Manages user configuration stored in ~/.astrosee/."""
@@ -30,14 +53,24 @@ class ConfigManager:
         self.config_dir = config_dir or self.DEFAULT_DIR
         self.config_file = self.config_dir / self.CONFIG_FILENAME
         self._config: dict[str, Any] = {}
+        # File version the in-memory config matches (see reload())
+        self._version: tuple[int, int] | None = None
+        # Location models built from the config's locations table
+        self._locations: dict[str, Location] = {}
+        # File version and TOML of the last write, to skip unchanged writes
+        self._written: tuple[tuple[int, int], bytes] | None = None
+        # Open _locked() blocks; the config is reloaded when the first opens
+        self._lock_depth = 0
+        # Open batch() blocks; saves are deferred while > 0
+        self._batch_depth = 0
+        self._dirty = False
         self._ensure_config_exists()
         self._load_config()
 
     def _ensure_config_exists(self) -> None:
         """Create config directory and default config if needed."""
-        self.config_dir.mkdir(parents=True, exist_ok=True)
-
         if not self.config_file.exists():
+            self.config_dir.mkdir(parents=True, exist_ok=True)
             default_config = {
                 "settings": {
                     "cache_ttl_hours": 1,
@@ -48,27 +81,155 @@ class ConfigManager:
             }
             self._write_config(default_config)
 
+    @staticmethod
+    def _file_version(path: Path) -> tuple[int, int]:
+        """Get the cache version of a config file."""
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
     def _load_config(self) -> None:
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        Parsed files are shared across instances until the file changes.
+        """
         try:
-            with open(self.config_file, "rb") as f:
-                self._config = tomllib.load(f)
+            version = self._file_version(self.config_file)
+            cached = _PARSED_CONFIGS.get(self.config_file)
+            if cached is not None and cached[0] == version:
+                self._config = copy.deepcopy(cached[1])
+            else:
+                with open(self.config_file, "rb") as f:
+                    self._config = tomllib.load(f)
+                _PARSED_CONFIGS[self.config_file] = (version, copy.deepcopy(self._config))
+            self._version = version
         except Exception as e:
             raise ConfigError(f"Failed to load config: {e}") from e
 
+        # A malformed location is skipped (it can still be removed), so one
+        # bad table does not break every command
+        self._locations = {}
+        for name, loc_data in self._locations_raw.items():
+            try:
+                self._locations[name] = self._build_location(name, loc_data)
+            except Exception as e:
+                logger.warning(f"Ignoring invalid location '{name}': {e!r}")
+
+    def reload(self) -> bool:
+        """Reload the config if the file changed since it was last read.
+
+        Returns:
+            True if the file changed and was reloaded
+        """
+        with _WRITE_LOCK:
+            try:
+                changed = self._file_version(self.config_file) != self._version
+            except OSError as e:
+                raise ConfigError(f"Failed to load config: {e}") from e
+            if changed:
+                self._load_config()
+            return changed
+
     def _write_config(self, config: dict[str, Any] | None = None) -> None:
-        """Write configuration to file."""
+        """Write configuration to file.
+
+        A config identical to the last write is not rewritten while the file
+        on disk is still that write. Writes go to a temporary file that
+        replaces the config, so a failed write never truncates it.
+        """
         if config is not None:
             self._config = config
         try:
-            with open(self.config_file, "wb") as f:
-                tomli_w.dump(self._config, f)
+            data = tomli_w.dumps(self._config).encode("utf-8")
+            with _WRITE_LOCK, self._file_lock():
+                if (
+                    self._written is not None
+                    and self._written[1] == data
+                    and self.config_file.exists()
+                    and self._file_version(self.config_file) == self._written[0]
+                ):
+                    return
+                tmp_file = self.config_file.with_suffix(".toml.tmp")
+                tmp_file.write_bytes(data)
+                os.replace(tmp_file, self.config_file)
+                version = self._file_version(self.config_file)
         except Exception as e:
             raise ConfigError(f"Failed to write config: {e}") from e
 
+        self._written = (version, data)
+        self._version = version
+        _PARSED_CONFIGS[self.config_file] = (version, copy.deepcopy(self._config))
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the config file across processes.
+
+        The CLI and the widget may write the same config; without fcntl
+        (Windows) only threads in this process are serialized. Must be
+        entered under _WRITE_LOCK; nested entries reuse the held lock.
+        """
+        lock_path = self.config_file.with_suffix(".toml.lock")
+        if fcntl is None or lock_path in _HELD_FILE_LOCKS:
+            _HELD_FILE_LOCKS[lock_path] = _HELD_FILE_LOCKS.get(lock_path, 0) + 1
+            try:
+                yield
+            finally:
+                _HELD_FILE_LOCKS[lock_path] -= 1
+                if not _HELD_FILE_LOCKS[lock_path]:
+                    del _HELD_FILE_LOCKS[lock_path]
+            return
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            _HELD_FILE_LOCKS[lock_path] = 1
+            try:
+                yield
+            finally:
+                del _HELD_FILE_LOCKS[lock_path]
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the config locks for a read-modify-write.
+
+        The config is reloaded when the outermost block opens, so changes
+        start from the latest file and other processes' writes are kept.
+        """
+        with _WRITE_LOCK, self._file_lock():
+            if self._lock_depth == 0:
+                self._load_config()
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+
     def _save(self) -> None:
-        """Save current config to file."""
-        self._write_config()
+        """Save current config to file (deferred inside batch())."""
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._write_config()
+
+    def flush(self) -> None:
+        """Write changes deferred by batch()."""
+        with _WRITE_LOCK:
+            if self._dirty:
+                self._dirty = False
+                self._write_config()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several changes into a single config write.
+
+        Changes made inside the block are written once when it exits; the
+        config stays locked for the whole block.
+        """
+        with self._locked():
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
 
     # Settings
     def get_setting(self, key: str, default: Any = None) -> Any:
@@ -77,10 +238,11 @@ class ConfigManager:
 
     def set_setting(self, key: str, value: Any) -> None:
         """Set a setting value."""
-        if "settings" not in self._config:
-            self._config["settings"] = {}
-        self._config["settings"][key] = value
-        self._save()
+        with self._locked():
+            if "settings" not in self._config:
+                self._config["settings"] = {}
+            self._config["settings"][key] = value
+            self._save()
 
     @property
     def cache_ttl_hours(self) -> int:
@@ -93,31 +255,30 @@ class ConfigManager:
         return self.get_setting("default_forecast_hours", 48)
 
     # Locations
+    @property
+    def _locations_raw(self) -> dict[str, dict[str, Any]]:
+        """Location tables from the config, created if missing."""
+        return self._config.setdefault("locations", {})
+
     def get_default_location(self) -> Location | None:
         """Get the default location."""
         default_name = self._config.get("default_location")
-        if default_name and default_name in self._config.get("locations", {}):
-            return self.get_location(default_name)
+        if default_name and default_name in self._locations:
+            return self._locations[default_name]
         # Return first location if no default set
-        locations = self._config.get("locations", {})
-        if locations:
-            first_name = next(iter(locations))
-            return self.get_location(first_name)
-        return None
+        return next(iter(self._locations.values()), None)
 
     def set_default_location(self, name: str) -> None:
         """Set the default location by name."""
-        if name not in self._config.get("locations", {}):
-            raise ConfigError(f"Location '{name}' not found")
-        self._config["default_location"] = name
-        self._save()
+        with self._locked():
+            if name not in self._locations:
+                raise ConfigError(f"Location '{name}' not found")
+            self._config["default_location"] = name
+            self._save()
 
-    def get_location(self, name: str) -> Location | None:
-        """Get a location by name."""
-        locations = self._config.get("locations", {})
-        if name not in locations:
-            return None
-        loc_data = locations[name]
+    @staticmethod
+    def _build_location(name: str, loc_data: dict[str, Any]) -> Location:
+        """Build a Location from its config table."""
         return Location(
             name=name,
             latitude=loc_data["latitude"],
@@ -126,14 +287,13 @@ class ConfigManager:
             timezone=loc_data.get("timezone", "UTC"),
         )
 
+    def get_location(self, name: str) -> Location | None:
+        """Get a location by name."""
+        return self._locations.get(name)
+
     def get_all_locations(self) -> dict[str, Location]:
         """Get all saved locations."""
-        result = {}
-        for name in self._config.get("locations", {}):
-            loc = self.get_location(name)
-            if loc:
-                result[name] = loc
-        return result
+        return dict(self._locations)
 
     def add_location(
         self,
@@ -157,28 +317,29 @@ class ConfigManager:
         Returns:
             The created Location object
         """
-        if "locations" not in self._config:
-            self._config["locations"] = {}
+        with self._locked():
+            self._locations_raw[name] = {
+                "latitude": latitude,
+                "longitude": longitude,
+                "elevation": elevation,
+                "timezone": timezone,
+            }
 
-        self._config["locations"][name] = {
-            "latitude": latitude,
-            "longitude": longitude,
-            "elevation": elevation,
-            "timezone": timezone,
-        }
+            if set_default or not self._config.get("default_location"):
+                self._config["default_location"] = name
 
-        if set_default or not self._config.get("default_location"):
-            self._config["default_location"] = name
+            location = Location(
+                name=name,
+                latitude=latitude,
+                longitude=longitude,
+                elevation=elevation,
+                timezone=timezone,
+            )
+            self._locations[name] = location
 
-        self._save()
+            self._save()
 
-        return Location(
-            name=name,
-            latitude=latitude,
-            longitude=longitude,
-            elevation=elevation,
-            timezone=timezone,
-        )
+        return location
 
     def remove_location(self, name: str) -> bool:
         """Remove a location by name.
@@ -186,20 +347,22 @@ class ConfigManager:
         Returns:
             True if location was removed, False if it didn't exist
         """
-        if name not in self._config.get("locations", {}):
-            return False
+        with self._locked():
+            locations = self._locations_raw
+            if name not in locations:
+                return False
 
-        del self._config["locations"][name]
+            del locations[name]
+            self._locations.pop(name, None)
 
-        # Clear default if it was the removed location
-        if self._config.get("default_location") == name:
-            locations = self._config.get("locations", {})
-            if locations:
-                self._config["default_location"] = next(iter(locations))
-            else:
-                self._config.pop("default_location", None)
+            # Clear default if it was the removed location
+            if self._config.get("default_location") == name:
+                if locations:
+                    self._config["default_location"] = next(iter(locations))
+                else:
+                    self._config.pop("default_location", None)
 
-        self._save()
+            self._save()
         return True
 
     # Alerts
@@ -209,26 +372,28 @@ class ConfigManager:
 
     def add_alert(self, condition: str, enabled: bool = True) -> None:
         """Add a new alert condition."""
-        if "alerts" not in self._config:
-            self._config["alerts"] = []
-        self._config["alerts"].append({
-            "condition": condition,
-            "enabled": enabled,
-        })
-        self._save()
+        with self._locked():
+            if "alerts" not in self._config:
+                self._config["alerts"] = []
+            self._config["alerts"].append({
+                "condition": condition,
+                "enabled": enabled,
+            })
+            self._save()
 
     def remove_alert(self, index: int) -> bool:
         """Remove an alert by index."""
-        alerts = self._config.get("alerts", [])
-        if 0 <= index < len(alerts):
-            alerts.pop(index)
-            self._save()
-            return True
+        with self._locked():
+            alerts = self._config.get("alerts", [])
+            if 0 <= index < len(alerts):
+                alerts.pop(index)
+                self._save()
+                return True
         return False
 
-    @property
+    @cached_property
     def data_dir(self) -> Path:
-        """Get the data directory for cache, logs, etc."""
+        """Get the data directory for cache, logs, etc. (created on first access)."""
         data_dir = self.config_dir / "data"
         data_dir.mkdir(exist_ok=True)
         return data_dir
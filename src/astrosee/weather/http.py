@@ -0,0 +1,45 @@
+"""Shared HTTP client for weather providers.
+
+Open-Meteo serves both the forecast and the GFS endpoints from the same host,
+so the providers share one connection pool instead of each opening (and
+handshaking) its own.
+"""
+
+import asyncio
+import weakref
+
+import httpx
+
+TIMEOUT = 30.0
+MAX_KEEPALIVE_CONNECTIONS = 8
+
+# One client per event loop: httpx connections are bound to the loop that
+# opened them, and each CLI command runs its own loop. Whoever owns the loop
+# (CLI cleanup, widget shutdown) closes its client with close_shared_client().
+_shared_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop.
+
+    Returns:
+        Lazily created httpx client
+    """
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+        )
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client for the running event loop, if any."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,13 +1,16 @@
 """Weather data models."""
 
+from bisect import bisect_left
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WeatherData(BaseModel):
     """Weather conditions at a specific time and location."""
 
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime = Field(description="Time of the observation/forecast")
 
     # Temperature
@@ -96,12 +99,23 @@ class WeatherForecast(BaseModel):
     hourly: list[WeatherData]
 
     def get_at_time(self, target_time: datetime) -> WeatherData | None:
-        """Get weather data closest to a target time."""
-        if not self.hourly:
+        """Get weather data closest to a target time.
+
+        Hourly data is in time order, so the closest entry is found by
+        bisection rather than a scan.
+        """
+        hourly = self.hourly
+        if not hourly:
             return None
 
-        closest = min(
-            self.hourly,
-            key=lambda w: abs((w.timestamp - target_time).total_seconds()),
-        )
-        return closest
+        i = bisect_left(hourly, target_time, key=lambda w: w.timestamp)
+        if i == 0:
+            return hourly[0]
+        if i == len(hourly):
+            return hourly[-1]
+
+        before, after = hourly[i - 1], hourly[i]
+        if target_time - before.timestamp <= after.timestamp - target_time:
+            return before
+        return after
+
@@ -5,11 +5,14 @@ including upper atmosphere variables like winds at 250hPa (jet stream level).
 """
 
 import logging
+from bisect import bisect_left
 from datetime import datetime, timezone
 
 import httpx
+from pydantic_core import from_json
 
 from astrosee.core.exceptions import WeatherAPIError
+from astrosee.weather.http import get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -22,28 +25,39 @@ class NoaaGfsClient:
     """
 
     BASE_URL = "https://api.open-meteo.com/v1/gfs"
-    TIMEOUT = 30.0
+
+    # Winds at multiple pressure levels
+    HOURLY_VARIABLES = [
+        "wind_speed_250hPa",  # Jet stream level
+        "wind_speed_300hPa",  # Upper troposphere
+        "wind_speed_500hPa",  # Mid troposphere
+        "wind_speed_700hPa",  # Lower troposphere
+        "wind_speed_850hPa",  # Near surface
+        "geopotential_height_500hPa",  # For stability
+    ]
+    _HOURLY_PARAM = ",".join(HOURLY_VARIABLES)
 
     def __init__(self, client: httpx.AsyncClient | None = None):
         """Initialize the client.
 
         Args:
-            client: Optional httpx client (for testing/reuse)
+            client: Optional httpx client (for testing/reuse); defaults to
+                the shared weather HTTP client
         """
         self._client = client
-        self._owns_client = client is None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get the HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.TIMEOUT)
+            return get_shared_client()
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client if we own it."""
-        if self._owns_client and self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Release the client.
+
+        Injected and shared clients are owned by the caller, so this is a
+        no-op; the shared client is closed with close_shared_client().
+        """
 
     async def get_jet_stream_speed(
         self, lat: float, lon: float, time: datetime
@@ -65,9 +79,7 @@ class NoaaGfsClient:
         if not data:
             return None
 
-        # Find closest time
-        target_ts = time.timestamp()
-        closest = min(data, key=lambda d: abs(d["timestamp"].timestamp() - target_ts))
+        closest = self.closest_entry(data, time)
         return closest.get("wind_speed_250hpa")
 
     async def get_upper_atmosphere(
@@ -85,18 +97,10 @@ class NoaaGfsClient:
         """
         client = await self._get_client()
 
-        # Request winds at multiple pressure levels
         params = {
             "latitude": lat,
             "longitude": lon,
-            "hourly": ",".join([
-                "wind_speed_250hPa",  # Jet stream level
-                "wind_speed_300hPa",  # Upper troposphere
-                "wind_speed_500hPa",  # Mid troposphere
-                "wind_speed_700hPa",  # Lower troposphere
-                "wind_speed_850hPa",  # Near surface
-                "geopotential_height_500hPa",  # For stability
-            ]),
+            "hourly": self._HOURLY_PARAM,
             "forecast_hours": min(hours, 384),
             "timezone": "UTC",
         }
@@ -104,62 +108,94 @@ class NoaaGfsClient:
         try:
             response = await client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = from_json(response.content)
         except httpx.HTTPStatusError as e:
             logger.warning(f"GFS API HTTP error: {e.response.status_code}")
             return []
         except httpx.RequestError as e:
             logger.warning(f"GFS API request error: {e}")
             return []
+        except ValueError as e:
+            logger.warning(f"GFS API returned invalid JSON: {e}")
+            return []
 
         return self._parse_response(data)
 
     def _parse_response(self, data: dict) -> list[dict]:
-        """Parse the API response."""
+        """Parse the API response.
+
+        Each hourly column is converted once (winds from km/h to m/s)
+        rather than per row.
+        """
         hourly = data.get("hourly", {})
         times = hourly.get("time", [])
 
         if not times:
             return []
 
+        n = len(times)
+        column = self._column
+        wind_250 = column(hourly, "wind_speed_250hPa", n, scale=3.6)
+        wind_300 = column(hourly, "wind_speed_300hPa", n, scale=3.6)
+        wind_500 = column(hourly, "wind_speed_500hPa", n, scale=3.6)
+        wind_700 = column(hourly, "wind_speed_700hPa", n, scale=3.6)
+        wind_850 = column(hourly, "wind_speed_850hPa", n, scale=3.6)
+        geopotential_500 = column(hourly, "geopotential_height_500hPa", n)
+
         result = []
         for i, time_str in enumerate(times):
             try:
-                timestamp = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+                timestamp = datetime.fromisoformat(time_str)
                 if timestamp.tzinfo is None:
                     timestamp = timestamp.replace(tzinfo=timezone.utc)
-
-                entry = {
-                    "timestamp": timestamp,
-                    "wind_speed_250hpa": self._get_value(hourly, "wind_speed_250hPa", i),
-                    "wind_speed_300hpa": self._get_value(hourly, "wind_speed_300hPa", i),
-                    "wind_speed_500hpa": self._get_value(hourly, "wind_speed_500hPa", i),
-                    "wind_speed_700hpa": self._get_value(hourly, "wind_speed_700hPa", i),
-                    "wind_speed_850hpa": self._get_value(hourly, "wind_speed_850hPa", i),
-                    "geopotential_500hpa": self._get_value(
-                        hourly, "geopotential_height_500hPa", i
-                    ),
-                }
-                result.append(entry)
-            except (ValueError, KeyError) as e:
+            except (ValueError, TypeError) as e:
                 logger.warning(f"Failed to parse GFS data at index {i}: {e}")
                 continue
 
+            result.append({
+                "timestamp": timestamp,
+                "wind_speed_250hpa": wind_250[i],
+                "wind_speed_300hpa": wind_300[i],
+                "wind_speed_500hpa": wind_500[i],
+                "wind_speed_700hpa": wind_700[i],
+                "wind_speed_850hpa": wind_850[i],
+                "geopotential_500hpa": geopotential_500[i],
+            })
+
         return result
 
     @staticmethod
-    def _get_value(
-        hourly: dict, key: str, index: int, default: float | None = None
-    ) -> float | None:
-        """Safely get a value from the hourly data."""
-        values = hourly.get(key, [])
-        if index < len(values) and values[index] is not None:
-            # Convert km/h to m/s for wind speeds
-            value = float(values[index])
-            if "wind_speed" in key:
-                value = value / 3.6
-            return value
-        return default
+    def _column(
+        hourly: dict, key: str, length: int, scale: float = 1.0
+    ) -> list[float | None]:
+        """Get an hourly column as floats divided by scale, padded with None.
+
+        An unparseable column is treated as missing.
+        """
+        values = hourly.get(key) or []
+        try:
+            column = [float(v) / scale if v is not None else None for v in values[:length]]
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Failed to parse GFS column {key}: {e}")
+            column = []
+        column.extend([None] * (length - len(column)))
+        return column
+
+    @staticmethod
+    def closest_entry(data: list[dict], time: datetime) -> dict:
+        """Find the entry closest to a time in time-ordered data."""
+        target_ts = time.timestamp()
+        i = bisect_left(data, target_ts, key=lambda d: d["timestamp"].timestamp())
+        if i == 0:
+            return data[0]
+        if i == len(data):
+            return data[-1]
+
+        before, after = data[i - 1], data[i]
+        before_gap = target_ts - before["timestamp"].timestamp()
+        if before_gap <= after["timestamp"].timestamp() - target_ts:
+            return before
+        return after
 
     async def get_richardson_number(
         self, lat: float, lon: float, time: datetime
@@ -184,9 +220,7 @@ class NoaaGfsClient:
         if not data:
             return None
 
-        # Find closest time
-        target_ts = time.timestamp()
-        closest = min(data, key=lambda d: abs(d["timestamp"].timestamp() - target_ts))
+        closest = self.closest_entry(data, time)
 
         # Get wind speeds at different levels
         w850 = closest.get("wind_speed_850hpa")
@@ -4,8 +4,10 @@ import logging
 from datetime import datetime, timezone
 
 import httpx
+from pydantic_core import from_json
 
 from astrosee.core.exceptions import WeatherAPIError
+from astrosee.weather.http import get_shared_client
 from astrosee.weather.models import WeatherData
 
 logger = logging.getLogger(__name__)
@@ -15,7 +17,6 @@ class OpenMeteoClient:
     """Client for the Open-Meteo API (free, no API key required)."""
 
     BASE_URL = "https://api.open-meteo.com/v1/forecast"
-    TIMEOUT = 30.0
 
     # Variables we request from the API
     HOURLY_VARIABLES = [
@@ -36,27 +37,29 @@ class OpenMeteoClient:
         "visibility",
         "temperature_850hPa",
     ]
+    _HOURLY_PARAM = ",".join(HOURLY_VARIABLES)
 
     def __init__(self, client: httpx.AsyncClient | None = None):
         """Initialize the client.
 
         Args:
-            client: Optional httpx client (for testing/reuse)
+            client: Optional httpx client (for testing/reuse); defaults to
+                the shared weather HTTP client
         """
         self._client = client
-        self._owns_client = client is None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get the HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.TIMEOUT)
+            return get_shared_client()
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client if we own it."""
-        if self._owns_client and self._client is not None:
-            await self._client.aclose()
-            self._client = None
+        """Release the client.
+
+        Injected and shared clients are owned by the caller, so this is a
+        no-op; the shared client is closed with close_shared_client().
+        """
 
     async def get_current(self, lat: float, lon: float) -> WeatherData:
         """Get current weather conditions.
@@ -91,7 +94,7 @@ class OpenMeteoClient:
         params = {
             "latitude": lat,
             "longitude": lon,
-            "hourly": ",".join(self.HOURLY_VARIABLES),
+            "hourly": self._HOURLY_PARAM,
             "forecast_hours": min(hours, 384),
             "timezone": "UTC",
         }
@@ -99,7 +102,7 @@ class OpenMeteoClient:
         try:
             response = await client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = from_json(response.content)
         except httpx.HTTPStatusError as e:
             raise WeatherAPIError(
                 f"HTTP {e.response.status_code}: {e.response.text}",
@@ -110,71 +113,101 @@ class OpenMeteoClient:
                 f"Request failed: {e}",
                 source="OpenMeteo",
             ) from e
+        except ValueError as e:
+            raise WeatherAPIError(
+                f"Invalid JSON response: {e}",
+                source="OpenMeteo",
+            ) from e
 
         return self._parse_response(data)
 
     def _parse_response(self, data: dict) -> list[WeatherData]:
-        """Parse the API response into WeatherData objects."""
+        """Parse the API response into WeatherData objects.
+
+        Each hourly column is converted once (including km/h to m/s for
+        winds) and rows are built with model_construct, since the API
+        schema is trusted and per-row validation dominated parsing of long
+        forecasts.
+        """
         hourly = data.get("hourly", {})
         times = hourly.get("time", [])
 
         if not times:
             return []
 
+        n = len(times)
+        column = self._column
+        temperature = column(hourly, "temperature_2m", n, 0.0)
+        temperature_850hpa = column(hourly, "temperature_850hPa", n)
+        dew_point = column(hourly, "dew_point_2m", n, 0.0)
+        wind_speed_10m = column(hourly, "wind_speed_10m", n, 0.0, scale=3.6)
+        wind_speed_80m = column(hourly, "wind_speed_80m", n, scale=3.6)
+        wind_gusts = column(hourly, "wind_gusts_10m", n, 0.0, scale=3.6)
+        wind_direction = column(hourly, "wind_direction_10m", n, 0.0)
+        humidity = column(hourly, "relative_humidity_2m", n, 50.0)
+        cloud_cover = column(hourly, "cloud_cover", n, 0.0)
+        cloud_cover_low = column(hourly, "cloud_cover_low", n)
+        cloud_cover_mid = column(hourly, "cloud_cover_mid", n)
+        cloud_cover_high = column(hourly, "cloud_cover_high", n)
+        pressure = column(hourly, "pressure_msl", n, 1013.25)
+        precipitation = column(hourly, "precipitation", n, 0.0)
+        precipitation_probability = column(hourly, "precipitation_probability", n)
+        visibility = column(hourly, "visibility", n)
+
         result = []
         for i, time_str in enumerate(times):
             try:
-                # Parse ISO timestamp
-                timestamp = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+                # Parse ISO timestamp (fromisoformat handles a trailing "Z")
+                timestamp = datetime.fromisoformat(time_str)
                 if timestamp.tzinfo is None:
                     timestamp = timestamp.replace(tzinfo=timezone.utc)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to parse weather data at index {i}: {e}")
+                continue
 
-                weather = WeatherData(
+            result.append(
+                WeatherData.model_construct(
                     timestamp=timestamp,
-                    temperature=self._get_value(hourly, "temperature_2m", i, 0.0),
-                    temperature_850hpa=self._get_value(hourly, "temperature_850hPa", i),
-                    dew_point=self._get_value(hourly, "dew_point_2m", i, 0.0),
-                    wind_speed_10m=self._get_value(hourly, "wind_speed_10m", i, 0.0) / 3.6,  # km/h to m/s
-                    wind_speed_80m=self._safe_divide(
-                        self._get_value(hourly, "wind_speed_80m", i), 3.6
-                    ),
-                    wind_gusts=self._get_value(hourly, "wind_gusts_10m", i, 0.0) / 3.6,
-                    wind_direction=self._get_value(hourly, "wind_direction_10m", i, 0.0),
-                    humidity=self._get_value(hourly, "relative_humidity_2m", i, 50.0),
-                    cloud_cover=self._get_value(hourly, "cloud_cover", i, 0.0),
-                    cloud_cover_low=self._get_value(hourly, "cloud_cover_low", i),
-                    cloud_cover_mid=self._get_value(hourly, "cloud_cover_mid", i),
-                    cloud_cover_high=self._get_value(hourly, "cloud_cover_high", i),
-                    pressure=self._get_value(hourly, "pressure_msl", i, 1013.25),
-                    precipitation=self._get_value(hourly, "precipitation", i, 0.0),
-                    precipitation_probability=self._get_value(
-                        hourly, "precipitation_probability", i
-                    ),
-                    visibility=self._get_value(hourly, "visibility", i),
+                    temperature=temperature[i],
+                    temperature_850hpa=temperature_850hpa[i],
+                    dew_point=dew_point[i],
+                    wind_speed_10m=wind_speed_10m[i],
+                    wind_speed_80m=wind_speed_80m[i],
+                    wind_gusts=wind_gusts[i],
+                    wind_direction=wind_direction[i],
+                    humidity=humidity[i],
+                    cloud_cover=cloud_cover[i],
+                    cloud_cover_low=cloud_cover_low[i],
+                    cloud_cover_mid=cloud_cover_mid[i],
+                    cloud_cover_high=cloud_cover_high[i],
+                    pressure=pressure[i],
+                    precipitation=precipitation[i],
+                    precipitation_probability=precipitation_probability[i],
+                    visibility=visibility[i],
                 )
-                result.append(weather)
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Failed to parse weather data at index {i}: {e}")
-                continue
+            )
 
         return result
 
     @staticmethod
-    def _get_value(
+    def _column(
         hourly: dict,
         key: str,
-        index: int,
+        length: int,
         default: float | None = None,
-    ) -> float | None:
-        """Safely get a value from the hourly data."""
-        values = hourly.get(key, [])
-        if index < len(values) and values[index] is not None:
-            return float(values[index])
-        return default
+        scale: float = 1.0,
+    ) -> list[float | None]:
+        """Get an hourly column as floats, padded to length.
 
-    @staticmethod
-    def _safe_divide(value: float | None, divisor: float) -> float | None:
-        """Safely divide a value that might be None."""
-        if value is None:
-            return None
-        return value / divisor
+        Missing values become the default; present values are divided by
+        scale (3.6 converts km/h to m/s). An unparseable column is treated
+        as missing.
+        """
+        values = hourly.get(key) or []
+        try:
+            column = [float(v) / scale if v is not None else default for v in values[:length]]
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Failed to parse weather column {key}: {e}")
+            column = []
+        column.extend([default] * (length - len(column)))
+        return column
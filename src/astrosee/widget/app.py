@@ -2,19 +2,26 @@
 
 import asyncio
 import logging
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import Future
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 import rumps
+from AppKit import NSWorkspace
+from Foundation import NSURL
+from pydantic import TypeAdapter
 
 from astrosee.astronomy.models import Location
-from astrosee.core.exceptions import AstroseeError
+from astrosee.core.exceptions import AstroseeError, ConfigError
 from astrosee.scoring.models import SeeingReport
 from astrosee.services.forecast import ForecastService
 from astrosee.services.seeing import SeeingService
 from astrosee.storage.cache import CacheManager
 from astrosee.storage.config import ConfigManager
+from astrosee.weather.http import close_shared_client
 from astrosee.widget.menu_builder import (
     build_best_window_menu,
     build_component_scores_menu,
@@ -29,6 +36,25 @@ logger = logging.getLogger(__name__)
 # Default update interval in seconds (15 minutes)
 DEFAULT_UPDATE_INTERVAL = 900
 
+# How often the main thread checks whether a running update has finished
+UPDATE_POLL_INTERVAL = 0.5
+
+# Seconds to wait for connections to close when quitting
+SHUTDOWN_TIMEOUT = 5.0
+
+# Manual refreshes within this many seconds of a successful update are ignored
+MIN_REFRESH_INTERVAL = 30.0
+
+# Last shown data, restored on launch: (report, best nights, best window)
+STATE_FILENAME = "widget_state.json"
+_STATE_ADAPTER = TypeAdapter(
+    tuple[
+        SeeingReport | None,
+        list[tuple[datetime, float, str]],
+        tuple[datetime | None, datetime | None, float | None],
+    ]
+)
+
 # Path to icon assets
 ASSETS_DIR = Path(__file__).parent / "assets"
 ICON_PATH = ASSETS_DIR / "icon.png"
@@ -61,7 +87,8 @@ class AstroseeWidget(rumps.App):
 
         self.update_interval = update_interval
         self.config = config or ConfigManager()
-        self._location: Location | None = None
+        # Re-resolved by _invalidate_location() when config.toml changes
+        self._location: Location | None = self.config.get_default_location()
         self._last_report: SeeingReport | None = None
         self._last_error: str | None = None
         self._best_nights: list[tuple[datetime, float, str]] = []
@@ -70,192 +97,374 @@ class AstroseeWidget(rumps.App):
             None,
             None,
         )
+        # Only read and written on the main thread: set by _do_update and
+        # cleared by _on_update_poll once the background update finishes
         self._is_updating = False
+        # time.monotonic() when the last update finished
+        self._last_update_ts: float | None = None
+        self._pending_update: Future | None = None
+
+        # Show the last data immediately while the first update runs
+        self._state_path = self.config.data_dir / STATE_FILENAME
+        self._load_state()
+
+        # Services are reused across updates, keeping the SQLite connection
+        # and HTTP connection pool warm between refreshes
+        self._cache = CacheManager(self.config.cache_db_path)
+        self._seeing_service = SeeingService(
+            cache_manager=self._cache,
+            cache_ttl_hours=self.config.cache_ttl_hours,
+        )
+        self._forecast_service = ForecastService(self._seeing_service)
+
+        # Updates run on a long-lived event loop in a background thread, so
+        # the menu stays responsive and the loop is not rebuilt every tick
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="astrosee-widget-loop", daemon=True
+        )
+        self._loop_thread.start()
+
+        # Last menu layout and the items built for it (None for separators)
+        self._menu_rows: list[tuple[str | None, Any]] | None = None
+        self._menu_items: list[rumps.MenuItem | None] = []
+        # What the menu was last built from (see _update_ui)
+        self._menu_state: tuple[Any, ...] | None = None
 
         # Build initial menu
         self._build_menu()
 
         # Set up timer for periodic updates (runs on main thread)
         self._timer = rumps.Timer(self._on_timer, self.update_interval)
+        # Picks up finished updates on the main thread
+        self._poll_timer = rumps.Timer(self._on_update_poll, UPDATE_POLL_INTERVAL)
 
-    def _build_menu(self) -> None:
-        """Build the menu structure."""
-        self.menu.clear()
+    def _menu_layout(self, today: date) -> list[tuple[str | None, Any]]:
+        """Describe the menu as rows.
+
+        Args:
+            today: Today's date for the forecast labels
+
+        Returns:
+            List of (title, callback) rows; (None, None) is a separator and
+            a list in place of the callback holds a submenu's own rows
+        """
+        rows: list[tuple[str | None, Any]] = []
 
         # Location header
         location = self._get_location()
         if location:
-            self.menu.add(rumps.MenuItem(f"\U0001F4CD {location.name}", callback=None))
+            rows.append((f"\U0001F4CD {location.name}", None))
         else:
-            self.menu.add(rumps.MenuItem("\u26A0\uFE0F No location configured", callback=None))
+            rows.append(("\u26A0\uFE0F No location configured", None))
 
-        self.menu.add(None)  # Separator
+        rows.append((None, None))  # Separator
 
         # Conditions section (placeholder or actual data)
         if self._last_error:
-            for title, _ in build_error_menu(self._last_error):
-                if title is None:
-                    self.menu.add(None)
-                else:
-                    self.menu.add(rumps.MenuItem(title, callback=None))
+            rows.extend(build_error_menu(self._last_error))
         elif self._last_report:
             # Current conditions
-            for title, _ in build_conditions_menu(self._last_report):
-                if title is None:
-                    self.menu.add(None)
-                else:
-                    self.menu.add(rumps.MenuItem(title, callback=None))
+            rows.extend(build_conditions_menu(self._last_report))
 
-            self.menu.add(None)  # Separator
+            rows.append((None, None))  # Separator
 
             # Component scores submenu
-            components_menu = rumps.MenuItem("Component Scores")
-            for title, _ in build_component_scores_menu(self._last_report):
-                components_menu.add(rumps.MenuItem(title, callback=None))
-            self.menu.add(components_menu)
+            rows.append(
+                ("Component Scores", build_component_scores_menu(self._last_report))
+            )
 
-            self.menu.add(None)  # Separator
+            rows.append((None, None))  # Separator
 
             # Best window tonight
-            for title, _ in build_best_window_menu(*self._best_window):
-                if title is None:
-                    self.menu.add(None)
-                else:
-                    self.menu.add(rumps.MenuItem(title, callback=None))
+            rows.extend(build_best_window_menu(*self._best_window))
 
             # Forecast submenu
             if self._best_nights:
-                forecast_menu = rumps.MenuItem("\U0001F4C5 Upcoming Nights")
-                for title, _ in build_forecast_menu(self._best_nights):
-                    forecast_menu.add(rumps.MenuItem(title, callback=None))
-                self.menu.add(forecast_menu)
+                rows.append(
+                    ("\U0001F4C5 Upcoming Nights", build_forecast_menu(self._best_nights, today))
+                )
         else:
-            for title, _ in build_loading_menu():
-                self.menu.add(rumps.MenuItem(title, callback=None))
+            rows.extend(build_loading_menu())
 
-        self.menu.add(None)  # Separator
+        rows.append((None, None))  # Separator
 
         # Actions
         refresh_title = "\U0001F504 Refreshing..." if self._is_updating else "\U0001F504 Refresh Now"
-        self.menu.add(rumps.MenuItem(refresh_title, callback=self._on_refresh))
+        rows.append((refresh_title, self._on_refresh))
 
         # Preferences submenu
-        prefs_menu = rumps.MenuItem("\u2699\uFE0F Preferences")
-        prefs_menu.add(rumps.MenuItem("Open Config Folder...", callback=self._on_open_config))
-        prefs_menu.add(rumps.MenuItem(f"Update: every {self.update_interval // 60} min", callback=None))
-        self.menu.add(prefs_menu)
+        rows.append(("\u2699\uFE0F Preferences", [
+            ("Open Config Folder...", self._on_open_config),
+            (f"Update: every {self.update_interval // 60} min", None),
+        ]))
 
-        self.menu.add(None)  # Separator
+        rows.append((None, None))  # Separator
 
         # Quit
-        self.menu.add(rumps.MenuItem("Quit Astrosee", callback=self._on_quit))
+        rows.append(("Quit Astrosee", self._on_quit))
+
+        return rows
+
+    @staticmethod
+    def _layout_shape(rows: list[tuple[str | None, Any]]) -> list[tuple[Any, ...]]:
+        """Get the structure of a menu layout, ignoring item titles."""
+        return [
+            (
+                title is None,
+                [callback for _, callback in action] if isinstance(action, list) else action,
+            )
+            for title, action in rows
+        ]
+
+    def _build_menu(self, today: date | None = None) -> None:
+        """Build the menu, updating existing items in place when possible.
+
+        Refreshes usually change only the numbers shown, so when the layout
+        keeps its shape the existing items are retitled instead of being
+        recreated.
+
+        Args:
+            today: Today's date for the forecast labels (default: current date)
+        """
+        if today is None:
+            today = datetime.now().date()
+        rows = self._menu_layout(today)
+        if rows == self._menu_rows:
+            return
+
+        if self._menu_rows is not None and (
+            self._layout_shape(rows) == self._layout_shape(self._menu_rows)
+        ):
+            for (title, action), item in zip(rows, self._menu_items):
+                if item is None:
+                    continue
+                item.title = title
+                if isinstance(action, list):
+                    for (child_title, _), child in zip(action, item.values()):
+                        child.title = child_title
+            self._menu_rows = rows
+            return
+
+        self.menu.clear()
+        self._menu_items = []
+        for title, action in rows:
+            if title is None:
+                self.menu.add(None)
+                self._menu_items.append(None)
+                continue
+
+            if isinstance(action, list):
+                item = rumps.MenuItem(title)
+                for child_title, callback in action:
+                    item.add(rumps.MenuItem(child_title, callback=callback))
+            else:
+                item = rumps.MenuItem(title, callback=action)
+            self.menu.add(item)
+            self._menu_items.append(item)
+        self._menu_rows = rows
 
     def _get_location(self) -> Location | None:
-        """Get the current location from config."""
-        if self._location is None:
-            self._location = self.config.get_default_location()
+        """Get the current location."""
         return self._location
 
+    def _invalidate_location(self) -> None:
+        """Re-resolve the default location if config.toml changed on disk."""
+        try:
+            if self.config.reload():
+                self._location = self.config.get_default_location()
+        except ConfigError as e:
+            logger.warning(f"Keeping the current location: {e}")
+
     def _on_timer(self, timer: rumps.Timer) -> None:
         """Handle timer tick - runs on main thread."""
         self._do_update()
 
     def _on_refresh(self, sender: rumps.MenuItem) -> None:
         """Handle refresh button click."""
-        if not self._is_updating:
-            self._do_update()
+        if self._is_updating:
+            return
+        # Retrying after a failed update is never throttled
+        if (
+            self._last_error is None
+            and self._last_update_ts is not None
+            and time.monotonic() - self._last_update_ts < MIN_REFRESH_INTERVAL
+        ):
+            return
+        self._do_update()
 
     def _on_open_config(self, _: rumps.MenuItem) -> None:
         """Open the config folder in Finder."""
-        import subprocess
-
-        subprocess.run(["open", str(self.config.config_dir)])
+        NSWorkspace.sharedWorkspace().openURL_(
+            NSURL.fileURLWithPath_(str(self.config.config_dir))
+        )
 
     def _on_quit(self, _: rumps.MenuItem) -> None:
         """Handle quit button click."""
         self._timer.stop()
+        self._poll_timer.stop()
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_services(), self._loop).result(
+                timeout=SHUTDOWN_TIMEOUT
+            )
+        except Exception as e:
+            logger.warning(f"Failed to close services: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
         rumps.quit_application()
 
+    async def _close_services(self) -> None:
+        """Close the services and this loop's shared HTTP client."""
+        await self._seeing_service.close()
+        await close_shared_client()
+
     def _do_update(self) -> None:
-        """Perform the update synchronously (runs on main thread)."""
+        """Start an update on the background loop (called on main thread)."""
         if self._is_updating:
             return
 
+        # Pick up locations changed with the CLI since the last update
+        self._invalidate_location()
         self._is_updating = True
-        # Keep icon, no title change during update
+        # Keep icon, no title change during update; show "Refreshing..."
+        self._update_ui()
 
+        self._pending_update = asyncio.run_coroutine_threadsafe(
+            self._update_conditions(), self._loop
+        )
+        self._poll_timer.start()
+
+    def _on_update_poll(self, timer: rumps.Timer) -> None:
+        """Finish a completed update - runs on main thread."""
+        future = self._pending_update
+        if future is None or not future.done():
+            return
+
+        timer.stop()
+        self._pending_update = None
         try:
-            # Run async code synchronously
-            asyncio.run(self._update_conditions())
+            report, best_nights, best_window, error = future.result()
         except Exception as e:
             logger.error(f"Update failed: {e}")
             self._last_error = str(e)
+        else:
+            self._last_error = error
+            if error is None:
+                self._last_report = report
+                self._best_nights = best_nights
+                self._best_window = best_window
+                self._save_state()
         finally:
             self._is_updating = False
+            self._last_update_ts = time.monotonic()
             self._update_ui()
 
-    async def _update_conditions(self) -> None:
-        """Fetch and update current conditions."""
-        location = self._get_location()
-        if not location:
-            self._last_error = "No location configured"
+    def _load_state(self) -> None:
+        """Restore the data saved by the last successful update, if still relevant."""
+        try:
+            report, best_nights, best_window = _STATE_ADAPTER.validate_json(
+                self._state_path.read_bytes()
+            )
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.debug(f"Ignoring saved widget state: {e}")
             return
 
-        cache = CacheManager(self.config.cache_db_path)
-        seeing_service = SeeingService(
-            cache_manager=cache,
-            cache_ttl_hours=self.config.cache_ttl_hours,
-        )
-        forecast_service = ForecastService(seeing_service)
+        # Data for a location that is no longer the default is not shown
+        if report is None or self._location is None or report.location != self._location:
+            return
+
+        self._last_report = report
+        self._best_nights = best_nights
+        self._best_window = best_window
 
+    def _save_state(self) -> None:
+        """Save the data currently shown, for _load_state on next launch."""
+        state = (self._last_report, self._best_nights, self._best_window)
         try:
-            # Get current conditions
-            report = await seeing_service.get_current_conditions(location)
-            self._last_report = report
-            self._last_error = None
-
-            # Get best nights forecast
-            try:
-                self._best_nights = await forecast_service.get_best_nights(
-                    location, days=7, min_score=50
-                )
-            except Exception as e:
-                logger.warning(f"Failed to get forecast: {e}")
-                self._best_nights = []
-
-            # Get best window tonight
-            try:
-                window = await forecast_service.find_best_window(
-                    location, hours=24, min_score=50, min_duration_hours=2
-                )
-                if window:
-                    self._best_window = (
-                        window.start,
-                        window.end,
-                        window.average_score,
-                    )
-                else:
-                    self._best_window = (None, None, None)
-            except Exception as e:
-                logger.warning(f"Failed to get best window: {e}")
-                self._best_window = (None, None, None)
-
-        except AstroseeError as e:
-            logger.error(f"Failed to update conditions: {e}")
-            self._last_error = str(e)
+            self._state_path.write_bytes(_STATE_ADAPTER.dump_json(state))
+        except OSError as e:
+            logger.warning(f"Failed to save widget state: {e}")
 
-        except Exception as e:
-            logger.error(f"Unexpected error updating conditions: {e}")
-            self._last_error = "Connection error"
+    async def _update_conditions(
+        self,
+    ) -> tuple[
+        SeeingReport | None,
+        list[tuple[datetime, float, str]],
+        tuple[datetime | None, datetime | None, float | None],
+        str | None,
+    ]:
+        """Fetch current conditions - runs on the background loop.
+
+        Widget state is not touched here; _on_update_poll applies the result
+        on the main thread.
+
+        Returns:
+            Tuple of (report, best nights, best window, error message)
+        """
+        no_window = (None, None, None)
+        location = self._get_location()
+        if not location:
+            return None, [], no_window, "No location configured"
+
+        seeing_service = self._seeing_service
+        forecast_service = self._forecast_service
+
+        # Fetch current conditions, upcoming nights and tonight's best
+        # window concurrently so their API round-trips overlap
+        report, best_nights, window = await asyncio.gather(
+            seeing_service.get_current_conditions(location),
+            forecast_service.get_best_nights(location, days=7, min_score=50),
+            forecast_service.find_best_window(
+                location, hours=24, min_score=50, min_duration_hours=2
+            ),
+            return_exceptions=True,
+        )
 
-        finally:
-            await seeing_service.close()
+        # gather() also returns CancelledError, which is not an Exception
+        if isinstance(report, AstroseeError):
+            logger.error(f"Failed to update conditions: {report}")
+            return None, [], no_window, str(report)
+        if isinstance(report, BaseException):
+            logger.error(f"Unexpected error updating conditions: {report!r}")
+            return None, [], no_window, "Connection error"
+
+        if isinstance(best_nights, BaseException):
+            logger.warning(f"Failed to get forecast: {best_nights!r}")
+            best_nights = []
+
+        if isinstance(window, BaseException):
+            logger.warning(f"Failed to get best window: {window!r}")
+            best_window = no_window
+        elif window:
+            best_window = (window.start, window.end, window.average_score)
+        else:
+            best_window = no_window
+
+        return report, best_nights, best_window, None
 
     def _update_ui(self) -> None:
-        """Update the menu bar and rebuild menu."""
-        # Keep using the icon, no title text
-        self.title = None
-        self._build_menu()
+        """Rebuild the menu.
+
+        The menu is left alone when nothing it shows has changed since the
+        last update, which is common between 15-minute refreshes.
+        """
+        # The status item keeps the icon and empty title set in __init__;
+        # neither is reassigned here, so rumps never redraws them
+        today = datetime.now().date()
+        state = (
+            today,  # Date labels in the forecast submenu
+            self._location,
+            self._is_updating,
+            self._last_error,
+            self._last_report,
+            self._best_window,
+            tuple(self._best_nights),
+        )
+        if state == self._menu_state:
+            return
+        self._menu_state = state
+        self._build_menu(today)
 
     def run(self) -> None:
         """Run the widget application."""
@@ -1,5 +1,39 @@
 """Score-to-icon mapping for menu bar widget."""
 
+from bisect import bisect_right
+
+# Bands: a value belongs to band bisect_right(thresholds, value), i.e. each
+# threshold is the inclusive lower bound of the next band.
+_SCORE_THRESHOLDS = (25, 55, 70, 85)
+_SCORE_ICONS = (
+    "\u274C",  # X (Bad)
+    "\U0001F32B\uFE0F",  # Fog (Poor)
+    "\u2601\uFE0F",  # Cloud (Fair)
+    "\U0001F319",  # Crescent Moon (Good)
+    "\u2B50",  # Star (Excellent)
+)
+_SCORE_RATINGS = ("Bad", "Poor", "Fair", "Good", "Excellent")
+
+_CLOUD_THRESHOLDS = (10, 30, 60, 85)
+_CLOUD_ICONS = (
+    "\u2728",  # Sparkles (clear)
+    "\U0001F324\uFE0F",  # Sun behind small cloud
+    "\u26C5",  # Sun behind cloud
+    "\U0001F325\uFE0F",  # Sun behind large cloud
+    "\u2601\uFE0F",  # Cloud
+)
+
+_MOON_THRESHOLDS = (5, 25, 45, 55, 75, 90)
+_MOON_ICONS = (
+    "\U0001F311",  # New moon
+    "\U0001F312",  # Waxing crescent
+    "\U0001F313",  # First quarter
+    "\U0001F314",  # Waxing gibbous
+    "\U0001F315",  # Full moon
+    "\U0001F316",  # Waning gibbous
+    "\U0001F317",  # Last quarter
+)
+
 
 def get_score_icon(score: float) -> str:
     """Get emoji icon based on seeing score.
@@ -10,16 +44,7 @@ def get_score_icon(score: float) -> str:
     Returns:
         Emoji character representing the score quality
     """
-    if score >= 85:
-        return "\u2B50"  # Star (Excellent)
-    elif score >= 70:
-        return "\U0001F319"  # Crescent Moon (Good)
-    elif score >= 55:
-        return "\u2601\uFE0F"  # Cloud (Fair)
-    elif score >= 25:
-        return "\U0001F32B\uFE0F"  # Fog (Poor)
-    else:
-        return "\u274C"  # X (Bad)
+    return _SCORE_ICONS[bisect_right(_SCORE_THRESHOLDS, score)]
 
 
 def get_score_title(score: float) -> str:
@@ -45,16 +70,7 @@ def get_rating_text(score: float) -> str:
     Returns:
         Rating text (Excellent, Good, Fair, Poor, Bad)
     """
-    if score >= 85:
-        return "Excellent"
-    elif score >= 70:
-        return "Good"
-    elif score >= 55:
-        return "Fair"
-    elif score >= 25:
-        return "Poor"
-    else:
-        return "Bad"
+    return _SCORE_RATINGS[bisect_right(_SCORE_THRESHOLDS, score)]
 
 
 def get_activity_icon(activity: str) -> str:
@@ -85,16 +101,7 @@ def get_weather_icon(cloud_cover: float) -> str:
     Returns:
         Weather emoji
     """
-    if cloud_cover < 10:
-        return "\u2728"  # Sparkles (clear)
-    elif cloud_cover < 30:
-        return "\U0001F324\uFE0F"  # Sun behind small cloud
-    elif cloud_cover < 60:
-        return "\u26C5"  # Sun behind cloud
-    elif cloud_cover < 85:
-        return "\U0001F325\uFE0F"  # Sun behind large cloud
-    else:
-        return "\u2601\uFE0F"  # Cloud
+    return _CLOUD_ICONS[bisect_right(_CLOUD_THRESHOLDS, cloud_cover)]
 
 
 def get_moon_icon(illumination: float, altitude: float) -> str:
@@ -110,17 +117,4 @@ def get_moon_icon(illumination: float, altitude: float) -> str:
     if altitude < 0:
         return "\U0001F311"  # New moon (below horizon indicator)
 
-    if illumination < 5:
-        return "\U0001F311"  # New moon
-    elif illumination < 25:
-        return "\U0001F312"  # Waxing crescent
-    elif illumination < 45:
-        return "\U0001F313"  # First quarter
-    elif illumination < 55:
-        return "\U0001F314"  # Waxing gibbous
-    elif illumination < 75:
-        return "\U0001F315"  # Full moon
-    elif illumination < 90:
-        return "\U0001F316"  # Waning gibbous
-    else:
-        return "\U0001F317"  # Last quarter
+    return _MOON_ICONS[bisect_right(_MOON_THRESHOLDS, illumination)]
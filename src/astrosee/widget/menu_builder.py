@@ -1,15 +1,47 @@
 """Menu construction logic for the widget."""
 
-from datetime import datetime
+from collections.abc import Sequence
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Any
 
 from astrosee.scoring.models import SeeingReport
 from astrosee.widget.icons import (
     get_moon_icon,
     get_rating_text,
+    get_score_icon,
     get_weather_icon,
 )
 
+# Same names as strftime("%A") in the default C locale
+_WEEKDAY_NAMES = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+)
+
+# Static menu rows, shared instead of rebuilt on every refresh
+_LOADING_ITEMS = (("\u23F3 Loading...", None),)
+_NO_WINDOW_ITEMS = (("\U0001F4CA No good window tonight", None),)
+_ERROR_HEADER = ("\u26A0\uFE0F Unable to fetch data", None)
+_ERROR_FOOTER = (
+    (None, None),  # Separator
+    ("Click Refresh to retry", None),
+)
+
+# Component scores in display order, as produced by ScoringEngine
+_COMPONENT_NAMES = (
+    ("temperature_differential", "Temp Stability"),
+    ("wind_stability", "Wind"),
+    ("humidity", "Humidity"),
+    ("cloud_cover", "Clouds"),
+    ("jet_stream", "Jet Stream"),
+)
+
+# Prebuilt bars for the default width, indexed by filled cells
+_BAR_WIDTH = 10
+_BARS = tuple(
+    "\u2588" * filled + "\u2591" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1)
+)
+
 
 def build_conditions_menu(report: SeeingReport) -> list[tuple[str, Any]]:
     """Build menu items for current conditions.
@@ -20,33 +52,30 @@ def build_conditions_menu(report: SeeingReport) -> list[tuple[str, Any]]:
     Returns:
         List of (title, callback_or_none) tuples
     """
-    items = []
-
-    # Score header
     score = report.score.total_score
-    rating = get_rating_text(score)
-    items.append((f"\U0001F52D Score: {int(score)}/100 ({rating})", None))
-    items.append((None, None))  # Separator
-
-    # Weather conditions
     weather = report.weather
-    temp_diff = abs(weather.temperature - weather.dew_point)
-    items.append((f"\U0001F321\uFE0F Temp: {weather.temperature:.1f}\u00B0C (diff: {temp_diff:.1f}\u00B0)", None))
-    items.append((f"\U0001F4A8 Wind: {weather.wind_speed_10m:.1f} m/s", None))
-
-    cloud_icon = get_weather_icon(weather.cloud_cover)
-    items.append((f"{cloud_icon} Clouds: {int(weather.cloud_cover)}%", None))
-    items.append((f"\U0001F4A7 Humidity: {int(weather.humidity)}%", None))
-
-    # Moon info
-    moon_icon = get_moon_icon(
-        report.astronomy.moon_illumination,
-        report.astronomy.moon_altitude
-    )
-    moon_status = "below horizon" if report.astronomy.moon_altitude < 0 else f"alt: {report.astronomy.moon_altitude:.0f}\u00B0"
-    items.append((f"{moon_icon} Moon: {int(report.astronomy.moon_illumination)}% ({moon_status})", None))
+    astronomy = report.astronomy
+    temperature = weather.temperature
+    temp_diff = abs(temperature - weather.dew_point)
+    cloud_cover = weather.cloud_cover
+    moon_altitude = astronomy.moon_altitude
+    moon_illumination = astronomy.moon_illumination
 
-    return items
+    moon_icon = get_moon_icon(moon_illumination, moon_altitude)
+    moon_status = "below horizon" if moon_altitude < 0 else f"alt: {moon_altitude:.0f}\u00B0"
+
+    return [
+        # Score header
+        (f"\U0001F52D Score: {int(score)}/100 ({get_rating_text(score)})", None),
+        (None, None),  # Separator
+        # Weather conditions
+        (f"\U0001F321\uFE0F Temp: {temperature:.1f}\u00B0C (diff: {temp_diff:.1f}\u00B0)", None),
+        (f"\U0001F4A8 Wind: {weather.wind_speed_10m:.1f} m/s", None),
+        (f"{get_weather_icon(cloud_cover)} Clouds: {int(cloud_cover)}%", None),
+        (f"\U0001F4A7 Humidity: {int(weather.humidity)}%", None),
+        # Moon info
+        (f"{moon_icon} Moon: {int(moon_illumination)}% ({moon_status})", None),
+    ]
 
 
 def build_component_scores_menu(report: SeeingReport) -> list[tuple[str, Any]]:
@@ -61,54 +90,49 @@ def build_component_scores_menu(report: SeeingReport) -> list[tuple[str, Any]]:
     items = []
     components = report.score.component_scores
 
-    component_names = {
-        "temperature_differential": "Temp Stability",
-        "wind_stability": "Wind",
-        "humidity": "Humidity",
-        "cloud_cover": "Clouds",
-        "jet_stream": "Jet Stream",
-    }
-
-    for key, score in components.items():
-        name = component_names.get(key, key)
-        bar = _score_bar(score, width=10)
-        items.append((f"{name}: {bar} {score:.0f}", None))
+    # A report restored from an older widget state may lack some components
+    for key, name in _COMPONENT_NAMES:
+        score = components.get(key)
+        if score is not None:
+            items.append((f"{name}: {_score_bar(score)} {score:.0f}", None))
 
     return items
 
 
 def build_forecast_menu(
     best_nights: list[tuple[datetime, float, str]],
+    today: date | None = None,
 ) -> list[tuple[str, Any]]:
     """Build menu items for forecast summary.
 
     Args:
         best_nights: List of (date, score, summary) tuples
+        today: Today's date for the labels (default: current date)
 
     Returns:
         List of (title, callback_or_none) tuples
     """
-    items = []
-
     if not best_nights:
-        items.append(("No good nights in forecast", None))
-        return items
+        return [("No good nights in forecast", None)]
 
-    today = datetime.now().date()
+    if today is None:
+        today = datetime.now().date()
 
-    for night_date, score, summary in best_nights[:5]:  # Limit to 5
-        date_label = _date_label(night_date.date(), today)
-        icon = get_score_icon(score)
-        items.append((f"{icon} {date_label}: {int(score)} - {summary}", None))
-
-    return items
+    return [
+        (
+            f"{get_score_icon(score)} {_date_label(night_date.date(), today)}: "
+            f"{int(score)} - {summary}",
+            None,
+        )
+        for night_date, score, summary in best_nights[:5]  # Limit to 5
+    ]
 
 
 def build_best_window_menu(
     window_start: datetime | None,
     window_end: datetime | None,
     window_score: float | None,
-) -> list[tuple[str, Any]]:
+) -> Sequence[tuple[str, Any]]:
     """Build menu items for best observation window.
 
     Args:
@@ -117,19 +141,17 @@ def build_best_window_menu(
         window_score: Average score in window
 
     Returns:
-        List of (title, callback_or_none) tuples
+        Sequence of (title, callback_or_none) tuples
     """
-    items = []
-
-    if window_start and window_end and window_score:
-        start_str = window_start.strftime("%H:%M")
-        end_str = window_end.strftime("%H:%M")
-        items.append((f"\U0001F4CA Tonight's Best: {start_str}-{end_str}", None))
-        items.append((f"   Average score: {int(window_score)}", None))
-    else:
-        items.append(("\U0001F4CA No good window tonight", None))
+    if not (window_start and window_end and window_score):
+        return _NO_WINDOW_ITEMS
 
-    return items
+    start_str = window_start.strftime("%H:%M")
+    end_str = window_end.strftime("%H:%M")
+    return [
+        (f"\U0001F4CA Tonight's Best: {start_str}-{end_str}", None),
+        (f"   Average score: {int(window_score)}", None),
+    ]
 
 
 def build_error_menu(error_message: str) -> list[tuple[str, Any]]:
@@ -141,23 +163,16 @@ def build_error_menu(error_message: str) -> list[tuple[str, Any]]:
     Returns:
         List of (title, callback_or_none) tuples
     """
-    return [
-        ("\u26A0\uFE0F Unable to fetch data", None),
-        (f"   {error_message[:40]}", None),
-        (None, None),  # Separator
-        ("Click Refresh to retry", None),
-    ]
+    return [_ERROR_HEADER, (f"   {error_message[:40]}", None), *_ERROR_FOOTER]
 
 
-def build_loading_menu() -> list[tuple[str, Any]]:
+def build_loading_menu() -> tuple[tuple[str, Any], ...]:
     """Build menu items for loading state.
 
     Returns:
-        List of (title, callback_or_none) tuples
+        Tuple of (title, callback_or_none) tuples (shared, do not modify)
     """
-    return [
-        ("\u23F3 Loading...", None),
-    ]
+    return _LOADING_ITEMS
 
 
 def _score_bar(score: float, width: int = 10) -> str:
@@ -171,10 +186,13 @@ def _score_bar(score: float, width: int = 10) -> str:
         Text progress bar string
     """
     filled = int(score / 100 * width)
+    if width == _BAR_WIDTH and 0 <= filled <= width:
+        return _BARS[filled]
     empty = width - filled
     return "\u2588" * filled + "\u2591" * empty
 
 
+@lru_cache(maxsize=64)
 def _date_label(date: datetime.date, today: datetime.date) -> str:
     """Get human-readable date label.
 
@@ -192,6 +210,6 @@ def _date_label(date: datetime.date, today: datetime.date) -> str:
     elif delta == 1:
         return "Tomorrow"
     elif delta < 7:
-        return date.strftime("%A")
+        return _WEEKDAY_NAMES[date.weekday()]
     else:
         return date.strftime("%b %d")
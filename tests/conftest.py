@@ -4,9 +4,10 @@ from datetime import datetime, timezone
 
 import pytest
 
-from astrosee.astronomy.models import Location, CelestialObject, ObjectType
+from astrosee.astronomy.models import AstronomyData, Location, CelestialObject, ObjectType
 from astrosee.weather.models import WeatherData
-from astrosee.scoring.models import SeeingScore
+from astrosee.scoring.engine import ScoringEngine
+from astrosee.scoring.models import SeeingReport, SeeingScore
 
 
 @pytest.fixture
@@ -98,3 +99,21 @@ def sample_deep_sky() -> CelestialObject:
         description="Bright emission nebula",
         aliases=["NGC 1976", "Great Orion Nebula"],
     )
+
+
+@pytest.fixture
+def sample_report(sample_location: Location, sample_weather: WeatherData) -> SeeingReport:
+    """Seeing report for the sample location and weather."""
+    return SeeingReport(
+        location=sample_location,
+        timestamp=sample_weather.timestamp,
+        weather=sample_weather,
+        astronomy=AstronomyData(
+            moon_illumination=20,
+            moon_altitude=-10,
+            moon_azimuth=90,
+            moon_phase="Waxing Crescent",
+            sun_altitude=-30,
+        ),
+        score=ScoringEngine().calculate_score(sample_weather),
+    )
@@ -0,0 +1,85 @@
+"""Tests for alert conditions."""
+
+import itertools
+
+import pytest
+
+from astrosee.scoring.models import SeeingReport
+from astrosee.services.alerts import _CONDITION_VARIABLES, AlertService, _compile_condition
+
+ALLOWED_CONDITIONS = (
+    "score > 80",
+    "score >= 75 and cloud_cover < 20",
+    "wind_speed < 5 or humidity > 90",
+    "not (moon_illumination > 50 and moon_altitude > 0)",
+    "10 < temperature <= 25",
+    "score == 55.5 or score != 40",
+)
+
+# Values in _CONDITION_VARIABLES order
+SAMPLE_VALUES = (
+    (85.0, 10.0, 3.0, 50.0, 15.0, 20.0, -5.0),
+    (55.5, 40.0, 8.0, 95.0, 30.0, 90.0, 35.0),
+    (40.0, 100.0, 0.0, 0.0, -2.0, 0.0, 0.0),
+)
+
+
+class TestConditionCompiler:
+    """Test compiling alert conditions into predicates."""
+
+    @pytest.mark.parametrize(
+        ("condition", "values"), list(itertools.product(ALLOWED_CONDITIONS, SAMPLE_VALUES))
+    )
+    def test_matches_plain_eval(self, condition: str, values: tuple[float, ...]):
+        """Compiled conditions should give the same result as evaluating them directly."""
+        context = dict(zip(_CONDITION_VARIABLES, values))
+        expected = eval(condition, {"__builtins__": {}}, context)
+
+        assert _compile_condition(condition)(*values) == expected
+
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            "score.real > 1",
+            "abs(score) > 1",
+            "__import__('os')",
+            "score.__class__ is int",
+            "__builtins__ > 1",
+            "(lambda: 1)() > 0",
+            "score > [1][0]",
+            "score if humidity else cloud_cover",
+            "score + 1 > 80",
+            "unknown > 1",
+        ],
+    )
+    def test_rejects_disallowed_syntax(self, condition: str):
+        """Attribute access, calls, dunders and other nodes should be refused."""
+        with pytest.raises(ValueError):
+            _compile_condition(condition)
+
+    def test_rejects_invalid_syntax(self):
+        """Unparsable conditions should raise ValueError."""
+        with pytest.raises(ValueError):
+            _compile_condition("score >")
+
+
+class TestAlertService:
+    """Test evaluating alerts against a report."""
+
+    def test_evaluate_triggers_matching_alerts(self, sample_report: SeeingReport):
+        """Only enabled alerts whose condition holds should trigger."""
+        service = AlertService()
+        service.add_alert("score >= 0", notify=False)
+        service.add_alert("score > 100", notify=False)
+        service.add_alert("score >= 0", enabled=False, notify=False)
+
+        triggered = service.evaluate(sample_report)
+
+        assert [alert["condition"] for alert in triggered] == ["score >= 0"]
+
+    def test_invalid_condition_never_triggers(self, sample_report: SeeingReport):
+        """An alert with a rejected condition should be skipped, not raise."""
+        service = AlertService()
+        service.add_alert("__import__('os').system('true')", notify=False)
+
+        assert service.evaluate(sample_report) == []
@@ -0,0 +1,144 @@
+"""Tests for the SQLite cache."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from astrosee.storage import cache as cache_module
+from astrosee.storage.cache import CacheManager
+from astrosee.weather.models import WeatherData
+
+START = datetime(2026, 1, 10, tzinfo=timezone.utc)
+
+
+def _hours(weather: WeatherData, first: int, count: int, temperature: float) -> list[WeatherData]:
+    """Build consecutive hourly copies of a weather sample."""
+    return [
+        weather.model_copy(
+            update={"timestamp": START + timedelta(hours=first + i), "temperature": temperature}
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+async def cache(tmp_path: Path):
+    """Cache manager on a temporary database."""
+    manager = CacheManager(tmp_path / "cache.db")
+    yield manager
+    await manager.close()
+
+
+class TestWeatherBatch:
+    """Test column-wise day rows written by set_weather_batch."""
+
+    async def test_overlapping_batches_are_merged(
+        self, cache: CacheManager, sample_weather: WeatherData
+    ):
+        """A second batch should keep earlier hours it does not cover."""
+        await cache.set_weather_batch(1.0, 2.0, _hours(sample_weather, 0, 6, 10.0))
+        await cache.set_weather_batch(1.0, 2.0, _hours(sample_weather, 3, 6, 20.0))
+
+        cached = await cache.get_weather_range(
+            1.0, 2.0, START, START + timedelta(hours=8)
+        )
+
+        assert [w.timestamp for w in cached] == [
+            START + timedelta(hours=i) for i in range(9)
+        ]
+        assert [w.temperature for w in cached] == [10.0] * 3 + [20.0] * 6
+
+    async def test_single_hour_lookup(self, cache: CacheManager, sample_weather: WeatherData):
+        """get_weather should find one hour inside a day row."""
+        hours = _hours(sample_weather, 0, 24, 15.0)
+        await cache.set_weather_batch(1.0, 2.0, hours)
+
+        assert await cache.get_weather(1.0, 2.0, START + timedelta(hours=7)) == hours[7]
+        assert await cache.get_weather(1.0, 2.0, START - timedelta(hours=1)) is None
+
+    async def test_merged_hours_keep_their_age(
+        self, cache: CacheManager, sample_weather: WeatherData, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Hours kept from an older batch should expire on their own schedule."""
+        now = time.time()
+        monkeypatch.setattr(cache_module.time, "time", lambda: now - 2 * 3600)
+        await cache.set_weather_batch(1.0, 2.0, _hours(sample_weather, 0, 6, 10.0))
+        monkeypatch.setattr(cache_module.time, "time", lambda: now)
+        await cache.set_weather_batch(1.0, 2.0, _hours(sample_weather, 3, 6, 20.0))
+
+        assert await cache.get_weather(1.0, 2.0, START, ttl_hours=1) is None
+        fresh = await cache.get_weather(1.0, 2.0, START + timedelta(hours=4), ttl_hours=1)
+        assert fresh is not None and fresh.temperature == 20.0
+
+        cached = await cache.get_weather_range(
+            1.0, 2.0, START, START + timedelta(hours=8), ttl_hours=1
+        )
+        assert [w.temperature for w in cached] == [20.0] * 6
+
+
+class TestTransactions:
+    """Test grouping cache writes with transaction()."""
+
+    async def test_failed_block_is_rolled_back(
+        self, cache: CacheManager, sample_weather: WeatherData
+    ):
+        """Writes from a block that raised should not be persisted."""
+        weather = _hours(sample_weather, 0, 1, 10.0)[0]
+
+        with pytest.raises(RuntimeError):
+            async with cache.transaction():
+                await cache.set_weather(1.0, 2.0, weather)
+                raise RuntimeError("boom")
+
+        assert await cache.get_weather(1.0, 2.0, START, ignore_ttl=True) is None
+
+    async def test_concurrent_write_waits_for_block(
+        self, cache: CacheManager, sample_weather: WeatherData
+    ):
+        """Another task's write should neither commit nor join an open block."""
+        first, second = _hours(sample_weather, 0, 2, 10.0)
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def failing_block() -> None:
+            async with cache.transaction():
+                await cache.set_weather(1.0, 2.0, first)
+                entered.set()
+                await release.wait()
+                raise RuntimeError("boom")
+
+        block = asyncio.create_task(failing_block())
+        await entered.wait()
+        writer = asyncio.create_task(cache.set_weather(1.0, 2.0, second))
+        await asyncio.sleep(0.05)
+        assert not writer.done()
+
+        release.set()
+        with pytest.raises(RuntimeError):
+            await block
+        await writer
+
+        assert await cache.get_weather(1.0, 2.0, first.timestamp, ignore_ttl=True) is None
+        assert await cache.get_weather(1.0, 2.0, second.timestamp, ignore_ttl=True) == second
+
+
+class TestCachedWeather:
+    """Test reading weather written by other versions."""
+
+    async def test_unknown_fields_are_ignored(
+        self, cache: CacheManager, sample_weather: WeatherData
+    ):
+        """A cached entry with a field this version lacks should still load."""
+        weather = _hours(sample_weather, 0, 1, 10.0)[0]
+        await cache.set_weather(1.0, 2.0, weather)
+
+        conn = await cache._get_connection()
+        await conn.execute(
+            "UPDATE weather_cache SET data = json_set(data, '$.new_api_field', 1.0)"
+        )
+        await conn.commit()
+
+        assert await cache.get_weather(1.0, 2.0, START, ignore_ttl=True) == weather
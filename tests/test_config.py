@@ -0,0 +1,151 @@
+"""Tests for configuration management."""
+
+import multiprocessing
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from astrosee.storage import config as config_module
+from astrosee.storage.config import ConfigManager
+
+
+class TestLocations:
+    """Test location loading and editing."""
+
+    def test_invalid_location_is_skipped(self, tmp_path: Path):
+        """A malformed location should not break loading the others."""
+        (tmp_path / "config.toml").write_text(
+            'default_location = "home"\n'
+            "[locations.home]\n"
+            "latitude = -29.18\n"
+            "longitude = -49.64\n"
+            "[locations.broken]\n"
+            "longitude = 10.0\n"
+        )
+
+        config = ConfigManager(tmp_path)
+
+        assert list(config.get_all_locations()) == ["home"]
+        assert config.get_default_location().name == "home"
+        assert config.get_location("broken") is None
+
+    def test_invalid_location_can_be_removed(self, tmp_path: Path):
+        """The broken entry should still be removable to repair the config."""
+        (tmp_path / "config.toml").write_text("[locations.broken]\nlongitude = 10.0\n")
+
+        config = ConfigManager(tmp_path)
+
+        assert config.remove_location("broken")
+        assert "broken" not in ConfigManager(tmp_path)._locations_raw
+
+
+class TestWrites:
+    """Test locking and write batching."""
+
+    def test_concurrent_instances_keep_all_writes(self, tmp_path: Path):
+        """Two managers adding locations from different threads should not lose any."""
+        managers = [ConfigManager(tmp_path), ConfigManager(tmp_path)]
+
+        def add_locations(manager: ConfigManager, prefix: str) -> None:
+            for i in range(20):
+                manager.add_location(f"{prefix}{i}", float(i), float(i))
+
+        threads = [
+            threading.Thread(target=add_locations, args=(manager, prefix))
+            for manager, prefix in zip(managers, ("a", "b"))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(ConfigManager(tmp_path).get_all_locations()) == 40
+
+    @pytest.mark.skipif(config_module.fcntl is None, reason="needs fcntl file locks")
+    def test_concurrent_processes_keep_all_writes(self, tmp_path: Path):
+        """Managers in separate processes should not lose each other's writes."""
+        ConfigManager(tmp_path)
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=_add_locations_in_process, args=(tmp_path, prefix))
+            for prefix in ("a", "b", "c")
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert [process.exitcode for process in processes] == [0, 0, 0]
+        assert len(ConfigManager(tmp_path).get_all_locations()) == 30
+
+    def test_stale_instance_keeps_other_writes(self, tmp_path: Path):
+        """A change should apply on top of what another instance wrote since."""
+        first = ConfigManager(tmp_path)
+        second = ConfigManager(tmp_path)
+
+        first.add_location("home", 1.0, 2.0)
+        second.set_setting("units", "imperial")
+
+        reloaded = ConfigManager(tmp_path)
+        assert reloaded.get_location("home") is not None
+        assert reloaded.get_setting("units") == "imperial"
+
+    def test_batch_writes_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Changes inside batch() should be written in a single replace."""
+        config = ConfigManager(tmp_path)
+        writes = _count_writes(monkeypatch)
+
+        with config.batch():
+            config.add_location("home", 1.0, 2.0)
+            config.add_location("cabin", 3.0, 4.0)
+            config.set_setting("units", "imperial")
+            assert writes == []
+
+        assert len(writes) == 1
+        reloaded = ConfigManager(tmp_path)
+        assert set(reloaded.get_all_locations()) == {"home", "cabin"}
+        assert reloaded.get_setting("units") == "imperial"
+
+    def test_unchanged_config_is_not_rewritten(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Saving the config that is already on disk should skip the write."""
+        config = ConfigManager(tmp_path)
+        config.set_setting("units", "imperial")
+        writes = _count_writes(monkeypatch)
+
+        config.set_setting("units", "imperial")
+
+        assert writes == []
+
+    def test_changed_file_is_rewritten(self, tmp_path: Path):
+        """The unchanged-write skip should not apply once another writer changed the file."""
+        first = ConfigManager(tmp_path)
+        first.set_setting("units", "imperial")
+        ConfigManager(tmp_path).set_setting("units", "metric")
+
+        first.set_setting("units", "imperial")
+
+        assert ConfigManager(tmp_path).get_setting("units") == "imperial"
+
+
+def _add_locations_in_process(config_dir: Path, prefix: str) -> None:
+    """Add ten locations from a child process."""
+    config = ConfigManager(config_dir)
+    for i in range(10):
+        config.add_location(f"{prefix}{i}", float(i), float(i))
+
+
+def _count_writes(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record the config files replaced from now on."""
+    writes: list[Path] = []
+    replace = os.replace
+
+    def counting_replace(src, dst) -> None:
+        writes.append(Path(dst))
+        replace(src, dst)
+
+    monkeypatch.setattr(config_module.os, "replace", counting_replace)
+    return writes
@@ -0,0 +1,112 @@
+"""Tests for the menu bar widget icons."""
+
+import pytest
+
+pytest.importorskip("rumps")
+
+from astrosee.widget.icons import (  # noqa: E402
+    get_moon_icon,
+    get_rating_text,
+    get_score_icon,
+    get_weather_icon,
+)
+
+
+def _reference_score_icon(score: float) -> str:
+    """Score icon as the original if/elif chain picked it."""
+    if score >= 85:
+        return "\u2B50"
+    elif score >= 70:
+        return "\U0001F319"
+    elif score >= 55:
+        return "\u2601\uFE0F"
+    elif score >= 25:
+        return "\U0001F32B\uFE0F"
+    else:
+        return "\u274C"
+
+
+def _reference_rating_text(score: float) -> str:
+    """Rating text as the original if/elif chain picked it."""
+    if score >= 85:
+        return "Excellent"
+    elif score >= 70:
+        return "Good"
+    elif score >= 55:
+        return "Fair"
+    elif score >= 25:
+        return "Poor"
+    else:
+        return "Bad"
+
+
+def _reference_weather_icon(cloud_cover: float) -> str:
+    """Weather icon as the original if/elif chain picked it."""
+    if cloud_cover < 10:
+        return "\u2728"
+    elif cloud_cover < 30:
+        return "\U0001F324\uFE0F"
+    elif cloud_cover < 60:
+        return "\u26C5"
+    elif cloud_cover < 85:
+        return "\U0001F325\uFE0F"
+    else:
+        return "\u2601\uFE0F"
+
+
+def _reference_moon_icon(illumination: float, altitude: float) -> str:
+    """Moon icon as the original if/elif chain picked it."""
+    if altitude < 0:
+        return "\U0001F311"
+
+    if illumination < 5:
+        return "\U0001F311"
+    elif illumination < 25:
+        return "\U0001F312"
+    elif illumination < 45:
+        return "\U0001F313"
+    elif illumination < 55:
+        return "\U0001F314"
+    elif illumination < 75:
+        return "\U0001F315"
+    elif illumination < 90:
+        return "\U0001F316"
+    else:
+        return "\U0001F317"
+
+
+# Every threshold, just below it, and the ends of the range
+SCORES = (-1, 0, 24.9, 25, 54.9, 55, 69.9, 70, 84.9, 85, 100)
+PERCENTAGES = (0, 4.9, 5, 9.9, 10, 24.9, 25, 29.9, 30, 44.9, 45, 54.9, 55, 59.9, 60,
+               74.9, 75, 84.9, 85, 89.9, 90, 100)
+
+
+class TestScoreIcons:
+    """Test the score lookup tables."""
+
+    @pytest.mark.parametrize("score", SCORES)
+    def test_score_icon_matches_thresholds(self, score: float):
+        """The score icon should match the original thresholds."""
+        assert get_score_icon(score) == _reference_score_icon(score)
+
+    @pytest.mark.parametrize("score", SCORES)
+    def test_rating_text_matches_thresholds(self, score: float):
+        """The rating text should match the original thresholds."""
+        assert get_rating_text(score) == _reference_rating_text(score)
+
+
+class TestConditionIcons:
+    """Test the weather and moon lookup tables."""
+
+    @pytest.mark.parametrize("cloud_cover", PERCENTAGES)
+    def test_weather_icon_matches_thresholds(self, cloud_cover: float):
+        """The weather icon should match the original thresholds."""
+        assert get_weather_icon(cloud_cover) == _reference_weather_icon(cloud_cover)
+
+    @pytest.mark.parametrize("illumination", PERCENTAGES)
+    @pytest.mark.parametrize("altitude", (-5.0, 0.0, 30.0))
+    def test_moon_icon_matches_thresholds(self, illumination: float, altitude: float):
+        """The moon icon should match the original thresholds."""
+        assert get_moon_icon(illumination, altitude) == _reference_moon_icon(
+            illumination, altitude
+        )
@@ -0,0 +1,27 @@
+"""Tests for the menu bar widget menus."""
+
+import pytest
+
+pytest.importorskip("rumps")
+
+from astrosee.scoring.models import SeeingReport  # noqa: E402
+from astrosee.widget.menu_builder import build_component_scores_menu  # noqa: E402
+
+
+class TestComponentScoresMenu:
+    """Test the component scores submenu."""
+
+    def test_missing_components_are_skipped(self, sample_report: SeeingReport):
+        """A report restored without some components should still build a menu."""
+        components = dict(sample_report.score.component_scores)
+        del components["jet_stream"]
+        report = sample_report.model_copy(
+            update={
+                "score": sample_report.score.model_copy(update={"component_scores": components})
+            }
+        )
+
+        items = build_component_scores_menu(report)
+
+        assert len(items) == len(components)
+        assert not any(title.startswith("Jet Stream") for title, _ in items)
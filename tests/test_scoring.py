@@ -1,5 +1,7 @@
 """Tests for the scoring engine."""
 
+from datetime import datetime, timezone
+
 import pytest
 
 from astrosee.scoring.engine import ScoringEngine
@@ -12,8 +14,35 @@ from astrosee.scoring.components import (
     calculate_moon_penalty,
     calculate_airmass_penalty,
 )
+from astrosee.scoring.models import SeeingScore
 from astrosee.weather.models import WeatherData
 
+BOUNDARY_SCORES = (0, 10, 24.9, 25, 39.99, 40, 54.9, 55, 69.9, 70, 84.99, 85, 99, 100)
+
+
+def _reference_rating(score: float) -> tuple[str, str, str]:
+    """Rating, color and recommendation as the original if/elif chain picked them."""
+    if score >= 85:
+        return (
+            "Excellent",
+            "bright_green",
+            "Outstanding conditions! Perfect for imaging and visual observation.",
+        )
+    elif score >= 70:
+        return "Very Good", "green", "Very good conditions. Excellent for most observations."
+    elif score >= 55:
+        return (
+            "Good",
+            "yellow",
+            "Good conditions. Suitable for planetary and bright deep-sky objects.",
+        )
+    elif score >= 40:
+        return "Fair", "orange1", "Fair conditions. Best for planets and the Moon."
+    elif score >= 25:
+        return "Poor", "red", "Poor conditions. Only bright objects recommended."
+    else:
+        return "Bad", "bright_red", "Not recommended for serious observation tonight."
+
 
 class TestScoringComponents:
     """Test individual scoring components."""
@@ -175,3 +204,50 @@ class TestScoringEngine:
         assert "moon" in targets
         assert "deep_sky" in targets
         assert "imaging" in targets
+
+    def test_batch_scores_match_scalar(
+        self, sample_weather: WeatherData, poor_weather: WeatherData
+    ):
+        """Batch scoring should match per-hour scoring exactly."""
+        engine = ScoringEngine()
+        weathers = [sample_weather, poor_weather]
+        illumination = [10.0, 90.0]
+        altitude = [-10.0, 45.0]
+        airmass = [1.1, 2.5]
+
+        batch = engine.calculate_scores(
+            weathers,
+            moon_illumination=illumination,
+            moon_altitude=altitude,
+            airmass=airmass,
+            is_deep_sky=True,
+        )
+
+        for i, weather in enumerate(weathers):
+            scalar = engine.calculate_score(
+                weather,
+                moon_illumination=illumination[i],
+                moon_altitude=altitude[i],
+                airmass=airmass[i],
+                is_deep_sky=True,
+            )
+            assert batch[i].total_score == scalar.total_score
+            assert batch[i].component_scores == scalar.component_scores
+            assert batch[i].penalties == scalar.penalties
+
+
+class TestSeeingScoreRating:
+    """Test the rating lookups on SeeingScore."""
+
+    @pytest.mark.parametrize("total", BOUNDARY_SCORES)
+    def test_matches_threshold_chain(self, total: float):
+        """Rating, color and recommendation should match the original thresholds."""
+        score = SeeingScore(
+            total_score=total,
+            component_scores={},
+            timestamp=datetime(2026, 1, 10, tzinfo=timezone.utc),
+        )
+
+        assert (score.rating, score.rating_color, score.recommendation) == _reference_rating(
+            total
+        )
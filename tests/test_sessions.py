@@ -0,0 +1,199 @@
+"""Tests for observation session storage."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from astrosee.astronomy.models import Location
+from astrosee.scoring.models import SeeingReport
+from astrosee.services.sessions import Equipment, EquipmentCollection, SessionManager
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> SessionManager:
+    """Session manager on a temporary config directory."""
+    return SessionManager(tmp_path)
+
+
+class TestSessionFiles:
+    """Test reading session files."""
+
+    def test_unknown_fields_are_ignored(
+        self,
+        manager: SessionManager,
+        sample_location: Location,
+        sample_report: SeeingReport,
+    ):
+        """Session files with fields this version lacks should still load."""
+        session = manager.start_session(sample_location, sample_report)
+        manager.log_observation("Jupiter", 4)
+        manager.end_session()
+
+        path = manager.sessions_dir / f"{session.id}.json"
+        data = json.loads(path.read_text())
+        data["location"]["bortle"] = 4
+        data["initial_conditions"]["seeing_arcsec"] = 1.5
+        data["targets_observed"][0]["filter"] = "UHC"
+        path.write_text(json.dumps(data))
+
+        loaded = SessionManager(manager.config_dir).get_session(session.id)
+
+        assert loaded is not None
+        assert loaded.location.name == sample_location.name
+        assert [t.target_name for t in loaded.targets_observed] == ["Jupiter"]
+
+
+class TestSessionLifecycle:
+    """Test session files, their logs and the active session pointer."""
+
+    def test_start_log_reload(
+        self,
+        manager: SessionManager,
+        sample_location: Location,
+        sample_report: SeeingReport,
+    ):
+        """Logged entries should be visible to a fresh manager before the session ends."""
+        session = manager.start_session(sample_location, sample_report)
+        manager.log_observation("Jupiter", 4, notes="Great Red Spot")
+        manager.add_weather_snapshot(80.0, 15.0, 60.0, 10.0, 2.0)
+        manager.add_note("Steady")
+
+        reloaded = SessionManager(manager.config_dir)
+        active = reloaded.get_active_session()
+
+        assert active is not None and active.id == session.id
+        assert [t.target_name for t in active.targets_observed] == ["Jupiter"]
+        assert [w.seeing_score for w in active.weather_log] == [80.0]
+        assert active.notes == "Steady"
+
+    def test_logs_append_without_rewriting_session(
+        self,
+        manager: SessionManager,
+        sample_location: Location,
+        sample_report: SeeingReport,
+    ):
+        """Observations should go to the log until a save compacts them."""
+        session = manager.start_session(sample_location, sample_report)
+        path = manager.sessions_dir / f"{session.id}.json"
+        saved = path.read_bytes()
+
+        manager.log_observation("Saturn", 3)
+        manager.log_observation("Mars", 5)
+
+        assert path.read_bytes() == saved
+        assert len(manager._read_log(manager._obs_path(session.id))) == 2
+
+    def test_end_compacts_logs(
+        self,
+        manager: SessionManager,
+        sample_location: Location,
+        sample_report: SeeingReport,
+    ):
+        """Ending a session should fold its logs into the session file."""
+        session = manager.start_session(sample_location, sample_report)
+        manager.log_observation("Saturn", 3)
+        manager.add_weather_snapshot(70.0, 12.0, 65.0, 5.0, 1.5)
+        manager.end_session()
+
+        assert not manager._obs_path(session.id).exists()
+        assert not manager._weather_path(session.id).exists()
+        assert not list(manager.sessions_dir.glob("*.tmp"))
+
+        data = json.loads((manager.sessions_dir / f"{session.id}.json").read_text())
+        assert [t["target_name"] for t in data["targets_observed"]] == ["Saturn"]
+        assert len(data["weather_log"]) == 1
+        assert data["end_time"] is not None
+
+        ended = SessionManager(manager.config_dir).get_session(session.id)
+        assert not ended.is_active
+        assert ended.target_count == 1
+
+    def test_end_clears_active_pointer(
+        self,
+        manager: SessionManager,
+        sample_location: Location,
+        sample_report: SeeingReport,
+    ):
+        """No session should be active after the active one ends."""
+        manager.start_session(sample_location, sample_report)
+        manager.end_session()
+
+        assert SessionManager(manager.config_dir).get_active_session() is None
+
+    def test_stale_pointer_is_repaired(
+        self,
+        manager: SessionManager,
+        sample_location: Location,
+        sample_report: SeeingReport,
+    ):
+        """A pointer to a missing session should fall back to a scan and be rewritten."""
+        session = manager.start_session(sample_location, sample_report)
+        pointer = manager.config_dir / SessionManager.ACTIVE_SESSION_FILENAME
+        pointer.write_text("1999-01-01T00-00-00")
+
+        active = SessionManager(manager.config_dir).get_active_session()
+
+        assert active is not None and active.id == session.id
+        assert pointer.read_text() == session.id
+
+    def test_missing_pointer_is_rebuilt(
+        self,
+        manager: SessionManager,
+        sample_location: Location,
+        sample_report: SeeingReport,
+    ):
+        """Sessions from before the pointer existed should still be found."""
+        session = manager.start_session(sample_location, sample_report)
+        pointer = manager.config_dir / SessionManager.ACTIVE_SESSION_FILENAME
+        pointer.unlink()
+
+        active = SessionManager(manager.config_dir).get_active_session()
+
+        assert active is not None and active.id == session.id
+        assert pointer.read_text() == session.id
+
+
+def _equipment(equipment_id: str, name: str = "") -> Equipment:
+    """Build an equipment entry."""
+    return Equipment(id=equipment_id, name=name or equipment_id, equipment_type="telescope")
+
+
+class TestEquipmentCollection:
+    """Test equipment lookups by ID."""
+
+    def test_duplicate_ids_return_first(self):
+        """Lookups should return the first entry with an ID."""
+        collection = EquipmentCollection(
+            equipment=[_equipment("scope", "First"), _equipment("scope", "Second")]
+        )
+
+        assert collection.get("scope").name == "First"
+
+    def test_direct_changes_are_found(self):
+        """Changes made to the list directly should not leave lookups stale."""
+        collection = EquipmentCollection(equipment=[_equipment("a"), _equipment("b")])
+        assert collection.get("a") is not None
+
+        collection.equipment.insert(0, _equipment("c"))
+        collection.equipment[1] = _equipment("d")
+
+        assert collection.get("c").id == "c"
+        assert collection.get("d").id == "d"
+        assert collection.get("a") is None
+        assert collection.get("b").id == "b"
+
+    def test_add_replaces_and_remove_drops_all(self):
+        """add should replace an ID and remove should drop every entry with it."""
+        collection = EquipmentCollection(
+            equipment=[_equipment("a"), _equipment("b"), _equipment("b")]
+        )
+
+        collection.add(_equipment("a", "New A"))
+        assert [eq.id for eq in collection.equipment] == ["b", "b", "a"]
+        assert collection.get("a").name == "New A"
+
+        assert collection.remove("b")
+        assert [eq.id for eq in collection.equipment] == ["a"]
+        assert collection.get("b") is None
+        assert not collection.remove("b")
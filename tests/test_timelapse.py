@@ -0,0 +1,172 @@
+"""Tests for timelapse window planning."""
+
+import math
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from astrosee.astronomy.calculator import AstronomyCalculator
+from astrosee.scoring.models import SeeingForecast, SeeingScore
+from astrosee.services.seeing import SeeingService
+from astrosee.services.timelapse import TimelapseService
+from astrosee.weather.models import WeatherData
+
+START = datetime(2026, 1, 10, 18, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> TimelapseService:
+    """Timelapse service that never needs the network."""
+    return TimelapseService(SeeingService(astronomy_calculator=AstronomyCalculator(tmp_path)))
+
+
+def _visibility_data(weather: WeatherData, seed: int) -> list[dict]:
+    """Build a random forecast with gaps, day hours, low altitudes and poor scores."""
+    rng = random.Random(seed)
+    data = []
+    timestamp = START
+    for _ in range(72):
+        timestamp += timedelta(hours=rng.choice((1, 1, 1, 1, 2, 3)))
+        altitude = rng.uniform(0, 80)
+        is_night = rng.random() < 0.8
+        total = rng.uniform(20, 100)
+        forecast = SeeingForecast(
+            timestamp=timestamp,
+            score=SeeingScore(total_score=total, component_scores={}, timestamp=timestamp),
+            weather=weather,
+            moon_illumination=0,
+            moon_altitude=-10,
+            is_night=is_night,
+        )
+        data.append({
+            "forecast": forecast,
+            "altitude": altitude,
+            "azimuth": 180.0,
+            "is_visible": altitude >= 30,
+            "is_night": is_night,
+            "score": total,
+        })
+    return data
+
+
+def _reference_windows(
+    service: TimelapseService,
+    visibility_data: list[dict],
+    min_altitude: float,
+    min_duration_hours: float,
+    min_score: float,
+) -> list[list[dict]]:
+    """Windows as the original entry-by-entry scan found them."""
+    windows = []
+    current_window: list[dict] = []
+
+    for v in visibility_data:
+        f = v["forecast"]
+        is_suitable = (
+            f.is_night
+            and v["altitude"] >= min_altitude
+            and f.score.total_score >= min_score
+        )
+
+        if is_suitable:
+            if not current_window:
+                current_window.append(v)
+            elif f.timestamp - current_window[-1]["forecast"].timestamp <= timedelta(hours=2):
+                current_window.append(v)
+            else:
+                if service._window_duration_hours(current_window) >= min_duration_hours:
+                    windows.append(current_window)
+                current_window = [v]
+        else:
+            if (
+                current_window
+                and service._window_duration_hours(current_window) >= min_duration_hours
+            ):
+                windows.append(current_window)
+            current_window = []
+
+    if current_window and service._window_duration_hours(current_window) >= min_duration_hours:
+        windows.append(current_window)
+
+    return windows
+
+
+class TestFindWindows:
+    """Test splitting a forecast into imaging windows."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("min_duration", (1.0, 2.0, 4.0))
+    def test_matches_entry_scan(
+        self,
+        service: TimelapseService,
+        sample_weather: WeatherData,
+        seed: int,
+        min_duration: float,
+    ):
+        """Windows should match the original scan over the same forecast."""
+        data = _visibility_data(sample_weather, seed)
+
+        windows = service._find_altitude_windows(
+            data, min_altitude=30.0, min_duration_hours=min_duration, min_score=40.0
+        )
+
+        assert windows == _reference_windows(service, data, 30.0, min_duration, 40.0)
+
+    def test_splits_at_long_gaps(self, service: TimelapseService, sample_weather: WeatherData):
+        """A gap of more than two hours should end a window even if both sides qualify."""
+        data = _visibility_data(sample_weather, 0)
+        for v in data:
+            v["is_night"], v["altitude"], v["score"] = True, 60.0, 90.0
+        timestamps = [v["forecast"].timestamp for v in data]
+        gaps = sum(b - a > timedelta(hours=2) for a, b in zip(timestamps, timestamps[1:]))
+
+        windows = service._find_altitude_windows(
+            data, min_altitude=30.0, min_duration_hours=0.0, min_score=40.0
+        )
+
+        assert len(windows) == gaps + 1
+        assert [v for window in windows for v in window] == data
+
+
+class TestAltitudeProfile:
+    """Test the interpolated altitude profile."""
+
+    @staticmethod
+    def _altitude(time: datetime) -> float:
+        """Smooth altitude curve with a sidereal-day period."""
+        hours = (time - START).total_seconds() / 3600
+        return 40 + 35 * math.sin(2 * math.pi * hours / 23.9345)
+
+    def test_matches_computed_profile(self, service: TimelapseService):
+        """Interpolating hourly samples should stay within a degree of the true curve."""
+        times = [START + timedelta(hours=i) for i in range(9)]
+
+        profile = service._calculate_altitude_profile(
+            times, [self._altitude(t) for t in times], interval_minutes=15
+        )
+
+        expected_times = [START + timedelta(minutes=15 * i) for i in range(33)]
+        assert [t for t, _ in profile] == expected_times
+        for t, altitude in profile:
+            assert altitude == pytest.approx(self._altitude(t), abs=1.0)
+
+    def test_keeps_sample_points(self, service: TimelapseService):
+        """Profile points at sample times should be the samples themselves."""
+        times = [START + timedelta(hours=i) for i in range(4)]
+        altitudes = [30.0, 45.0, 52.5, 41.0]
+
+        profile = dict(service._calculate_altitude_profile(times, altitudes, 15))
+
+        assert [profile[t] for t in times] == altitudes
+        assert profile[START + timedelta(minutes=30)] == pytest.approx(37.5)
+
+    def test_fine_samples_are_used_directly(self, service: TimelapseService):
+        """Samples at or below the interval should be returned as they are."""
+        times = [START + timedelta(minutes=10 * i) for i in range(4)]
+        altitudes = [30.0, 31.0, 32.5, 33.0]
+
+        profile = service._calculate_altitude_profile(times, altitudes, 15)
+
+        assert profile == list(zip(times, altitudes))